@@ -0,0 +1,146 @@
+"""YoutubeDownloader Bandwidth Module
+
+One global download budget shared by all active yt-dlp jobs. The budget is
+split among the jobs weighted by priority, so a background batch can never
+take the bandwidth of an interactive trim; a job's own speed limit (the
+per-tab MB/s field) is honored and whatever it leaves unused goes to the
+others. Rates are recomputed whenever a job starts or finishes, or the
+budget changes, and pushed to the running downloads.
+"""
+import itertools
+import logging
+import threading
+
+from constants import BANDWIDTH_MIN_RATE
+
+logger = logging.getLogger(__name__)
+
+
+def allocate_bandwidth(total, jobs, min_rate=BANDWIDTH_MIN_RATE):
+    """Split a bandwidth budget among jobs by priority weight.
+
+    Jobs whose own cap is below their weighted share get their cap, and the
+    remainder is shared among the others again (water-filling).
+
+    Args:
+        total: Budget in bytes/s, or None for unlimited
+        jobs: {job_id: (priority, cap)}; priority is a positive weight, cap is bytes/s or None
+        min_rate: Lowest rate handed out, so no job is starved completely
+
+    Returns:
+        dict: {job_id: rate in bytes/s, or None for unlimited}
+    """
+    if total is None:
+        return {job_id: cap for job_id, (priority, cap) in jobs.items()}
+
+    rates = {}
+    remaining = total
+    open_jobs = dict(jobs)
+    while open_jobs:
+        weight = sum(priority for priority, cap in open_jobs.values())
+        capped = {job_id: cap for job_id, (priority, cap) in open_jobs.items()
+                  if cap is not None and cap <= remaining * priority / weight}
+        if not capped:
+            break
+        for job_id, cap in capped.items():
+            rates[job_id] = cap
+            remaining -= cap
+            del open_jobs[job_id]
+
+    if open_jobs:
+        weight = sum(priority for priority, cap in open_jobs.values())
+        for job_id, (priority, cap) in open_jobs.items():
+            rates[job_id] = max(min_rate, int(remaining * priority / weight))
+    return rates
+
+
+class BandwidthAllocator:
+    """Thread-safe registry of active downloads and their share of the budget.
+
+    Typical use:
+        job = allocator.register(priority, cap)
+        process = start_download(rate_limit=allocator.rate(job))
+        allocator.attach(job, process.set_rate_limit)
+        ...
+        allocator.release(job)
+    """
+
+    def __init__(self, total=None):
+        """
+        Args:
+            total: Budget in bytes/s, or None for unlimited
+        """
+        self.total = total
+        self.jobs = {}  # {job_id: {'priority', 'cap', 'rate', 'apply'}}
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def set_total(self, total):
+        """Change the budget (bytes/s or None) and rebalance the running jobs."""
+        with self.lock:
+            if total == self.total:
+                return
+            self.total = total
+        logger.info(f"Bandwidth budget: {'unlimited' if total is None else f'{total} B/s'}")
+        self._rebalance()
+
+    def register(self, priority, cap=None):
+        """Add a job before it starts and rebalance the others.
+
+        Args:
+            priority: Positive weight (see BANDWIDTH_PRIORITY_* constants)
+            cap: The job's own limit in bytes/s, or None
+
+        Returns:
+            int: Job ID for rate(), attach() and release()
+        """
+        with self.lock:
+            job_id = next(self.ids)
+            self.jobs[job_id] = {'priority': priority, 'cap': cap, 'rate': None, 'apply': None}
+        self._rebalance()
+        return job_id
+
+    def rate(self, job_id):
+        """Return the job's current rate in bytes/s, or None for unlimited."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return job['rate'] if job else None
+
+    def attach(self, job_id, apply):
+        """Set the callable(rate) that pushes new rates into the job's running download.
+
+        A rebalance that happened between register() and attach() is applied right away.
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return
+            job['apply'] = apply
+            rate = job['rate']
+        apply(rate)
+
+    def release(self, job_id):
+        """Remove a finished job and give its share to the others."""
+        with self.lock:
+            if self.jobs.pop(job_id, None) is None:
+                return
+        self._rebalance()
+
+    def _rebalance(self):
+        changed = []
+        with self.lock:
+            rates = allocate_bandwidth(self.total, {job_id: (job['priority'], job['cap'])
+                                                    for job_id, job in self.jobs.items()})
+            for job_id, rate in rates.items():
+                job = self.jobs[job_id]
+                if rate != job['rate']:
+                    job['rate'] = rate
+                    if job['apply'] is not None:
+                        changed.append((job_id, job['apply'], rate))
+
+        # Apply outside the lock: a subprocess backend restarts yt-dlp to change its rate
+        for job_id, apply, rate in changed:
+            try:
+                apply(rate)
+            except Exception as e:
+                logger.warning(f"Could not apply rate {rate} to download {job_id}: {e}")
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""YoutubeDownloader Benchmark Suite
+
+Measures the local processing paths (trim, fast cut, audio extraction, volume
+change, rescale) on synthetic media generated with ffmpeg's lavfi sources
+(testsrc2 video plus a sine tone), using the same command builders as the app.
+Wall time, CPU time, frames per second and output size are reported as JSON.
+
+Usage:
+    python benchmark.py --output bench.json
+    python benchmark.py --resolutions 1280x720 --durations 60 --presets faster,veryfast
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# resource (CPU time of child processes) is not available on Windows
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+from ffmpeg_tools import (
+    build_local_audio_command, build_local_video_command, build_fast_cut_command, LOCAL_ENCODE_PRESET,
+)
+
+DEFAULT_RESOLUTIONS = ('640x360', '1280x720', '1920x1080')
+DEFAULT_DURATIONS = (10, 60)
+BENCHMARK_MODES = ('trim', 'fast_cut', 'audio', 'volume', 'rescale')
+BENCHMARK_VOLUME = 1.5
+
+# Synthetic inputs get a fixed GOP, so keyframe positions are known without probing
+SYNTHETIC_FRAME_RATE = 30
+SYNTHETIC_GOP_SECONDS = 2
+
+
+def build_synthetic_input_command(ffmpeg_path, output_path, width, height, duration,
+                                  frame_rate=SYNTHETIC_FRAME_RATE, gop_seconds=SYNTHETIC_GOP_SECONDS):
+    """Build a command generating an H.264/AAC MP4 from lavfi test sources.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        output_path: MP4 file to write
+        width: Frame width
+        height: Frame height
+        duration: Length in seconds
+        frame_rate: Frames per second
+        gop_seconds: Fixed keyframe interval in seconds
+
+    Returns:
+        list: ffmpeg command
+    """
+    gop = str(frame_rate * gop_seconds)
+    return [
+        ffmpeg_path, '-nostdin', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', f'testsrc2=size={width}x{height}:rate={frame_rate}:duration={duration}',
+        '-f', 'lavfi', '-i', f'sine=frequency=440:sample_rate=48000:duration={duration}',
+        '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p',
+        '-g', gop, '-keyint_min', gop, '-sc_threshold', '0',
+        '-c:a', 'aac', '-b:a', '128k',
+        '-shortest', '-y', output_path,
+    ]
+
+
+def build_benchmark_commands(ffmpeg_path, source, work_dir, height, duration, presets,
+                             modes=BENCHMARK_MODES, gop_seconds=SYNTHETIC_GOP_SECONDS):
+    """Build the app's commands for every mode (and preset, where it applies) on one input.
+
+    Trims cover the middle half of the input and start between keyframes;
+    the fast cut starts at the keyframe before, as the app would snap it.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        source: Synthetic input file
+        work_dir: Directory for the outputs
+        height: Input height
+        duration: Input length in seconds
+        presets: libx264 presets to compare for the re-encoding modes
+        modes: Modes to include (see BENCHMARK_MODES)
+        gop_seconds: Keyframe interval of the input
+
+    Returns:
+        list: Dicts with mode, preset, processed_seconds, output and cmd
+    """
+    trim_start = duration / 4 + gop_seconds / 2
+    trim_end = duration * 3 / 4
+    keyframe_start = trim_start - trim_start % gop_seconds
+    rescale_height = height // 2
+
+    def output(name):
+        return os.path.join(work_dir, name)
+
+    runs = []
+    for preset in presets:
+        if 'trim' in modes:
+            path = output(f'trim_{preset}.mp4')
+            runs.append({'mode': 'trim', 'preset': preset, 'processed_seconds': trim_end - trim_start, 'output': path,
+                         'cmd': build_local_video_command(ffmpeg_path, source, path, height, start=trim_start,
+                                                          end=trim_end, preset=preset)})
+        if 'rescale' in modes:
+            path = output(f'rescale_{preset}.mp4')
+            runs.append({'mode': 'rescale', 'preset': preset, 'processed_seconds': duration, 'output': path,
+                         'cmd': build_local_video_command(ffmpeg_path, source, path, rescale_height, preset=preset)})
+    if 'fast_cut' in modes:
+        path = output('fast_cut.mp4')
+        runs.append({'mode': 'fast_cut', 'preset': None, 'processed_seconds': trim_end - keyframe_start, 'output': path,
+                     'cmd': build_fast_cut_command(ffmpeg_path, source, keyframe_start, trim_end, path)})
+    if 'audio' in modes:
+        path = output('audio.mp3')
+        runs.append({'mode': 'audio', 'preset': None, 'processed_seconds': duration, 'output': path,
+                     'cmd': build_local_audio_command(ffmpeg_path, source, path)})
+    if 'volume' in modes:
+        path = output('volume.mp4')
+        runs.append({'mode': 'volume', 'preset': None, 'processed_seconds': duration, 'output': path,
+                     'cmd': build_local_video_command(ffmpeg_path, source, path, height, volume=BENCHMARK_VOLUME,
+                                                      copy_video=True)})
+    return runs
+
+
+def children_cpu_time():
+    """Return user + system CPU seconds of waited-for child processes, or None if unknown."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_timed(cmd):
+    """Run cmd to completion.
+
+    Returns:
+        tuple: (returncode, wall seconds, CPU seconds or None, stderr text)
+    """
+    cpu_before = children_cpu_time()
+    started = time.perf_counter()
+    result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True)
+    wall = time.perf_counter() - started
+    cpu_after = children_cpu_time()
+    cpu = None if cpu_before is None else cpu_after - cpu_before
+    return result.returncode, wall, cpu, result.stderr
+
+
+def ffmpeg_version(ffmpeg_path):
+    """Return the first line of `ffmpeg -version`, or None."""
+    try:
+        result = subprocess.run([ffmpeg_path, '-version'], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.splitlines()[0] if result.stdout else None
+
+
+def run_benchmarks(ffmpeg_path, resolutions, durations, presets, modes, work_dir, log=print):
+    """Generate each synthetic input and time every mode on it.
+
+    Returns:
+        dict: JSON-serializable report with environment and per-run results
+    """
+    results = []
+    for resolution in resolutions:
+        width, height = (int(value) for value in resolution.lower().split('x'))
+        for duration in durations:
+            source = os.path.join(work_dir, f'input_{resolution}_{duration}s.mp4')
+            returncode, wall, _, stderr = run_timed(
+                build_synthetic_input_command(ffmpeg_path, source, width, height, duration))
+            if returncode != 0:
+                log(f"Skipping {resolution} {duration}s: input generation failed: {stderr.strip()[:200]}")
+                continue
+            input_bytes = os.path.getsize(source)
+            log(f"Input {resolution} {duration}s ready ({input_bytes} bytes, {wall:.2f}s)")
+
+            for run in build_benchmark_commands(ffmpeg_path, source, work_dir, height, duration, presets, modes):
+                returncode, wall, cpu, stderr = run_timed(run['cmd'])
+                ok = returncode == 0 and os.path.exists(run['output'])
+                frames = run['processed_seconds'] * SYNTHETIC_FRAME_RATE
+                record = {
+                    'resolution': resolution,
+                    'duration': duration,
+                    'mode': run['mode'],
+                    'preset': run['preset'],
+                    'ok': ok,
+                    'wall_time_s': round(wall, 3),
+                    'cpu_time_s': None if cpu is None else round(cpu, 3),
+                    'fps': round(frames / wall, 1) if ok and wall > 0 else None,
+                    'realtime_factor': round(run['processed_seconds'] / wall, 2) if ok and wall > 0 else None,
+                    'input_bytes': input_bytes,
+                    'output_bytes': os.path.getsize(run['output']) if ok else None,
+                    'command': ' '.join(run['cmd']),
+                }
+                if not ok:
+                    record['error'] = stderr.strip()[-500:]
+                results.append(record)
+                log(f"  {run['mode']:<9} {run['preset'] or '-':<10} "
+                    f"{'ok' if ok else 'FAILED':<6} wall {wall:7.2f}s  fps {record['fps'] or '-'}")
+                if ok:
+                    os.remove(run['output'])
+            os.remove(source)
+
+    return {
+        'environment': {
+            'ffmpeg': ffmpeg_version(ffmpeg_path),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def parse_list(value):
+    """Split a comma-separated command line value."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the local processing paths on synthetic media.")
+    parser.add_argument('--ffmpeg', default=shutil.which('ffmpeg') or 'ffmpeg', help="ffmpeg executable")
+    parser.add_argument('--resolutions', default=','.join(DEFAULT_RESOLUTIONS), help="e.g. 640x360,1920x1080")
+    parser.add_argument('--durations', default=','.join(str(d) for d in DEFAULT_DURATIONS), help="Seconds, e.g. 10,60")
+    parser.add_argument('--presets', default=LOCAL_ENCODE_PRESET, help="libx264 presets, e.g. faster,veryfast")
+    parser.add_argument('--modes', default=','.join(BENCHMARK_MODES), help="Subset of " + ','.join(BENCHMARK_MODES))
+    parser.add_argument('--output', help="JSON report file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    modes = parse_list(args.modes)
+    unknown = set(modes) - set(BENCHMARK_MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+    if ffmpeg_version(args.ffmpeg) is None:
+        print(f"ffmpeg not found: {args.ffmpeg}", file=sys.stderr)
+        return 1
+
+    work_dir = tempfile.mkdtemp(prefix="ytdl_bench_")
+    try:
+        report = run_benchmarks(args.ffmpeg, parse_list(args.resolutions),
+                                [float(d) if '.' in d else int(d) for d in parse_list(args.durations)],
+                                parse_list(args.presets), modes, work_dir,
+                                log=lambda message: print(message, file=sys.stderr))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0 if all(record['ok'] for record in report['results']) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
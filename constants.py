@@ -9,10 +9,21 @@ from pathlib import Path
 PREVIEW_WIDTH = 240
 PREVIEW_HEIGHT = 135
 SLIDER_LENGTH = 400
+PREVIEW_STREAM_FORMAT = 'best[height<=480]/best'  # Combined format avoids segmented streams
+PREVIEW_SIZE_KEY = f"{PREVIEW_WIDTH}x{PREVIEW_HEIGHT}"  # Preview cache key part
+
+# Filmstrip (thumbnail sprite sheet for instant scrubbing previews)
+FILMSTRIP_MAX_TILES = 200
+FILMSTRIP_MIN_INTERVAL = 2  # Seconds between tiles for short videos
+FILMSTRIP_COLUMNS = 10
+FILMSTRIP_TILE_WIDTH = 160
+FILMSTRIP_TILE_HEIGHT = 90
+FILMSTRIP_TIMEOUT = 300  # Seconds for the single ffmpeg pass
 
 # Timing constants (milliseconds)
 PREVIEW_DEBOUNCE_MS = 500
 UI_UPDATE_DELAY_MS = 100
+UI_EVENT_INTERVAL_MS = 80  # Tick of the UI event bus drain (12.5 Hz)
 UI_INITIAL_DELAY_MS = 100
 AUTO_UPLOAD_DELAY_MS = 500
 CLIPBOARD_POLL_INTERVAL_MS = 500
@@ -26,14 +37,23 @@ TIMEOUT_CHECK_INTERVAL = 10
 CLIPBOARD_TIMEOUT = 0.5
 METADATA_FETCH_TIMEOUT = 30
 STREAM_FETCH_TIMEOUT = 15
+PLAYLIST_FETCH_TIMEOUT = 120  # Flat listing of a large playlist
+PLAYLIST_MAX_REDIRECTS = 5  # url results followed to reach the playlist of a lazy listing
 FFPROBE_TIMEOUT = 10
+KEYFRAME_PROBE_TIMEOUT = 120  # Packet scan of a long local file
 DEPENDENCY_CHECK_TIMEOUT = 5
 SHUTDOWN_GRACE_PERIOD_SEC = 0.5
 
 # Cache and threading
-PREVIEW_CACHE_SIZE = 20
+PREVIEW_CACHE_SIZE = 300  # Decoded preview frames kept in memory (see also PREVIEW_MEMORY_CACHE_BYTES)
 MAX_WORKER_THREADS = 3
 MAX_RETRY_ATTEMPTS = 3
+PREFETCH_MAX_WORKERS = 2  # Concurrent metadata prefetches for clipboard URLs
+PREFETCH_MAX_PENDING = 20  # Queued + running prefetches; more are skipped
+CLIPBOARD_DEFAULT_WORKERS = 2  # Parallel clipboard downloads (user setting)
+CLIPBOARD_MAX_WORKERS = 8
+CLIPBOARD_SLOT_POLL_INTERVAL = 0.5  # Seconds between stop checks while waiting for a free clipboard slot
+PLAYLIST_WORKERS = 3  # Parallel entry downloads of one playlist (Trimmer or clipboard)
 RETRY_DELAY = 2
 
 # Video/Audio encoding settings
@@ -44,6 +64,15 @@ CHUNK_SIZE = '10M'
 CONCURRENT_FRAGMENTS = '5'
 PROGRESS_COMPLETE = 100
 
+# Fast cut (stream copy): slider values are whole seconds, keyframes are not
+KEYFRAME_SNAP_TOLERANCE = 0.1
+STREAM_COPY_PROGRESS_WEIGHT = 0.05  # Progress weight of stream-copied/joined seconds relative to re-encoded ones
+
+# Segment-parallel encoding of local files (one ffmpeg process per segment)
+PARALLEL_ENCODE_MIN_SEGMENT = 30  # Seconds; shorter ranges are encoded by a single process
+PARALLEL_ENCODE_THREADS = 2  # Encoder threads per segment process
+PARALLEL_ENCODE_SEGMENTS_PER_WORKER = 2  # Extra segments even out uneven keyframe spacing
+
 # Validation limits
 MAX_VOLUME = 2.0
 MIN_VOLUME = 0.0
@@ -52,6 +81,8 @@ BYTES_PER_MB = 1024 * 1024
 CATBOX_MAX_SIZE_MB = 200
 MAX_FILENAME_LENGTH = 200
 DEFAULT_VIDEO_QUALITY = "480"
+VIDEO_QUALITIES = ("1440", "1080", "720", "480", "360", "240")  # Heights offered in quality dropdowns
+AUDIO_ONLY_QUALITY = "none"
 
 # UI element sizes
 CLIPBOARD_URL_LIST_HEIGHT = 12
@@ -69,6 +100,34 @@ UPLOAD_HISTORY_FILE = APP_DATA_DIR / "upload_history.txt"
 CLIPBOARD_URLS_FILE = APP_DATA_DIR / "clipboard_urls.json"
 CONFIG_FILE = APP_DATA_DIR / "config.json"
 LOG_FILE = APP_DATA_DIR / "youtubedownloader.log"
+METADATA_CACHE_FILE = APP_DATA_DIR / "metadata_cache.db"
+PREVIEW_CACHE_FILE = APP_DATA_DIR / "preview_cache.db"
+JOB_JOURNAL_FILE = APP_DATA_DIR / "job_journal.db"
+DOWNLOAD_ARCHIVE_FILE = APP_DATA_DIR / "download_archive.db"
+PLAYLIST_SYNC_FILE = APP_DATA_DIR / "playlist_sync.db"
+
+# Metadata cache (stream URLs in cached info expire after ~6 hours on YouTube)
+METADATA_CACHE_TTL = 3 * 3600  # 3 hours
+METADATA_CACHE_MAX_ENTRIES = 500
+METADATA_CACHE_MAX_BYTES = 100 * BYTES_PER_MB
+
+# Preview frame cache (memory tier of decoded images, disk tier of JPEG bytes)
+PREVIEW_MEMORY_CACHE_BYTES = 32 * BYTES_PER_MB
+PREVIEW_DISK_CACHE_BYTES = 200 * BYTES_PER_MB
+
+# Resolved stream URL cache (googlevideo URLs carry an expire= timestamp)
+STREAM_URL_CACHE_SIZE = 50
+STREAM_URL_DEFAULT_TTL = 30 * 60  # Used when a URL has no expire= parameter
+STREAM_URL_EXPIRY_MARGIN = 5 * 60  # Treat URLs as expired this long before expire=
+
+# Global bandwidth budget shared by all active downloads (weights for the split)
+BANDWIDTH_PRIORITY_INTERACTIVE = 4  # Trimmer downloads
+BANDWIDTH_PRIORITY_BACKGROUND = 1  # Playlists and clipboard batch/auto-downloads
+BANDWIDTH_MIN_RATE = 64 * 1024  # Bytes/s, no job is throttled below this
+BANDWIDTH_RESTART_MIN_CHANGE = 0.25  # Subprocess backend: restart yt-dlp only for a >25% rate change
+
+# Job journal (interrupted downloads are resumed at startup)
+JOB_JOURNAL_PROGRESS_INTERVAL = 2  # Seconds between bytes-done writes per job
 
 # Default language
 DEFAULT_LANGUAGE = 'en'
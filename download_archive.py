@@ -0,0 +1,209 @@
+"""YoutubeDownloader Download Archive Module
+
+Index of completed downloads keyed by canonical video ID, quality and trim
+range, shared by the Trimmer, Clipboard and playlist paths. All keys are
+kept in memory for O(1) lookups before any network call, and persisted in
+SQLite under APP_DATA_DIR. Entries recorded with their output file count as
+unknown again once that file is deleted or moved, so they can be re-downloaded.
+
+Playlist downloads hand yt-dlp a `--download-archive` file written from this
+index (so known entries are skipped without being extracted) and import the
+IDs yt-dlp appended to it afterwards.
+"""
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from constants import DOWNLOAD_ARCHIVE_FILE, AUDIO_ONLY_QUALITY
+
+logger = logging.getLogger(__name__)
+
+# yt-dlp --download-archive lines: "<extractor> <video id>"
+YTDLP_ARCHIVE_LINE = re.compile(r'^youtube\s+(\S+)\s*$', re.IGNORECASE)
+
+# Quality and trim range as found in the app's yt-dlp commands (for resumed jobs)
+COMMAND_HEIGHT_REGEX = re.compile(r'height<=(\d+)')
+COMMAND_SECTION_REGEX = re.compile(r'^\*(\d+):(\d{2}):(\d{2})-(\d+):(\d{2}):(\d{2})$')
+
+
+def archive_key(video_id, quality, start=None, end=None):
+    """Build the index key of a download.
+
+    Args:
+        video_id: Canonical YouTube video ID
+        quality: Height string (e.g. "1080") or AUDIO_ONLY_QUALITY for audio
+        start: Trim start in seconds, or None for the whole video
+        end: Trim end in seconds, or None for the whole video
+
+    Returns:
+        tuple: (video_id, quality, trim) with trim "" or "start-end"
+    """
+    trim = '' if start is None or end is None else f"{float(start):g}-{float(end):g}"
+    return (video_id, str(quality), trim)
+
+
+def quality_from_command(cmd):
+    """Return the quality of one of the app's yt-dlp commands (height or AUDIO_ONLY_QUALITY), or None."""
+    if '--extract-audio' in cmd:
+        return AUDIO_ONLY_QUALITY
+    match = COMMAND_HEIGHT_REGEX.search(cmd[cmd.index('-f') + 1]) if '-f' in cmd else None
+    return match.group(1) if match else None
+
+
+def key_from_command(video_id, cmd):
+    """Recover the index key of one of the app's yt-dlp commands, or None.
+
+    Used for journaled jobs resumed in a later session, whose quality and
+    trim settings only survive in the command.
+    """
+    quality = quality_from_command(cmd)
+    if not video_id or quality is None:
+        return None
+
+    start = end = None
+    if '--download-sections' in cmd:
+        section = COMMAND_SECTION_REGEX.match(cmd[cmd.index('--download-sections') + 1])
+        if not section:
+            return None
+        h1, m1, s1, h2, m2, s2 = (int(value) for value in section.groups())
+        start, end = h1 * 3600 + m1 * 60 + s1, h2 * 3600 + m2 * 60 + s2
+    return archive_key(video_id, quality, start, end)
+
+
+class DownloadArchive:
+    """Thread-safe record of completed downloads.
+
+    Like the caches, database errors are logged and never raised; without a
+    database the index still works for the current session.
+    """
+
+    def __init__(self, db_path=DOWNLOAD_ARCHIVE_FILE):
+        self.db_path = str(db_path)
+        self.keys = set()
+        self.paths = {}  # {key: output file}, for entries recorded with one
+        self.lock = threading.Lock()
+        self.conn = None
+
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS downloads ('
+                'video_id TEXT NOT NULL, '
+                'quality TEXT NOT NULL, '
+                'trim TEXT NOT NULL, '
+                'output_path TEXT, '
+                'completed_at REAL NOT NULL, '
+                'PRIMARY KEY (video_id, quality, trim))'
+            )
+            self.conn.commit()
+            for video_id, quality, trim, output_path in self.conn.execute(
+                    'SELECT video_id, quality, trim, output_path FROM downloads'):
+                key = (video_id, quality, trim)
+                self.keys.add(key)
+                if output_path:
+                    self.paths[key] = output_path
+            logger.info(f"Download archive: {len(self.keys)} entries")
+        except sqlite3.Error as e:
+            logger.error(f"Download archive unavailable ({self.db_path}): {e}")
+            self.conn = None
+
+    def __len__(self):
+        with self.lock:
+            return len(self.keys)
+
+    def contains(self, key):
+        """Return True if the download with this archive_key() has completed before.
+
+        A download whose recorded output file no longer exists is forgotten
+        and reported as unknown.
+        """
+        if key is None or not key[0]:
+            return False
+        with self.lock:
+            if key not in self.keys:
+                return False
+            output_path = self.paths.get(key)
+        if output_path and not os.path.exists(output_path):
+            logger.info(f"Archived download {key} is gone ({output_path}), allowing it again")
+            self.forget(key)
+            return False
+        return True
+
+    def add(self, key, output_path=None):
+        """Record a completed download."""
+        if key is None or not key[0]:
+            return
+        try:
+            with self.lock:
+                self.keys.add(key)
+                if output_path:
+                    self.paths[key] = output_path
+                else:
+                    self.paths.pop(key, None)
+                if self.conn is not None:
+                    self.conn.execute(
+                        'INSERT OR REPLACE INTO downloads (video_id, quality, trim, output_path, completed_at) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        key + (output_path, time.time())
+                    )
+                    self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Download archive write failed for {key}: {e}")
+
+    def forget(self, key):
+        """Remove a download, so it is fetched again."""
+        try:
+            with self.lock:
+                self.keys.discard(key)
+                self.paths.pop(key, None)
+                if self.conn is not None:
+                    self.conn.execute('DELETE FROM downloads WHERE video_id = ? AND quality = ? AND trim = ?', key)
+                    self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Download archive delete failed for {key}: {e}")
+
+    def write_ytdlp_archive(self, path, quality):
+        """Write the untrimmed downloads of a quality as a yt-dlp --download-archive file.
+
+        Returns:
+            int: Number of IDs written
+        """
+        with self.lock:
+            video_ids = sorted(video_id for video_id, key_quality, trim in self.keys
+                               if key_quality == str(quality) and not trim)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(f"youtube {video_id}\n" for video_id in video_ids)
+        return len(video_ids)
+
+    def import_ytdlp_archive(self, path, quality):
+        """Record the IDs yt-dlp appended to a --download-archive file as untrimmed downloads.
+
+        Returns:
+            int: Number of new entries
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError as e:
+            logger.warning(f"Could not read yt-dlp archive {path}: {e}")
+            return 0
+
+        added = 0
+        for line in lines:
+            match = YTDLP_ARCHIVE_LINE.match(line)
+            if match:
+                key = archive_key(match.group(1), quality)
+                if not self.contains(key):
+                    self.add(key)
+                    added += 1
+        return added
+
+    def close(self):
+        """Close the database; the in-memory index stays usable."""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import io
 import os
 import sys
 import subprocess
@@ -17,21 +18,25 @@ from urllib.parse import urlparse, parse_qs
 import shutil
 import signal
 import glob
-from collections import OrderedDict
 from catboxpy.catbox import CatboxClient
 
 # Import from modular components
 from constants import (
-    PREVIEW_WIDTH, PREVIEW_HEIGHT, SLIDER_LENGTH, PREVIEW_DEBOUNCE_MS,
+    PREVIEW_WIDTH, PREVIEW_HEIGHT, SLIDER_LENGTH, PREVIEW_DEBOUNCE_MS, PREVIEW_STREAM_FORMAT,
+    FILMSTRIP_TIMEOUT, PREVIEW_SIZE_KEY,
     PROCESS_TERMINATE_TIMEOUT, TEMP_DIR_MAX_AGE, DOWNLOAD_TIMEOUT,
-    DOWNLOAD_PROGRESS_TIMEOUT, PREVIEW_CACHE_SIZE, MAX_WORKER_THREADS,
+    DOWNLOAD_PROGRESS_TIMEOUT, MAX_WORKER_THREADS,
     MAX_RETRY_ATTEMPTS, RETRY_DELAY, CLIPBOARD_POLL_INTERVAL_MS,
     VIDEO_CRF, AUDIO_BITRATE, BUFFER_SIZE, CHUNK_SIZE, CONCURRENT_FRAGMENTS,
-    UI_UPDATE_DELAY_MS, PROGRESS_COMPLETE, CLIPBOARD_TIMEOUT,
-    METADATA_FETCH_TIMEOUT, STREAM_FETCH_TIMEOUT, FFPROBE_TIMEOUT,
+    UI_UPDATE_DELAY_MS, UI_EVENT_INTERVAL_MS, PROGRESS_COMPLETE, CLIPBOARD_TIMEOUT,
+    METADATA_FETCH_TIMEOUT, STREAM_FETCH_TIMEOUT, FFPROBE_TIMEOUT, KEYFRAME_PROBE_TIMEOUT,
+    STREAM_COPY_PROGRESS_WEIGHT, PARALLEL_ENCODE_THREADS, PARALLEL_ENCODE_SEGMENTS_PER_WORKER,
     DEPENDENCY_CHECK_TIMEOUT, TIMEOUT_CHECK_INTERVAL, MAX_VOLUME, MIN_VOLUME,
     MAX_VIDEO_DURATION, BYTES_PER_MB, CATBOX_MAX_SIZE_MB, MAX_FILENAME_LENGTH,
-    DEFAULT_VIDEO_QUALITY, CLIPBOARD_URL_LIST_HEIGHT, UI_INITIAL_DELAY_MS,
+    DEFAULT_VIDEO_QUALITY, VIDEO_QUALITIES, AUDIO_ONLY_QUALITY,
+    CLIPBOARD_DEFAULT_WORKERS, CLIPBOARD_MAX_WORKERS, CLIPBOARD_SLOT_POLL_INTERVAL, PLAYLIST_WORKERS,
+    BANDWIDTH_PRIORITY_INTERACTIVE, BANDWIDTH_PRIORITY_BACKGROUND,
+    CLIPBOARD_URL_LIST_HEIGHT, UI_INITIAL_DELAY_MS,
     AUTO_UPLOAD_DELAY_MS, SHUTDOWN_GRACE_PERIOD_SEC, APP_VERSION, GITHUB_REPO,
     GITHUB_RELEASES_URL, GITHUB_API_LATEST, GITHUB_RAW_URL, APP_DATA_DIR,
     UPLOAD_HISTORY_FILE, CLIPBOARD_URLS_FILE, CONFIG_FILE, LOG_FILE,
@@ -40,6 +45,29 @@ from translations import (
     TRANSLATIONS, tr, set_language, get_language,
 )
 import translations
+from video_info import VideoInfo, extract_video_id
+from metadata_cache import MetadataCache, StreamUrlCache
+from metadata_prefetch import MetadataPrefetcher
+from filmstrip import Filmstrip
+from ffmpeg_tools import (
+    build_preview_frame_command, build_keyframe_probe_command, parse_keyframe_times,
+    snap_to_keyframe, is_keyframe_aligned, build_fast_cut_command,
+    build_video_stream_probe_command, parse_video_stream, plan_smart_cut, SMART_CUT_ENCODERS,
+    build_segment_command, build_concat_list, build_concat_parts_command,
+    build_postprocessor_args, MP4_COPY_CODECS, plan_parallel_segments,
+    build_local_audio_command, build_local_video_command,
+)
+from preview_cache import PreviewCache
+from ytdlp_engine import YtDlpEngine, YtDlpError
+from bandwidth import BandwidthAllocator
+from job_journal import JobJournal, resume_command
+from download_archive import DownloadArchive, archive_key, key_from_command, quality_from_command
+from playlist_engine import (
+    PlaylistRunner, parse_flat_playlist, select_new_entries,
+    ENTRY_COMPLETED, ENTRY_FAILED, ENTRY_SKIPPED, ENTRY_FINISHED_STATES,
+)
+from playlist_sync import PlaylistSyncStore, playlist_key
+from ui_events import UIEventBus
 
 # Try to import dbus for KDE Klipper integration
 try:
@@ -78,10 +106,11 @@ logger = logging.getLogger(__name__)
 # REMOVED: CURRENT_LANGUAGE moved to translations.py
 # REMOVED: tr() function moved to translations.py
 
-# Compiled regex patterns for performance
-PROGRESS_REGEX = re.compile(r'(\d+\.?\d*)%')
-SPEED_REGEX = re.compile(r'(\d+\.?\d*\s*[KMG]iB/s)')
-ETA_REGEX = re.compile(r'ETA\s+(\d{2}:\d{2}(?::\d{2})?)')
+class OperationCancelled(Exception):
+    """Raised inside a retried operation that became obsolete; never retried."""
+
+
+# Compiled regex patterns for performance (yt-dlp progress patterns live in ytdlp_engine.py)
 FILESIZE_REGEX = re.compile(r'(\d+\.?\d*\s*[KMG]iB)')
 TIME_REGEX = re.compile(r'^(\d{1,2}):(\d{2}):(\d{2})$')
 
@@ -96,6 +125,8 @@ class YouTubeDownloader:
 
         self.download_path = str(Path.home() / "Downloads")
         self.current_process = None
+        self.encode_processes = set()  # Segment encoders of a parallel local encode
+        self.playlist_processes = set()  # Entry downloads of a Trimmer playlist download
         self.is_downloading = False
         self.video_duration = 0
         self.is_fetching_duration = False
@@ -107,6 +138,10 @@ class YouTubeDownloader:
         self.ffmpeg_path = self._get_bundled_executable('ffmpeg')
         self.ffprobe_path = self._get_bundled_executable('ffprobe')
         self.ytdlp_path = self._get_bundled_executable('yt-dlp')
+        # In-process yt-dlp API when available, bundled executable otherwise
+        self.ytdlp_engine = YtDlpEngine(self.ytdlp_path)
+        # Global bandwidth budget split among all active downloads (set from the UI setting)
+        self.bandwidth = BandwidthAllocator()
 
         # Frame preview variables
         self.start_preview_image = None
@@ -115,15 +150,27 @@ class YouTubeDownloader:
         self.current_video_url = None
         self.preview_update_timer = None
         self.last_preview_update = 0
-        self.preview_thread_running = False  # Track if preview thread is active
-        # Use OrderedDict for O(1) LRU cache operations
-        self.preview_cache = OrderedDict()  # Cache for preview frames {timestamp: file_path}
+        self.preview_generation = 0  # Bumped on every preview request; older requests are stale
+        self.preview_processes = {}  # In-flight preview processes {Popen: 'ffmpeg' or 'ytdlp'}
+        # Two-tier LRU cache (decoded images in memory, JPEG bytes on disk) keyed by (video, timestamp, size)
+        self.preview_cache = PreviewCache(decode=self._decode_preview_image,
+                                          image_bytes=lambda img: img.width * img.height * len(img.getbands()))
+
+        # Filmstrip sprite sheet shown instantly while exact frames are extracted
+        self.filmstrip = None  # Filmstrip layout of the ready sprite sheet
+        self.filmstrip_image = None  # PIL image of the sprite sheet
+        self.filmstrip_url = None  # Video the sprite sheet belongs to
+        self.filmstrip_process = None  # Running ffmpeg filmstrip pass
+        self.filmstrip_lock = threading.Lock()
 
         # Volume control
         self.volume_var = tk.DoubleVar(value=1.0)  # 1.0 = 100%
 
         # Local file support
         self.local_file_path = None
+        self.keyframe_times = []  # Sorted keyframe timestamps of the local file, for lossless fast cuts
+        self.keyframe_path = None  # Local file the keyframe index belongs to
+        self.keyframe_stream = {}  # Codec and pixel format of its video stream (for smart cuts)
 
         # Upload to Catbox.moe
         self.last_output_file = None  # Track last downloaded/processed file
@@ -136,6 +183,23 @@ class YouTubeDownloader:
         # Playlist support
         self.is_playlist = False  # Track if current URL is a playlist
         self.estimated_filesize = None  # Estimated file size for current video
+        self.video_info = None  # VideoInfo from the last metadata fetch (single yt-dlp call)
+        self.quality_sizes = {}  # {quality: estimated bytes} for the current video
+        self.quality_sizes_url = None  # URL the size table was computed for
+        self.quality_labels = {}  # {combobox label: quality value}
+        self.metadata_cache = MetadataCache()  # Persistent info JSON cache keyed by video ID
+        self.job_journal = JobJournal()  # Running downloads, resumed after a crash or close
+        self.download_archive = DownloadArchive()  # Completed downloads by video ID, quality and trim range
+        self.playlist_sync = PlaylistSyncStore()  # Seen entry IDs per playlist, for sync runs
+        self.ui_events = UIEventBus()  # Progress/status updates from workers, applied on the main thread
+        self.ui_events_after_id = None
+        self.stream_url_cache = StreamUrlCache()  # Resolved preview stream URLs until expire=
+        # Resolves clipboard URLs in the background so the list shows titles/sizes up front
+        self.metadata_prefetcher = MetadataPrefetcher(
+            lambda url: self.ytdlp_engine.extract_info(url, no_playlist=True),
+            self.metadata_cache,
+            on_result=self._on_clipboard_prefetch_result,
+        )
 
         # Initialize temp directory with cleanup on exit
         self._init_temp_directory()
@@ -147,11 +211,21 @@ class YouTubeDownloader:
 
         # Thread pool for background tasks
         self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKER_THREADS, thread_name_prefix="ytdl_worker")
+        # Start and end preview frames are extracted concurrently on their own pool
+        self.preview_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ytdl_preview")
+        # Separate single worker so the long filmstrip pass never blocks previews or downloads
+        self.filmstrip_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ytdl_filmstrip")
+        # Clipboard downloads run here, at most clipboard_workers_var at a time
+        self.clipboard_pool = ThreadPoolExecutor(max_workers=CLIPBOARD_MAX_WORKERS, thread_name_prefix="ytdl_clipboard")
 
         # Thread safety locks
         self.preview_lock = threading.Lock()  # Protect preview thread state
+        self.stream_url_lock = threading.Lock()  # Resolve the preview stream URL only once at a time
         self.clipboard_lock = threading.Lock()  # Protect clipboard URL list
         self.auto_download_lock = threading.Lock()  # Protect auto-download state
+        # "Parallel downloads" slots shared by the batch queue and auto-download
+        self.clipboard_slot_condition = threading.Condition()
+        self.clipboard_active_downloads = 0  # Slots in use, guarded by clipboard_slot_condition
         self.download_lock = threading.Lock()  # Protect download state
         self.upload_lock = threading.Lock()  # Protect upload state
         self.uploader_lock = threading.Lock()  # Protect uploader queue state
@@ -205,6 +279,9 @@ class YouTubeDownloader:
         # Bind cleanup on window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Apply worker updates at a fixed rate instead of once per output line
+        self._drain_ui_events()
+
         # Check for updates on startup if enabled (delay to let UI initialize)
         if self._load_auto_check_updates_setting():
             self.root.after(2000, lambda: self.thread_pool.submit(self._check_for_updates, True))
@@ -266,6 +343,33 @@ class YouTubeDownloader:
                         self._update_url_status(url, 'failed')
             logger.info(f"Restored {len(self.persisted_clipboard_urls)} URLs to clipboard list")
 
+    def _resume_journal_jobs(self):
+        """Re-queue interrupted downloads from the job journal in the clipboard list and start them.
+
+        Each resumed item re-runs its journaled yt-dlp command with --continue,
+        so yt-dlp picks up its .part files instead of starting over.
+        """
+        jobs = self.job_journal.unfinished()
+        if not jobs:
+            return
+
+        for job in jobs:
+            logger.info(f"Resuming interrupted {job['kind']} download ({job['phase']}, "
+                        f"{job['downloaded_bytes'] or 0} bytes done): {job['url']}")
+            with self.clipboard_lock:
+                url_exists = job['url'] in self.clipboard_url_widgets
+            if not url_exists:
+                self._add_url_to_clipboard_list(job['url'])
+            self._update_url_status(job['url'], 'pending')
+            with self.clipboard_lock:
+                previous = self.clipboard_url_widgets[job['url']].get('resume_job')
+                self.clipboard_url_widgets[job['url']]['resume_job'] = job
+            if previous:
+                self.job_journal.finish(previous['id'])  # Same URL journaled twice, keep the newest
+
+        self.update_clipboard_status(tr('status_resuming_downloads', count=len(jobs)), "blue")
+        self.root.after(UI_INITIAL_DELAY_MS, self.start_clipboard_downloads)
+
     def _load_language_preference(self):
         """Load saved language preference"""
         try:
@@ -343,6 +447,140 @@ class YouTubeDownloader:
         except Exception as e:
             logger.error(f"Error saving auto_check_updates setting: {e}")
 
+    def _load_clipboard_workers_setting(self):
+        """Load the number of parallel clipboard downloads from config"""
+        try:
+            if CONFIG_FILE.exists():
+                with open(CONFIG_FILE, 'r') as f:
+                    config = json.load(f)
+                    workers = config.get('clipboard_workers', CLIPBOARD_DEFAULT_WORKERS)
+                    if isinstance(workers, int) and 1 <= workers <= CLIPBOARD_MAX_WORKERS:
+                        return workers
+        except Exception as e:
+            logger.error(f"Error loading clipboard_workers setting: {e}")
+        return CLIPBOARD_DEFAULT_WORKERS
+
+    def _save_clipboard_workers_setting(self):
+        """Save the number of parallel clipboard downloads to config"""
+        try:
+            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+            config = {}
+            if CONFIG_FILE.exists():
+                with open(CONFIG_FILE, 'r') as f:
+                    config = json.load(f)
+
+            config['clipboard_workers'] = self._get_clipboard_workers()
+
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(config, f, indent=2)
+
+            logger.info(f"Saved clipboard_workers: {config['clipboard_workers']}")
+        except Exception as e:
+            logger.error(f"Error saving clipboard_workers setting: {e}")
+
+    def _get_clipboard_workers(self):
+        """Return the parallel clipboard download setting, clamped to 1..CLIPBOARD_MAX_WORKERS."""
+        try:
+            workers = int(self.clipboard_workers_var.get())
+        except (tk.TclError, ValueError):
+            workers = CLIPBOARD_DEFAULT_WORKERS
+        return max(1, min(CLIPBOARD_MAX_WORKERS, workers))
+
+    def _acquire_clipboard_slot(self, should_stop=None):
+        """Take one of the "Parallel downloads" slots shared by the batch queue and auto-download.
+
+        Args:
+            should_stop: Callable() -> bool polled while waiting for a free slot;
+                None to return at once when all slots are busy
+
+        Returns:
+            bool: True if a slot was taken (give it back with _release_clipboard_slot())
+        """
+        with self.clipboard_slot_condition:
+            while self.clipboard_active_downloads >= self._get_clipboard_workers():
+                if should_stop is None or should_stop():
+                    return False
+                self.clipboard_slot_condition.wait(timeout=CLIPBOARD_SLOT_POLL_INTERVAL)
+            self.clipboard_active_downloads += 1
+            return True
+
+    def _release_clipboard_slot(self):
+        """Give back a slot taken with _acquire_clipboard_slot()."""
+        with self.clipboard_slot_condition:
+            self.clipboard_active_downloads = max(0, self.clipboard_active_downloads - 1)
+            self.clipboard_slot_condition.notify_all()
+
+    def _load_playlist_sync_settings(self):
+        """Load the playlist sync settings from config
+
+        Returns:
+            tuple: (sync enabled, stop at first known entry)
+        """
+        try:
+            if CONFIG_FILE.exists():
+                with open(CONFIG_FILE, 'r') as f:
+                    config = json.load(f)
+                    return (config.get('playlist_sync', False) is True,
+                            config.get('playlist_sync_stop_early', False) is True)
+        except Exception as e:
+            logger.error(f"Error loading playlist sync settings: {e}")
+        return False, False
+
+    def _save_playlist_sync_settings(self):
+        """Save the playlist sync settings to config"""
+        try:
+            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+            config = {}
+            if CONFIG_FILE.exists():
+                with open(CONFIG_FILE, 'r') as f:
+                    config = json.load(f)
+
+            config['playlist_sync'] = self.playlist_sync_var.get()
+            config['playlist_sync_stop_early'] = self.playlist_sync_stop_early_var.get()
+
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(config, f, indent=2)
+
+            logger.info(f"Saved playlist sync: {config['playlist_sync']}, "
+                        f"stop early: {config['playlist_sync_stop_early']}")
+        except Exception as e:
+            logger.error(f"Error saving playlist sync settings: {e}")
+
+    def _load_bandwidth_limit_setting(self):
+        """Load the global bandwidth limit (MB/s text, empty for unlimited) from config"""
+        try:
+            if CONFIG_FILE.exists():
+                with open(CONFIG_FILE, 'r') as f:
+                    config = json.load(f)
+                    limit = config.get('bandwidth_limit', '')
+                    if isinstance(limit, str):
+                        return limit
+        except Exception as e:
+            logger.error(f"Error loading bandwidth_limit setting: {e}")
+        return ''
+
+    def _apply_bandwidth_limit(self, event=None):
+        """Apply the global bandwidth limit to running downloads and save it to config"""
+        self.bandwidth.set_total(self._get_speed_limit(self.bandwidth_limit_var))
+        try:
+            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+            config = {}
+            if CONFIG_FILE.exists():
+                with open(CONFIG_FILE, 'r') as f:
+                    config = json.load(f)
+
+            config['bandwidth_limit'] = self.bandwidth_limit_var.get().strip()
+
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(config, f, indent=2)
+
+            logger.info(f"Saved bandwidth_limit: {config['bandwidth_limit'] or 'unlimited'}")
+        except Exception as e:
+            logger.error(f"Error saving bandwidth_limit setting: {e}")
+
     def _version_newer(self, latest, current):
         """Compare version strings to check if latest is newer than current.
 
@@ -676,6 +914,8 @@ class YouTubeDownloader:
                     raise
                 logger.warning(f"{operation_name} failed (attempt {attempt}/{MAX_RETRY_ATTEMPTS}), retrying in {RETRY_DELAY}s...")
                 time.sleep(RETRY_DELAY * attempt)
+            except OperationCancelled:
+                raise
             except Exception as e:
                 # Don't retry on unexpected errors
                 logger.error(f"{operation_name} failed with unexpected error: {e}")
@@ -781,6 +1021,10 @@ class YouTubeDownloader:
         allowed_keys = {
             'language': str,
             'auto_check_updates': bool,
+            'clipboard_workers': int,
+            'bandwidth_limit': str,
+            'playlist_sync': bool,
+            'playlist_sync_stop_early': bool,
         }
 
         for key, value in config.items():
@@ -951,16 +1195,10 @@ class YouTubeDownloader:
                 '--force-keyframes-at-cuts',
             ])
 
-        # Build ffmpeg postprocessor args if needed
-        needs_processing = trim_enabled or volume != 1.0
-        if needs_processing:
-            ffmpeg_args = [
-                '-c:v', 'libx264', '-crf', str(VIDEO_CRF),
-                '-preset', 'faster', '-c:a', 'aac', '-b:a', AUDIO_BITRATE
-            ]
-            if volume != 1.0:
-                ffmpeg_args.extend(['-af', f'volume={volume}'])
-
+        # Build ffmpeg postprocessor args if needed; --force-keyframes-at-cuts already cut the
+        # sections on keyframes, so the video is copied and only a volume change re-encodes audio
+        ffmpeg_args = build_postprocessor_args(volume, reencode_video=False)
+        if ffmpeg_args:
             cmd.extend(['--postprocessor-args', 'ffmpeg:' + ' '.join(ffmpeg_args)])
 
         cmd.extend(['-o', output_path, url])
@@ -1156,6 +1394,17 @@ class YouTubeDownloader:
         ttk.Button(language_frame, text=tr('update_check_btn'),
                   command=self._check_for_updates_clicked).pack(side=tk.LEFT)
 
+        # Global bandwidth limit, shared by all downloads (per-tab limits still apply)
+        ttk.Separator(language_frame, orient='vertical').pack(side=tk.LEFT, padx=15, fill='y', pady=2)
+        ttk.Label(language_frame, text=tr('label_total_bandwidth'), font=('Arial', 9)).pack(side=tk.LEFT, padx=(0, 5))
+        self.bandwidth_limit_var = tk.StringVar(value=self._load_bandwidth_limit_setting())
+        bandwidth_entry = ttk.Entry(language_frame, textvariable=self.bandwidth_limit_var, width=6)
+        bandwidth_entry.pack(side=tk.LEFT, padx=(0, 5))
+        bandwidth_entry.bind('<Return>', self._apply_bandwidth_limit)
+        bandwidth_entry.bind('<FocusOut>', self._apply_bandwidth_limit)
+        ttk.Label(language_frame, text="MB/s", font=('Arial', 9)).pack(side=tk.LEFT)
+        self.bandwidth.set_total(self._get_speed_limit(self.bandwidth_limit_var))
+
         # Create notebook for tabs
         self.notebook = ttk.Notebook(scrollable_frame)
         self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
@@ -1198,9 +1447,9 @@ class YouTubeDownloader:
         self.quality_var = tk.StringVar(value="480")
         self.quality_var.trace_add('write', self.on_quality_change)
 
-        quality_options = ["1440", "1080", "720", "480", "360", "240", tr('quality_audio_only')]
+        quality_options = list(VIDEO_QUALITIES) + [tr('quality_audio_only')]
         self.quality_combo = ttk.Combobox(quality_frame, textvariable=self.quality_var,
-            values=quality_options, state='readonly', width=20)
+            values=quality_options, state='readonly', width=28)
         self.quality_combo.pack(side=tk.LEFT)
 
         ttk.Separator(main_tab_frame, orient='horizontal').grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=15)
@@ -1243,6 +1492,13 @@ class YouTubeDownloader:
         self.fetch_duration_btn = ttk.Button(trim_checkbox_frame, text=tr('btn_fetch_duration'), command=self.fetch_duration_clicked, state='disabled')
         self.fetch_duration_btn.pack(side=tk.LEFT, padx=(10, 0))
 
+        # Lossless keyframe-aligned cut for local files (stream copy, no re-encode)
+        self.fast_cut_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(trim_checkbox_frame, text=tr('checkbox_fast_cut'), variable=self.fast_cut_var,
+                        command=self._update_fast_cut_label).pack(side=tk.LEFT, padx=(10, 0))
+        self.fast_cut_label = ttk.Label(trim_checkbox_frame, text="", foreground="gray", font=('Arial', 8))
+        self.fast_cut_label.pack(side=tk.LEFT, padx=(5, 0))
+
         # Video info label
         self.video_info_label = ttk.Label(main_tab_frame, text="", foreground="blue", wraplength=500, justify=tk.LEFT)
         self.video_info_label.grid(row=7, column=0, sticky=tk.W, padx=(20, 0), pady=(2, 0))
@@ -1281,10 +1537,16 @@ class YouTubeDownloader:
         start_control_frame = ttk.Frame(main_tab_frame)
         start_control_frame.grid(row=10, column=0, sticky=tk.W, padx=(40, 0), pady=(2, 2))
 
+        # Start slider with the keyframe positions of a local file drawn underneath
+        start_slider_frame = ttk.Frame(start_control_frame)
+        start_slider_frame.pack(side=tk.LEFT, padx=(0, 10))
+
         self.start_time_var = tk.DoubleVar(value=0)
-        self.start_slider = ttk.Scale(start_control_frame, from_=0, to=100, variable=self.start_time_var,
+        self.start_slider = ttk.Scale(start_slider_frame, from_=0, to=100, variable=self.start_time_var,
                                       orient='horizontal', length=SLIDER_LENGTH, command=self.on_slider_change, state='disabled')
-        self.start_slider.pack(side=tk.LEFT, padx=(0, 10))
+        self.start_slider.pack(side=tk.TOP)
+        self.keyframe_canvas = tk.Canvas(start_slider_frame, width=SLIDER_LENGTH, height=6, highlightthickness=0)
+        self.keyframe_canvas.pack(side=tk.TOP)
 
         ttk.Label(start_control_frame, text=tr('label_start_time') + ":", font=('Arial', 9)).pack(side=tk.LEFT, padx=(0, 5))
         self.start_time_entry = ttk.Entry(start_control_frame, width=10, state='disabled')
@@ -1405,6 +1667,9 @@ class YouTubeDownloader:
         # Restore persisted clipboard URLs
         self._restore_clipboard_urls()
 
+        # Re-queue downloads interrupted by a crash or by closing the app
+        self._resume_journal_jobs()
+
         # Bind tab change event
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
@@ -1438,10 +1703,11 @@ class YouTubeDownloader:
         # Quality dropdown
         ttk.Label(settings_frame, text=tr('label_quality'), font=('Arial', 9)).grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
         self.clipboard_quality_var = tk.StringVar(value="1080")
-        quality_options = ["1440", "1080", "720", "480", "360", "240", tr('quality_audio_only')]
+        quality_options = list(VIDEO_QUALITIES) + [tr('quality_audio_only')]
         self.clipboard_quality_combo = ttk.Combobox(settings_frame, textvariable=self.clipboard_quality_var,
             values=quality_options, state='readonly', width=20)
         self.clipboard_quality_combo.grid(row=0, column=1, sticky=tk.W)
+        self.clipboard_quality_var.trace_add('write', lambda *args: self._update_clipboard_url_count())
 
         # Speed limit
         ttk.Label(settings_frame, text="Speed limit:", font=('Arial', 9)).grid(row=0, column=2, sticky=tk.W, padx=(20, 5))
@@ -1457,6 +1723,26 @@ class YouTubeDownloader:
             variable=self.clipboard_full_playlist_var)
         self.clipboard_full_playlist_check.grid(row=1, column=0, columnspan=5, sticky=tk.W, pady=(5, 0))
 
+        # Parallel downloads (batch and auto-download)
+        ttk.Label(settings_frame, text=tr('label_parallel_downloads'), font=('Arial', 9)).grid(
+            row=2, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0))
+        self.clipboard_workers_var = tk.IntVar(value=self._load_clipboard_workers_setting())
+        ttk.Spinbox(settings_frame, from_=1, to=CLIPBOARD_MAX_WORKERS, textvariable=self.clipboard_workers_var,
+                    width=4, state='readonly', command=self._save_clipboard_workers_setting).grid(
+            row=2, column=1, sticky=tk.W, pady=(5, 0))
+
+        # Playlist sync: only download entries that are new since the last run
+        sync_enabled, stop_early = self._load_playlist_sync_settings()
+        self.playlist_sync_var = tk.BooleanVar(value=sync_enabled)
+        ttk.Checkbutton(settings_frame, text=tr('label_playlist_sync'), variable=self.playlist_sync_var,
+                        command=self._save_playlist_sync_settings).grid(
+            row=3, column=0, columnspan=5, sticky=tk.W, pady=(5, 0))
+        self.playlist_sync_stop_early_var = tk.BooleanVar(value=stop_early)
+        ttk.Checkbutton(settings_frame, text=tr('label_playlist_sync_stop_early'),
+                        variable=self.playlist_sync_stop_early_var,
+                        command=self._save_playlist_sync_settings).grid(
+            row=4, column=0, columnspan=5, sticky=tk.W, padx=(20, 0))
+
         # Output Folder
         ttk.Separator(parent, orient='horizontal').grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
 
@@ -1687,10 +1973,10 @@ class YouTubeDownloader:
                         url_exists = any(item['url'] == clipboard_content for item in self.clipboard_url_list)
 
                     if not url_exists:
-                        self._add_url_to_clipboard_list(clipboard_content)
+                        queued = self._add_url_to_clipboard_list(clipboard_content)
                         logger.info(f"New YouTube URL detected and added: {clipboard_content}")
 
-                        if self.clipboard_auto_download_var.get():
+                        if queued and self.clipboard_auto_download_var.get():
                             logger.info(f"Auto-download enabled, starting download: {clipboard_content}")
                             self._auto_download_single_url(clipboard_content)
                 else:
@@ -1711,7 +1997,11 @@ class YouTubeDownloader:
     # Phase 5: URL List Management
 
     def _add_url_to_clipboard_list(self, url):
-        """Add URL to clipboard list with UI widget"""
+        """Add URL to clipboard list with UI widget
+
+        Returns:
+            bool: True if queued, False if it was already downloaded (shown as completed)
+        """
         url_frame = ttk.Frame(self.clipboard_url_list_frame, relief='solid', borderwidth=1)
         url_frame.pack(fill=tk.X, padx=5, pady=2)
 
@@ -1726,12 +2016,19 @@ class YouTubeDownloader:
         remove_btn = ttk.Button(url_frame, text="X", width=3, command=lambda: self._remove_url_from_list(url))
         remove_btn.pack(side=tk.RIGHT, padx=5)
 
+        progress_bar = ttk.Progressbar(url_frame, mode='determinate', length=80, maximum=100)
+        progress_bar.pack(side=tk.RIGHT, padx=(0, 5))
+
         url_data = {
             'url': url,
             'status': 'pending',
             'widget': url_frame,
             'status_canvas': status_canvas,
-            'status_circle': status_circle
+            'status_circle': status_circle,
+            'url_label': url_label,
+            'progress_bar': progress_bar,
+            'progress': 0.0,  # Percent of this item's download
+            'video_info': None  # Filled in by the metadata prefetcher
         }
 
         with self.clipboard_lock:
@@ -1745,9 +2042,68 @@ class YouTubeDownloader:
         if has_urls and not is_downloading:
             self.clipboard_download_btn.config(state='normal')
 
+        # Already downloaded at this quality: show it as done, without any network call
+        if self.download_archive.contains(self._clipboard_archive_key(url)):
+            self._update_url_status(url, 'completed')
+            url_label.config(text=f"{url_display} ({tr('label_already_downloaded')})")
+            logger.info(f"URL already in download archive: {url}")
+            return False
+
         # Save URLs to persistence file
         self._save_clipboard_urls()
 
+        # Resolve title/duration/size in the background (also warms the metadata cache)
+        self.metadata_prefetcher.submit(url)
+        return True
+
+    def _on_clipboard_prefetch_result(self, url, video_info):
+        """Prefetcher callback (any thread) - hand the result to the main thread."""
+        if video_info is not None:
+            self.root.after(0, lambda: self._apply_clipboard_video_info(url, video_info))
+
+    def _apply_clipboard_video_info(self, url, video_info):
+        """Show the resolved title and duration for a clipboard URL and refresh the batch size."""
+        with self.clipboard_lock:
+            item = self.clipboard_url_widgets.get(url)
+            if item is None:
+                return
+            item['video_info'] = video_info
+
+        title = video_info.title or url
+        duration = self.seconds_to_hms(video_info.duration)
+        display = title if len(title) <= 50 else title[:47] + "..."
+        item['url_label'].config(text=f"{display} [{duration}]")
+        self._update_clipboard_url_count()
+
+    def _get_clipboard_quality(self):
+        """Return the selected Clipboard quality (height string or "none")."""
+        quality = self.clipboard_quality_var.get()
+        if quality == tr('quality_audio_only') or "none" in quality.lower():
+            return AUDIO_ONLY_QUALITY
+        return quality
+
+    def _clipboard_archive_key(self, url):
+        """Return the download archive key of a clipboard URL at the current settings (None for playlists)."""
+        if self.is_playlist_url(url) and self.clipboard_full_playlist_var.get():
+            return None
+        return archive_key(extract_video_id(url), self._get_clipboard_quality())
+
+    def _finish_playlist_archive(self, path, quality):
+        """Record the videos yt-dlp completed in a playlist run and delete its archive file."""
+        if not path:
+            return
+        added = self.download_archive.import_ytdlp_archive(path, quality)
+        logger.info(f"Playlist download archived {added} new videos")
+        self._remove_playlist_archive(path)
+
+    @staticmethod
+    def _remove_playlist_archive(path):
+        """Delete a temporary yt-dlp archive file, ignoring errors."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     def _remove_url_from_list(self, url):
         """Remove URL from clipboard list"""
         widget_to_destroy = None
@@ -1757,6 +2113,9 @@ class YouTubeDownloader:
             for i, item in enumerate(self.clipboard_url_list):
                 if item['url'] == url:
                     widget_to_destroy = item['widget']
+                    resume_job = item.get('resume_job')
+                    if resume_job:
+                        self.job_journal.finish(resume_job['id'])
                     self.clipboard_url_list.pop(i)
                     if url in self.clipboard_url_widgets:
                         del self.clipboard_url_widgets[url]
@@ -1785,6 +2144,9 @@ class YouTubeDownloader:
         # Take snapshot of widgets to destroy
         with self.clipboard_lock:
             widgets_to_destroy = [item['widget'] for item in self.clipboard_url_list if item['widget']]
+            for item in self.clipboard_url_list:
+                if item.get('resume_job'):
+                    self.job_journal.finish(item['resume_job']['id'])
             self.clipboard_url_list.clear()
             self.clipboard_url_widgets.clear()
 
@@ -1803,8 +2165,18 @@ class YouTubeDownloader:
         """Update URL count label"""
         with self.clipboard_lock:
             count = len(self.clipboard_url_list)
+            video_infos = [item['video_info'] for item in self.clipboard_url_list
+                           if item.get('video_info') is not None]
         s = 's' if count != 1 else ''
-        self.clipboard_url_count_label.config(text=tr('label_url_count', count=count, s=s))
+
+        # Total batch size from prefetched formats (lower bound if some are still unknown)
+        quality = self._get_clipboard_quality()
+        total_size = sum(video_info.estimate_filesize(quality) or 0 for video_info in video_infos)
+        if total_size:
+            self.clipboard_url_count_label.config(
+                text=tr('label_url_count_size', count=count, s=s, size=f"{total_size / BYTES_PER_MB:.1f}"))
+        else:
+            self.clipboard_url_count_label.config(text=tr('label_url_count', count=count, s=s))
 
     def _update_url_status(self, url, status):
         """Update visual status of URL: pending (gray), downloading (blue), completed (green), failed (red)"""
@@ -1823,10 +2195,25 @@ class YouTubeDownloader:
                         item_data['status'] = status
                         break
 
-    # Phase 6: Download Queue (Sequential Processing)
+    def _update_url_progress(self, url, value):
+        """Show the progress of one clipboard item (thread-safe, applied on the next UI tick)."""
+        self.ui_events.publish(('url_progress', url), self._show_url_progress, url, value)
+
+    def _show_url_progress(self, url, value):
+        """Show the progress of one clipboard item; the main bar shows the mean of all active items."""
+        with self.clipboard_lock:
+            item = self.clipboard_url_widgets.get(url)
+            if item is None:
+                return
+            item['progress'] = value
+            active = [data['progress'] for data in self.clipboard_url_list if data['status'] == 'downloading']
+        item['progress_bar']['value'] = value
+        self._show_clipboard_progress(max(0, min(100, sum(active) / len(active) if active else value)))
+
+    # Phase 6: Download Queue (Parallel Processing)
 
     def start_clipboard_downloads(self):
-        """Start downloading all pending URLs sequentially"""
+        """Start downloading all pending URLs, up to the parallel downloads setting at a time"""
         with self.clipboard_lock:
             is_downloading = self.clipboard_downloading
         if is_downloading:
@@ -1851,91 +2238,154 @@ class YouTubeDownloader:
         self.thread_pool.submit(self._process_clipboard_queue)
 
     def _process_clipboard_queue(self):
-        """Process clipboard download queue sequentially"""
+        """Process the clipboard download queue with up to N parallel downloads"""
         with self.clipboard_lock:
-            pending_urls = [item for item in self.clipboard_url_list if item['status'] == 'pending']
+            pending_urls = [item['url'] for item in self.clipboard_url_list if item['status'] == 'pending']
         total_count = len(pending_urls)
+        workers = self._get_clipboard_workers()
+        finished = [0]  # Downloads finished so far (success or failure), guarded by clipboard_lock
+        logger.info(f"Clipboard queue: {total_count} URLs, {workers} parallel")
+        self.root.after(0, lambda: self.clipboard_total_label.config(
+            text=tr('label_completed_total', done=0, total=total_count)))
 
-        for index, item in enumerate(pending_urls):
+        def download_item(url):
+            try:
+                success = self._download_clipboard_url(url, check_stop=True)
+                with self.clipboard_lock:
+                    stopped = not self.clipboard_downloading
+                    if not stopped:
+                        finished[0] += 1
+                    done = finished[0]
+                if stopped:
+                    # Interrupted downloads go back to the queue
+                    self.root.after(0, lambda: self._update_url_status(url, 'pending'))
+                    return
+                self.root.after(0, lambda: self._update_url_status(url, 'completed' if success else 'failed'))
+                self.root.after(0, lambda: self.clipboard_total_label.config(
+                    text=tr('label_completed_total', done=done, total=total_count)))
+            finally:
+                self._release_clipboard_slot()
+
+        def batch_stopped():
             with self.clipboard_lock:
-                is_downloading = self.clipboard_downloading
-            if not is_downloading:
+                return not self.clipboard_downloading
+
+        futures = []
+        for url in pending_urls:
+            # Slots are shared with auto-download, so both together stay within the setting
+            if batch_stopped() or not self._acquire_clipboard_slot(should_stop=batch_stopped):
                 logger.info("Clipboard downloads stopped by user")
                 break
 
-            url = item['url']
+            # Skip URLs downloaded since they were queued (e.g. the same video twice in the list)
+            with self.clipboard_lock:
+                item = self.clipboard_url_widgets.get(url)
+                resuming = bool(item and item.get('resume_job'))
+            if not resuming and self.download_archive.contains(self._clipboard_archive_key(url)):
+                logger.info(f"Skipping archived URL: {url}")
+                with self.clipboard_lock:
+                    finished[0] += 1
+                    done = finished[0]
+                self.root.after(0, lambda u=url: self._update_url_status(u, 'completed'))
+                self.root.after(0, lambda d=done: self.clipboard_total_label.config(
+                    text=tr('label_completed_total', done=d, total=total_count)))
+                self._release_clipboard_slot()
+                continue
 
+            # Mark as downloading right away so the aggregate progress counts it as active
+            with self.clipboard_lock:
+                for item in self.clipboard_url_list:
+                    if item['url'] == url:
+                        item['status'] = 'downloading'
+                        break
             self.root.after(0, lambda u=url: self._update_url_status(u, 'downloading'))
-            self.root.after(0, lambda i=index, t=total_count:
-                self.clipboard_total_label.config(text=tr('label_completed_total', done=i, total=t)))
             self.root.after(0, lambda u=url:
                 self.update_clipboard_status(f"Downloading: {u[:50]}...", "blue"))
+            try:
+                futures.append(self.clipboard_pool.submit(download_item, url))
+            except RuntimeError:
+                self._release_clipboard_slot()  # Pool shut down (window closing)
+                break
 
-            success = self._download_clipboard_url(url, check_stop=True)
-
-            if success:
-                self.root.after(0, lambda u=url: self._update_url_status(u, 'completed'))
-            else:
-                self.root.after(0, lambda u=url: self._update_url_status(u, 'failed'))
-
-            completed = index + 1
-            self.root.after(0, lambda c=completed, t=total_count:
-                self.clipboard_total_label.config(text=tr('label_completed_total', done=c, total=t)))
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.exception(f"Clipboard download worker failed: {e}")
 
         self.root.after(0, self._finish_clipboard_downloads)
 
     def _download_clipboard_url(self, url, check_stop=False, check_stop_auto=False):
         """Download single URL or playlist from clipboard mode (blocking, runs in thread). Returns True if successful."""
         process = None
+        bandwidth_job = None
+        journal_job = None
+        archive_file = None
         try:
-            quality = self.clipboard_quality_var.get()
-            if "none" in quality.lower():
-                quality = "none"
-
-            audio_only = quality.startswith("none")
-            is_playlist_url = self.is_playlist_url(url)
-            full_playlist_enabled = self.clipboard_full_playlist_var.get()
+            with self.clipboard_lock:
+                item = self.clipboard_url_widgets.get(url)
+                resume_job = item.pop('resume_job', None) if item else None
+
+            self._update_url_progress(url, 0)
+            cached_info = None
+
+            if resume_job:
+                # Interrupted in an earlier session: same command, resuming from the .part files
+                cmd = resume_command(resume_job['cmd'], self.ytdlp_path)
+                journal_job = resume_job['id']
+                audio_only = '--extract-audio' in cmd
+                download_as_playlist = resume_job['kind'] == 'playlist' or (
+                    self.is_playlist_url(url) and '--no-playlist' not in cmd)
+                archive_quality = quality_from_command(cmd)
+                archive_entry = None if download_as_playlist else key_from_command(extract_video_id(url), cmd)
+                if download_as_playlist and '--download-archive' in cmd:
+                    archive_file = cmd[cmd.index('--download-archive') + 1]
+                logger.info(f"Clipboard download resuming: {url}")
+            else:
+                quality = self._get_clipboard_quality()
 
-            # Determine if we're actually downloading as a playlist
-            download_as_playlist = is_playlist_url and full_playlist_enabled
+                audio_only = quality.startswith("none")
+                is_playlist_url = self.is_playlist_url(url)
+                full_playlist_enabled = self.clipboard_full_playlist_var.get()
 
-            self.root.after(0, lambda: self.clipboard_progress.config(value=0))
-            self.root.after(0, lambda: self.clipboard_progress_label.config(text="0%"))
+                # Full playlists are listed first and downloaded entry by entry
+                if is_playlist_url and full_playlist_enabled:
+                    return self._download_clipboard_playlist(url, quality, audio_only, check_stop, check_stop_auto)
+                download_as_playlist = False
 
-            # Use playlist-appropriate output template only when downloading full playlist
-            if download_as_playlist:
-                output_path = os.path.join(self.clipboard_download_path, '%(playlist_index)s-%(title)s.%(ext)s')
-            else:
                 output_path = os.path.join(self.clipboard_download_path, '%(title)s.%(ext)s')
 
-            # Use helper methods for command construction
-            if audio_only:
-                cmd = self.build_audio_ytdlp_command(url, output_path, volume=1.0)
-            else:
-                cmd = self.build_video_ytdlp_command(url, output_path, quality, volume=1.0)
+                # Use helper methods for command construction
+                if audio_only:
+                    cmd = self.build_audio_ytdlp_command(url, output_path, volume=1.0)
+                else:
+                    cmd = self.build_video_ytdlp_command(url, output_path, quality, volume=1.0)
 
-            # Add --no-playlist if it's a playlist URL but full playlist download is disabled
-            if is_playlist_url and not full_playlist_enabled:
-                cmd.insert(1, '--no-playlist')
+                # Add --no-playlist if it's a playlist URL but full playlist download is disabled
+                if is_playlist_url and not full_playlist_enabled:
+                    cmd.insert(1, '--no-playlist')
 
-            # Add speed limit if set
-            cmd.extend(self._get_speed_limit_args(self.clipboard_speed_limit_var))
+                archive_entry = archive_key(extract_video_id(url), quality)
 
-            if download_as_playlist:
-                logger.info(f"Clipboard full playlist download starting: {url}")
-            elif is_playlist_url:
-                logger.info(f"Clipboard single video from playlist starting: {url}")
-            else:
-                logger.info(f"Clipboard download starting: {url}")
+                if is_playlist_url:
+                    logger.info(f"Clipboard single video from playlist starting: {url}")
+                else:
+                    logger.info(f"Clipboard download starting: {url}")
+
+                # Reuse prefetched metadata so yt-dlp skips the extraction step
+                cached_info = self.metadata_cache.get(extract_video_id(url))
 
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True, bufsize=1)
+                journal_job = self.job_journal.start('clipboard', url, cmd, output_path)
+
+            process, bandwidth_job = self._start_ytdlp_download(
+                cmd, BANDWIDTH_PRIORITY_BACKGROUND, self.clipboard_speed_limit_var, url=url, info=cached_info)
 
             # Track current download phase for status messages
             current_phase = "video" if not audio_only else "audio"
             playlist_item_info = ""  # Track which playlist item we're on
+            output_file = None  # Last file yt-dlp named (merged/extracted file once postprocessed)
 
-            for line in process.stdout:
+            for event in process.events():
                 # Check stop flags
                 if check_stop:
                     with self.clipboard_lock:
@@ -1950,44 +2400,45 @@ class YouTubeDownloader:
                         self.safe_process_cleanup(process)
                         return False
 
-                line_lower = line.lower()
+                status = event['status']
+                self.job_journal.record_event(journal_job, event)
+                if event.get('filename'):
+                    output_file = event['filename']
 
-                # Detect phase changes from yt-dlp output
-                if 'downloading video' in line_lower or ('video' in line_lower and 'downloading' in line_lower):
-                    current_phase = "video"
-                elif 'downloading audio' in line_lower or ('audio' in line_lower and 'downloading' in line_lower):
-                    current_phase = "audio"
+                if status == 'phase':
+                    current_phase = event['phase']
 
                 # Detect playlist item progress (e.g., "Downloading item 1 of 10")
-                if download_as_playlist and 'downloading item' in line_lower:
-                    item_match = re.search(r'downloading item (\d+) of (\d+)', line_lower)
-                    if item_match:
-                        playlist_item_info = f" [{item_match.group(1)}/{item_match.group(2)}]"
-
-                if '[download]' in line or 'Downloading' in line:
-                    progress_match = PROGRESS_REGEX.search(line)
-                    if progress_match:
-                        progress = float(progress_match.group(1))
-                        self.root.after(0, lambda p=progress: self.update_clipboard_progress(p))
-
-                        # Show phase-specific status with playlist info if applicable
-                        phase = current_phase
-                        pinfo = playlist_item_info
-                        self.root.after(0, lambda p=progress, ph=phase, pi=pinfo: self.update_clipboard_status(
-                            f"Downloading {ph}{pi}... {p:.1f}%", "blue"))
+                elif status == 'playlist_item' and download_as_playlist:
+                    playlist_item_info = f" [{event['playlist_index']}/{event['playlist_count']}]"
+
+                elif status == 'downloading' and event['percent'] is not None:
+                    progress = event['percent']
+                    if event['phase']:
+                        current_phase = event['phase']
+                    if download_as_playlist and event['playlist_index'] and event['playlist_count']:
+                        playlist_item_info = f" [{event['playlist_index']}/{event['playlist_count']}]"
+                    self._update_url_progress(url, progress)
+
+                    # Show phase-specific status with playlist info if applicable
+                    self.update_clipboard_status(
+                        f"Downloading {current_phase}{playlist_item_info}... {progress:.1f}%", "blue")
 
                 # Show merging/processing status
-                elif '[Merger]' in line or 'Merging' in line:
-                    self.root.after(0, lambda: self.update_clipboard_status("Merging video and audio...", "blue"))
-                elif '[ffmpeg]' in line:
-                    self.root.after(0, lambda: self.update_clipboard_status("Processing with ffmpeg...", "blue"))
-                elif '[ExtractAudio]' in line:
-                    self.root.after(0, lambda: self.update_clipboard_status("Extracting audio...", "blue"))
+                elif status == 'postprocessing':
+                    postprocessor = event['postprocessor']
+                    if postprocessor == 'Merger':
+                        self.update_clipboard_status("Merging video and audio...", "blue")
+                    elif postprocessor == 'ExtractAudio':
+                        self.update_clipboard_status("Extracting audio...", "blue")
+                    else:
+                        self.update_clipboard_status("Processing with ffmpeg...", "blue")
 
             process.wait()
 
             if process.returncode == 0:
-                self.root.after(0, lambda: self.update_clipboard_progress(PROGRESS_COMPLETE))
+                self._update_url_progress(url, PROGRESS_COMPLETE)
+                self.download_archive.add(archive_entry, output_file)
                 logger.info(f"Clipboard download completed: {url}")
                 success = True
             else:
@@ -2003,6 +2454,77 @@ class YouTubeDownloader:
             if process:
                 self.safe_process_cleanup(process)
             return False
+        finally:
+            if bandwidth_job:
+                self.bandwidth.release(bandwidth_job)
+            self.job_journal.finish(journal_job)
+            if archive_file:
+                self._finish_playlist_archive(archive_file, archive_quality)
+
+    def _download_clipboard_playlist(self, url, quality, audio_only, check_stop=False, check_stop_auto=False):
+        """Download a full playlist from clipboard mode, entry by entry (blocking, runs in thread).
+
+        Returns:
+            bool: True if every entry was downloaded (or already archived)
+        """
+        def should_stop():
+            if check_stop:
+                with self.clipboard_lock:
+                    if not self.clipboard_downloading:
+                        return True
+            if check_stop_auto:
+                with self.auto_download_lock:
+                    if not self.clipboard_auto_downloading:
+                        return True
+            return False
+
+        def build_command(entry):
+            output_path = os.path.join(self.clipboard_download_path, f"{entry['index']}-%(title)s.%(ext)s")
+            if audio_only:
+                cmd = self.build_audio_ytdlp_command(entry['url'], output_path, volume=1.0)
+            else:
+                cmd = self.build_video_ytdlp_command(entry['url'], output_path, quality, volume=1.0)
+            cmd.insert(1, '--no-playlist')
+            return cmd
+
+        def on_update(runner, entry):
+            progress = runner.overall_progress()
+            message = self._playlist_status(runner)
+            self._update_url_progress(url, progress)
+            self.update_clipboard_status(message, "blue")
+
+        logger.info(f"Clipboard full playlist download starting: {url}")
+        self.update_clipboard_status(tr('status_playlist_listing'), "blue")
+        # The playlist already occupies one clipboard download slot; its entries get a fixed
+        # pool so parallel playlists cannot multiply into clipboard_workers² processes
+        runner = self._download_playlist_entries(url, build_command, quality, PLAYLIST_WORKERS,
+                                                 should_stop, on_update, self.clipboard_speed_limit_var,
+                                                 sync=self.playlist_sync_var.get(),
+                                                 stop_early=self.playlist_sync_stop_early_var.get())
+        if should_stop():
+            return False
+
+        counts = runner.counts()
+        if counts.get(ENTRY_FAILED):
+            logger.error(f"Clipboard playlist download: {counts[ENTRY_FAILED]} entries failed: {url}")
+            return False
+        if not runner.entries:
+            self.update_clipboard_status(tr('status_playlist_up_to_date'), "green")
+        self._update_url_progress(url, PROGRESS_COMPLETE)
+        logger.info(f"Clipboard playlist download completed: {url}")
+        return True
+
+    @staticmethod
+    def _playlist_status(runner):
+        """Format the status line of a running playlist download: entries done, overall and per-entry progress."""
+        counts = runner.counts()
+        done = sum(counts.get(state, 0) for state in ENTRY_FINISHED_STATES)
+        message = tr('status_playlist_progress', done=done, total=len(runner.entries),
+                     progress=f"{runner.overall_progress():.1f}")
+        active = runner.active_progress()
+        if active:
+            message += " (" + ", ".join(f"#{entry['index']} {percent:.0f}%" for entry, percent in active) + ")"
+        return message
 
     def _finish_clipboard_downloads(self):
         """Clean up after batch downloads complete"""
@@ -2041,15 +2563,17 @@ class YouTubeDownloader:
             self.clipboard_stop_btn.config(state='disabled')
 
     def _auto_download_single_url(self, url):
-        """Auto-download single URL when detected (if auto-download enabled)"""
-        # Check if another auto-download is already in progress (thread-safe)
+        """Auto-download single URL when detected (if auto-download enabled)
+
+        Returns:
+            bool: True if the download started, False if all parallel slots are busy
+        """
+        # Take a parallel slot (shared with the batch queue) without waiting
         with self.auto_download_lock:
-            with self.clipboard_lock:
-                downloading_count = sum(1 for item in self.clipboard_url_list if item['status'] == 'downloading')
-            if downloading_count > 0:
-                # Another download is in progress, keep this one pending
-                logger.info(f"URL queued (another download in progress): {url}")
-                return
+            if not self._acquire_clipboard_slot():
+                # All parallel slots busy, keep this one pending
+                logger.info(f"URL queued (all {self._get_clipboard_workers()} download slots busy): {url}")
+                return False
 
             self.clipboard_auto_downloading = True
             self._update_url_status(url, 'downloading')
@@ -2057,20 +2581,29 @@ class YouTubeDownloader:
         # Update UI outside the lock
         self.clipboard_stop_btn.config(state='normal')  # Enable stop button
         self._update_auto_download_total()
-        self.thread_pool.submit(self._auto_download_worker, url)
+        try:
+            self.clipboard_pool.submit(self._auto_download_worker, url)
+        except RuntimeError:
+            self._release_clipboard_slot()  # Pool shut down (window closing)
+            return False
+        return True
 
     def _auto_download_worker(self, url):
         """Worker thread for auto-downloading single URL"""
-        # Check if stopped before starting
-        with self.auto_download_lock:
-            is_auto_downloading = self.clipboard_auto_downloading
-        if not is_auto_downloading:
-            self.root.after(0, lambda: self._update_url_status(url, 'pending'))
-            return
+        try:
+            # Check if stopped before starting
+            with self.auto_download_lock:
+                is_auto_downloading = self.clipboard_auto_downloading
+            if not is_auto_downloading:
+                self.root.after(0, lambda: self._update_url_status(url, 'pending'))
+                return
 
-        self.root.after(0, lambda: self.update_clipboard_status(tr('status_auto_downloading', url=url[:50]), "blue"))
+            self.root.after(0, lambda: self.update_clipboard_status(tr('status_auto_downloading', url=url[:50]), "blue"))
 
-        success = self._download_clipboard_url(url, check_stop_auto=True)
+            success = self._download_clipboard_url(url, check_stop_auto=True)
+        finally:
+            # Free the slot before the next pending URL is started on the main thread
+            self._release_clipboard_slot()
 
         # Check if stopped during download
         with self.auto_download_lock:
@@ -2111,24 +2644,21 @@ class YouTubeDownloader:
             self.clipboard_stop_btn.config(state='disabled')
 
     def _check_pending_auto_downloads(self):
-        """Check if there are pending URLs that need to be auto-downloaded"""
-        # Reset auto-downloading flag if no more downloads
-        with self.auto_download_lock:
-            self.clipboard_auto_downloading = False
-
+        """Start pending URLs in the free parallel slots, or go idle when nothing is left"""
         if self.clipboard_auto_download_var.get():
-            # Find first pending URL
             with self.clipboard_lock:
-                next_pending_url = None
-                for item in self.clipboard_url_list:
-                    if item['status'] == 'pending':
-                        next_pending_url = item['url']
-                        break  # Only start one at a time
+                pending_urls = [item['url'] for item in self.clipboard_url_list if item['status'] == 'pending']
+            for url in pending_urls:
+                if not self._auto_download_single_url(url):
+                    break  # All slots busy
 
-            if next_pending_url:
-                self._auto_download_single_url(next_pending_url)
-        else:
-            # Disable stop button if idle
+        # Reset auto-downloading flag once no download is running any more
+        with self.auto_download_lock:
+            with self.clipboard_lock:
+                any_active = any(item['status'] == 'downloading' for item in self.clipboard_url_list)
+            if not any_active:
+                self.clipboard_auto_downloading = False
+        if not any_active:
             self._disable_stop_if_idle()
 
     def _update_auto_download_total(self):
@@ -2141,18 +2671,23 @@ class YouTubeDownloader:
     # Phase 7: Helper Methods
 
     def update_clipboard_progress(self, value):
-        """Update clipboard mode progress bar"""
+        """Update clipboard mode progress bar (thread-safe, applied on the next UI tick)"""
         try:
             value = float(value)
             value = max(0, min(100, value))  # Clamp to 0-100
-            self.clipboard_progress['value'] = value
-            self.clipboard_progress_label.config(text=f"{value:.1f}%")
         except (ValueError, TypeError) as e:
             logger.warning(f"Invalid progress value: {value} - {e}")
+            return
+        self.ui_events.publish('clipboard_progress', self._show_clipboard_progress, value)
+
+    def _show_clipboard_progress(self, value):
+        self.clipboard_progress['value'] = value
+        self.clipboard_progress_label.config(text=f"{value:.1f}%")
 
     def update_clipboard_status(self, message, color):
-        """Update clipboard mode status label"""
-        self.clipboard_status_label.config(text=message, foreground=color)
+        """Update clipboard mode status label (thread-safe, applied on the next UI tick)"""
+        self.ui_events.publish('clipboard_status', self.clipboard_status_label.config,
+                               {'text': message, 'foreground': color})
 
     def change_clipboard_path(self):
         """Change clipboard mode download path"""
@@ -2289,7 +2824,12 @@ class YouTubeDownloader:
         # Save the URL for preview extraction and clear cache
         if self.current_video_url != url:
             self.current_video_url = url
-            self._clear_preview_cache()
+            self.video_info = None
+            self.quality_sizes_url = None
+            self._set_quality_options()
+            self._set_keyframes(None, [], {})
+            self._cancel_filmstrip()
+            self._supersede_previews(kill_ytdlp=True)
         else:
             self.current_video_url = url
 
@@ -2301,6 +2841,39 @@ class YouTubeDownloader:
         # Submit to thread pool
         self.thread_pool.submit(self.fetch_video_duration, url)
 
+    def get_video_info(self, url):
+        """Return VideoInfo for a URL from the metadata cache or a single yt-dlp call.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            VideoInfo: Parsed metadata (duration, title, formats)
+
+        Raises:
+            Exception: If yt-dlp fails or returns invalid JSON
+        """
+        video_id = extract_video_id(url)
+        cached_info = self.metadata_cache.get(video_id)
+        if cached_info:
+            logger.info(f"Using cached metadata for {video_id}")
+            return VideoInfo(cached_info)
+
+        # Fetch all metadata (duration, title, formats) with a single yt-dlp extraction
+        def _fetch_info():
+            return self.ytdlp_engine.extract_info(url, no_playlist=True, timeout=METADATA_FETCH_TIMEOUT)
+
+        try:
+            info = self.retry_network_operation(_fetch_info, "Fetch video info")
+        except YtDlpError as e:
+            raise Exception(f"yt-dlp returned error: {e.stderr}")
+        video_info = VideoInfo(info)
+
+        # Keyed by the URL's video ID, the same key lookups use; URLs without one
+        # (non-YouTube extractors) are not cached
+        self.metadata_cache.put(video_id, video_info.info)
+        return video_info
+
     def fetch_video_duration(self, url):
         """Fetch video duration and info from URL or local file"""
         try:
@@ -2308,85 +2881,51 @@ class YouTubeDownloader:
             if self.is_local_file(url):
                 return self._fetch_local_file_duration(url)
 
-            # Fetch duration
-            def _fetch_duration():
-                cmd = [self.ytdlp_path, '--get-duration', url]
-                return subprocess.run(cmd, capture_output=True, text=True, timeout=METADATA_FETCH_TIMEOUT)
+            # Duration, title and formats all come from one info record (cached or fetched)
+            video_info = self.get_video_info(url)
 
-            result = self.retry_network_operation(_fetch_duration, "Fetch duration")
+            duration = video_info.duration
+            # Validate duration is reasonable (max 24 hours to prevent slider issues)
+            if duration < 0:
+                raise ValueError(f"Negative duration: {duration}")
+            if duration > MAX_VIDEO_DURATION:
+                logger.warning(f"Duration {duration}s exceeds max, capping to {MAX_VIDEO_DURATION}s")
+                duration = MAX_VIDEO_DURATION
 
-            # Fetch title in parallel
-            def _fetch_title():
-                cmd = [self.ytdlp_path, '--get-title', url]
-                return subprocess.run(cmd, capture_output=True, text=True, timeout=METADATA_FETCH_TIMEOUT)
+            self.video_info = video_info
+            self.video_duration = duration
 
-            title_result = self.retry_network_operation(_fetch_title, "Fetch title")
+            # Update sliders
+            self.start_slider.config(from_=0, to=self.video_duration, state='normal')
+            self.end_slider.config(from_=0, to=self.video_duration, state='normal')
+            self.start_time_var.set(0)
+            self.end_time_var.set(self.video_duration)
 
-            if result.returncode == 0:
-                duration_str = result.stdout.strip()
-                # Parse duration (format can be SS, MM:SS, or HH:MM:SS)
-                parts = duration_str.split(':')
-                try:
-                    if len(parts) == 1:  # Just seconds (e.g., "59")
-                        duration = int(parts[0])
-                    elif len(parts) == 2:  # MM:SS
-                        mins, secs = int(parts[0]), int(parts[1])
-                        if mins < 0 or secs < 0 or secs >= 60:
-                            raise ValueError(f"Invalid time values in duration: {duration_str}")
-                        duration = mins * 60 + secs
-                    elif len(parts) == 3:  # HH:MM:SS
-                        hours, mins, secs = int(parts[0]), int(parts[1]), int(parts[2])
-                        if hours < 0 or mins < 0 or secs < 0 or mins >= 60 or secs >= 60:
-                            raise ValueError(f"Invalid time values in duration: {duration_str}")
-                        duration = hours * 3600 + mins * 60 + secs
-                    else:
-                        raise ValueError(f"Invalid duration format: {duration_str}")
-
-                    # Validate duration is reasonable (max 24 hours to prevent slider issues)
-                    MAX_DURATION = 24 * 3600  # 24 hours in seconds
-                    if duration < 0:
-                        raise ValueError(f"Negative duration: {duration}")
-                    if duration > MAX_DURATION:
-                        logger.warning(f"Duration {duration}s exceeds max, capping to {MAX_DURATION}s")
-                        duration = MAX_DURATION
-
-                    self.video_duration = duration
-                except (ValueError, OverflowError) as e:
-                    raise ValueError(f"Invalid duration format: {duration_str} ({e})")
-
-                # Update sliders
-                self.start_slider.config(from_=0, to=self.video_duration, state='normal')
-                self.end_slider.config(from_=0, to=self.video_duration, state='normal')
-                self.start_time_var.set(0)
-                self.end_time_var.set(self.video_duration)
-
-                # Update entry fields
-                self.start_time_entry.config(state='normal')
-                self.end_time_entry.config(state='normal')
-                self.start_time_entry.delete(0, tk.END)
-                self.start_time_entry.insert(0, self.seconds_to_hms(0))
-                self.end_time_entry.delete(0, tk.END)
-                self.end_time_entry.insert(0, self.seconds_to_hms(self.video_duration))
+            # Update entry fields
+            self.start_time_entry.config(state='normal')
+            self.end_time_entry.config(state='normal')
+            self.start_time_entry.delete(0, tk.END)
+            self.start_time_entry.insert(0, self.seconds_to_hms(0))
+            self.end_time_entry.delete(0, tk.END)
+            self.end_time_entry.insert(0, self.seconds_to_hms(self.video_duration))
 
-                # Update duration label
-                self.trim_duration_label.config(text=tr('label_selected_duration_value', duration=self.seconds_to_hms(self.video_duration)))
+            # Update duration label
+            self.trim_duration_label.config(text=tr('label_selected_duration_value', duration=self.seconds_to_hms(self.video_duration)))
 
-                # Display video title if available
-                if title_result and title_result.returncode == 0:
-                    video_title = title_result.stdout.strip()
-                    self.video_info_label.config(text=tr('label_video_title', title=video_title))
-                    logger.info(f"Video title: {video_title}")
+            # Display video title if available
+            if video_info.title:
+                self.video_info_label.config(text=tr('label_video_title', title=video_info.title))
+                logger.info(f"Video title: {video_info.title}")
 
-                # Fetch estimated file size
-                self._fetch_file_size(url)
+            # Estimate file size from the already fetched formats (on main thread)
+            self.root.after(0, lambda: self._fetch_file_size(url))
 
-                self.update_status(tr('status_duration_fetched'), "green")
+            self.update_status(tr('status_duration_fetched'), "green")
 
-                # Trigger initial preview update
-                self.root.after(UI_INITIAL_DELAY_MS, self.update_previews)
-                logger.info(f"Successfully fetched video duration: {self.video_duration}s")
-            else:
-                raise Exception(f"yt-dlp returned error: {result.stderr}")
+            # Trigger initial preview update, and build the scrubbing filmstrip in the background
+            self.root.after(UI_INITIAL_DELAY_MS, self.update_previews)
+            self.start_filmstrip_generation(url, self.video_duration)
+            logger.info(f"Successfully fetched video duration: {self.video_duration}s")
 
         except subprocess.TimeoutExpired:
             error_msg = tr('error_request_timeout')
@@ -2410,38 +2949,69 @@ class YouTubeDownloader:
                 self.fetch_duration_btn.config(state='normal')
 
     def _fetch_file_size(self, url):
-        """Fetch estimated file size for the video (runs in background thread)"""
-        def _fetch():
-            try:
-                quality = self.quality_var.get()
+        """Show the estimated size for the selected quality.
 
-                # Build format selector based on quality
-                if quality.startswith("none"):
-                    format_selector = "bestaudio"
-                else:
-                    format_selector = f'bestvideo[height<={quality}]+bestaudio/best[height<={quality}]'
+        Sizes for every quality are computed once per video from the formats
+        list returned by the metadata fetch (or stored in the metadata cache)
+        and shown in the quality dropdown; picking a quality is then a pure
+        lookup with no yt-dlp call or network round-trip.
+        """
+        if url != self.quality_sizes_url:
+            video_info = self.video_info
+            if video_info is None or url != self.current_video_url:
+                # Fall back to the persistent metadata cache (still no network call)
+                cached_info = self.metadata_cache.get(extract_video_id(url))
+                try:
+                    video_info = VideoInfo(cached_info) if cached_info else None
+                except ValueError:
+                    video_info = None
 
-                cmd = [self.ytdlp_path, '--dump-json', '-f', format_selector, url]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=STREAM_FETCH_TIMEOUT)
+            sizes = {}
+            if video_info is not None:
+                sizes = video_info.size_table(VIDEO_QUALITIES + (AUDIO_ONLY_QUALITY,))
+            self.quality_sizes_url = url
+            self._set_quality_options(sizes)
 
-                if result.returncode == 0:
-                    info = json.loads(result.stdout)
-                    filesize = info.get('filesize') or info.get('filesize_approx')
+        filesize = self.quality_sizes.get(self._get_selected_quality())
+        if filesize:
+            self._update_filesize_display(filesize, filesize / BYTES_PER_MB)
+        else:
+            self._update_filesize_display(None, None)
 
-                    if filesize:
-                        # Convert to MB and update UI on main thread
-                        filesize_mb = filesize / BYTES_PER_MB
-                        self.root.after(0, lambda: self._update_filesize_display(filesize, filesize_mb))
-                    else:
-                        self.root.after(0, lambda: self._update_filesize_display(None, None))
-                else:
-                    self.root.after(0, lambda: self._update_filesize_display(None, None))
-            except Exception as e:
-                logger.debug(f"Could not fetch file size: {e}")
-                self.root.after(0, lambda: self._update_filesize_display(None, None))
+    def _set_quality_options(self, sizes=None):
+        """Rebuild the quality dropdown labels, showing the estimated size of each quality.
 
-        # Run in background thread
-        self.thread_pool.submit(_fetch)
+        Args:
+            sizes: {quality: bytes or None}; plain labels are shown when empty
+        """
+        sizes = sizes or {}
+        selected = self._get_selected_quality()
+        self.quality_sizes = sizes
+
+        self.quality_labels = {}
+        values = []
+        selected_label = None
+        for quality in VIDEO_QUALITIES + (AUDIO_ONLY_QUALITY,):
+            label = tr('quality_audio_only') if quality == AUDIO_ONLY_QUALITY else quality
+            size = sizes.get(quality)
+            if size:
+                label = f"{label}  (~{size / BYTES_PER_MB:.1f} MB)"
+            self.quality_labels[label] = quality
+            values.append(label)
+            if quality == selected:
+                selected_label = label
+
+        self.quality_combo.config(values=values)
+        if selected_label and self.quality_var.get() != selected_label:
+            self.quality_var.set(selected_label)
+
+    def _get_selected_quality(self):
+        """Return the selected Trimmer quality (height string or "none"), without size label."""
+        value = self.quality_var.get()
+        quality = self.quality_labels.get(value, value)
+        if quality == tr('quality_audio_only') or quality.startswith("none"):
+            return AUDIO_ONLY_QUALITY
+        return quality
 
     def _update_filesize_display(self, filesize_bytes, filesize_mb):
         """Update file size display on main thread"""
@@ -2456,12 +3026,10 @@ class YouTubeDownloader:
         self._update_trimmed_filesize()
 
     def on_quality_change(self, *args):
-        """Handle quality selection changes - re-fetch file size with new quality"""
-        # Only re-fetch if we have a valid URL and have already fetched duration
+        """Handle quality selection changes - recompute file size for the new quality"""
+        # Only recompute if we have a valid URL and have already fetched duration
         if self.current_video_url and self.video_duration > 0 and not self.is_playlist:
-            # Show loading indicator
-            self.filesize_label.config(text=tr('label_calculating_size'))
-            # Re-fetch file size with new quality setting (in background)
+            # Size comes from the formats fetched with the video info (no network call)
             self._fetch_file_size(self.current_video_url)
 
     def _update_trimmed_filesize(self):
@@ -2524,8 +3092,11 @@ class YouTubeDownloader:
 
             self.update_status(tr('status_duration_fetched'), "green")
 
-            # Trigger initial preview update
+            # Trigger initial preview update, and build the scrubbing filmstrip in the background
             self.root.after(100, self.update_previews)
+            self.start_filmstrip_generation(filepath, self.video_duration)
+            if self.keyframe_path != filepath:
+                self.thread_pool.submit(self._build_keyframe_index, filepath)
 
         except subprocess.CalledProcessError as e:
             error_msg = tr('error_read_video_failed', error=(e.stderr if e.stderr else str(e)))
@@ -2547,9 +3118,96 @@ class YouTubeDownloader:
             if self.trim_enabled_var.get():
                 self.fetch_duration_btn.config(state='normal')
 
-    def on_slider_change(self, event=None):
-        """Handle slider changes and enforce valid time ranges.
-
+    def _build_keyframe_index(self, filepath):
+        """Background job: list the keyframes of a local file with ffprobe (packet scan, no decode)."""
+        try:
+            result = subprocess.run(build_keyframe_probe_command(self.ffprobe_path, filepath),
+                                    capture_output=True, text=True, timeout=KEYFRAME_PROBE_TIMEOUT, check=True)
+            keyframes = parse_keyframe_times(result.stdout)
+            result = subprocess.run(build_video_stream_probe_command(self.ffprobe_path, filepath),
+                                    capture_output=True, text=True, timeout=FFPROBE_TIMEOUT, check=True)
+            stream = parse_video_stream(result.stdout)
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.warning(f"Keyframe index failed for {filepath}: {e}")
+            return
+        logger.info(f"Keyframe index: {len(keyframes)} keyframes in {filepath} ({stream.get('codec_name')})")
+        self.root.after(0, lambda: self._set_keyframes(filepath, keyframes, stream))
+
+    def _set_keyframes(self, filepath, keyframes, stream):
+        """Store the keyframe index of filepath and redraw the keyframe ticks (main thread)."""
+        if filepath is not None and filepath != self.local_file_path:
+            return  # Another file was selected meanwhile
+        self.keyframe_path = filepath
+        self.keyframe_times = keyframes
+        self.keyframe_stream = stream
+        self._draw_keyframe_ticks()
+        self._update_fast_cut_label()
+
+    def _draw_keyframe_ticks(self):
+        """Draw one tick per keyframe under the start slider."""
+        self.keyframe_canvas.delete('all')
+        if not self.keyframe_times or self.video_duration <= 0:
+            return
+        width = int(self.keyframe_canvas.cget('width'))
+        # Adjacent keyframes closer than a pixel share a tick
+        positions = {int(t / self.video_duration * (width - 1)) for t in self.keyframe_times if t <= self.video_duration}
+        for x in positions:
+            self.keyframe_canvas.create_line(x, 0, x, 6, fill='gray50')
+
+    def _update_fast_cut_label(self):
+        """Show where a fast cut would really start for the current start time."""
+        if not self.fast_cut_var.get() or not self.local_file_path:
+            self.fast_cut_label.config(text="")
+            return
+        if self.keyframe_path != self.local_file_path:
+            self.fast_cut_label.config(text=tr('label_fast_cut_indexing'), foreground="gray")
+            return
+        start_time = int(self.start_time_var.get())
+        end_time = int(self.end_time_var.get())
+        smart_cut = self._plan_local_smart_cut(start_time, end_time)
+        if smart_cut:
+            encoded = sum(part_end - part_start for mode, part_start, part_end in smart_cut if mode == 'encode')
+            self.fast_cut_label.config(text=tr('label_fast_cut_smart', seconds=f"{encoded:.1f}"), foreground="green")
+        elif is_keyframe_aligned(self.keyframe_times, start_time):
+            self.fast_cut_label.config(text=tr('label_fast_cut_aligned'), foreground="green")
+        elif self._fast_cut_needs_reencode(start_time):
+            self.fast_cut_label.config(text=tr('label_fast_cut_reencode',
+                                               codec=self.keyframe_stream.get('codec_name')), foreground="orange")
+        else:
+            snapped = snap_to_keyframe(self.keyframe_times, start_time)
+            self.fast_cut_label.config(text=tr('label_fast_cut_snapped', time=self.seconds_to_hms(snapped)),
+                                       foreground="orange")
+
+    def _plan_local_smart_cut(self, start_time, end_time):
+        """Return the smart cut parts for the indexed local file, or None.
+
+        None means a plain stream copy is enough (cut points on keyframes) or a
+        smart cut is not possible (no index yet, or no encoder for the codec).
+        """
+        if self.keyframe_path != self.local_file_path or not self.keyframe_times or end_time <= start_time:
+            return None
+        if self.keyframe_stream.get('codec_name') not in SMART_CUT_ENCODERS:
+            return None
+        parts = plan_smart_cut(self.keyframe_times, start_time, end_time)
+        if all(mode == 'copy' for mode, _, _ in parts):
+            return None
+        return parts
+
+    def _fast_cut_needs_reencode(self, start_time):
+        """Return True if a fast cut of the indexed local file can't be frame-accurate losslessly.
+
+        That is the case when the start is between keyframes and the codec
+        can't be smart-cut (see SMART_CUT_ENCODERS); the clip is re-encoded instead.
+        """
+        if self.keyframe_path != self.local_file_path or not self.keyframe_times:
+            return False
+        if self.keyframe_stream.get('codec_name') in SMART_CUT_ENCODERS:
+            return False
+        return not is_keyframe_aligned(self.keyframe_times, start_time)
+
+    def on_slider_change(self, event=None):
+        """Handle slider changes and enforce valid time ranges.
+
         Called when start/end time sliders are moved by the user or programmatically.
         Ensures start time is always before end time by automatically adjusting
         the other slider when needed.
@@ -2591,6 +3249,10 @@ class YouTubeDownloader:
 
         # Update file size based on trim selection
         self._update_trimmed_filesize()
+        self._update_fast_cut_label()
+
+        # Show nearest filmstrip tiles immediately; exact frames replace them after the debounce
+        self._show_filmstrip_previews(start_time, end_time)
 
         # Schedule preview update with debouncing
         self.schedule_preview_update()
@@ -2993,117 +3655,207 @@ class YouTubeDownloader:
         if self.preview_update_timer:
             self.root.after_cancel(self.preview_update_timer)
 
+        # Frames for the old slider positions are no longer wanted - stop them now
+        self._supersede_previews()
+
         # Schedule new update after debounce delay
         self.preview_update_timer = self.root.after(PREVIEW_DEBOUNCE_MS, self.update_previews)
 
+    def _supersede_previews(self, kill_ytdlp=False):
+        """Start a new preview generation, killing in-flight preview processes of older ones.
+
+        Args:
+            kill_ytdlp: Also kill stream URL resolution (only stale when the video changed)
+
+        Returns:
+            int: The new preview generation token
+        """
+        with self.preview_lock:
+            self.preview_generation += 1
+            generation = self.preview_generation
+            stale = [process for process, kind in self.preview_processes.items()
+                     if kill_ytdlp or kind == 'ffmpeg']
+
+        for process in stale:
+            try:
+                process.kill()
+            except OSError:
+                pass  # Already exited
+        return generation
+
+    def _is_preview_superseded(self, generation):
+        """Check whether a preview request has been replaced by a newer one."""
+        return generation is not None and generation != self.preview_generation
+
+    def _track_preview_process(self, process, kind, running):
+        """Register/unregister an in-flight preview process so newer requests can kill it."""
+        with self.preview_lock:
+            if running:
+                self.preview_processes[process] = kind
+            else:
+                self.preview_processes.pop(process, None)
+
+    def _run_preview_process(self, cmd, timeout):
+        """Run a killable preview ffmpeg process (like subprocess.run with capture_output)."""
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._track_preview_process(process, 'ffmpeg', True)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        finally:
+            self._track_preview_process(process, 'ffmpeg', False)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
     def _clear_preview_cache(self):
-        """Clear the preview frame cache"""
+        """Clear the in-memory preview tier (the persistent disk tier is kept)"""
         logger.info("Clearing preview cache")
-        self.preview_cache.clear()
-
-    def _cache_preview_frame(self, timestamp, file_path):
-        """Add a frame to the cache with LRU eviction (O(1) operations with OrderedDict)"""
-        # If timestamp already exists, remove it first to update position
-        if timestamp in self.preview_cache:
-            del self.preview_cache[timestamp]
-
-        # Remove oldest if cache is full
-        if len(self.preview_cache) >= PREVIEW_CACHE_SIZE:
-            # popitem(last=False) removes the oldest (first) item in O(1)
-            oldest_key, old_path = self.preview_cache.popitem(last=False)
-            # Optionally delete the old cached file
+        self.preview_cache.clear_memory()
+
+    @staticmethod
+    def _decode_preview_image(data):
+        """Decode preview JPEG bytes into a ready-to-display PIL image"""
+        with Image.open(io.BytesIO(data)) as img:
+            img = img.convert('RGB')
+        if img.width > PREVIEW_WIDTH or img.height > PREVIEW_HEIGHT:
+            img.thumbnail((PREVIEW_WIDTH, PREVIEW_HEIGHT), Image.Resampling.LANCZOS)
+        return img
+
+    def _preview_video_key(self):
+        """Return the preview cache identity of the current video (video ID, or local file identity)"""
+        url = self.current_video_url
+        if self.is_local_file(url):
             try:
-                if os.path.exists(old_path):
-                    os.remove(old_path)
+                stat = os.stat(url)
             except OSError:
-                pass  # File may already be removed or locked
+                return None
+            # Size and mtime make edits of the same file a different cache entry
+            return f"file:{os.path.abspath(url)}:{stat.st_size}:{int(stat.st_mtime)}"
+        return extract_video_id(url) or url
 
-        # Add to cache (will be at the end, marking it as most recently used)
-        self.preview_cache[timestamp] = file_path
+    def _get_preview_stream_url(self, force_refresh=False):
+        """Return the direct stream URL used for preview frames of the current video.
 
-    def _get_cached_frame(self, timestamp):
-        """Get a cached frame if available (O(1) with OrderedDict.move_to_end)"""
-        if timestamp in self.preview_cache:
-            # Update access order (move to end as most recently used) - O(1) operation
-            self.preview_cache.move_to_end(timestamp)
-            return self.preview_cache[timestamp]
-        return None
+        Resolved URLs are cached per video and format until their expire=
+        timestamp, so only the first preview (or one after expiry) runs yt-dlp.
+
+        Args:
+            force_refresh: Drop the cached URL and resolve a fresh one (e.g. after HTTP 403)
+
+        Returns:
+            str: Direct http(s) media URL
+
+        Raises:
+            subprocess.CalledProcessError, subprocess.TimeoutExpired: If yt-dlp fails
+        """
+        url = self.current_video_url
+        video_id = extract_video_id(url) or url
 
-    def extract_frame(self, timestamp):
-        """Extract a single frame at the given timestamp"""
+        # Start and end previews may ask at the same time - resolve only once
+        with self.stream_url_lock:
+            if force_refresh:
+                self.stream_url_cache.invalidate(video_id, PREVIEW_STREAM_FORMAT)
+            else:
+                stream_url = self.stream_url_cache.get(video_id, PREVIEW_STREAM_FORMAT)
+                if stream_url:
+                    return stream_url
+
+                # Stream URL already known from the metadata fetch - no extra yt-dlp call
+                video_info = self.video_info
+                stream_url = video_info.preview_stream_url() if video_info is not None else None
+                if stream_url and self.stream_url_cache.put(video_id, PREVIEW_STREAM_FORMAT, stream_url):
+                    return stream_url
+
+            # Get the actual video stream URL using yt-dlp with retry
+            # Use a format that includes video+audio to avoid segmented streams
+            def _get_stream_url():
+                if url != self.current_video_url:
+                    raise OperationCancelled(f"Video changed, not resolving {url}")
+                # Combined format is more reliable for frame extraction
+                return self.ytdlp_engine.get_stream_url(
+                    url, PREVIEW_STREAM_FORMAT, timeout=STREAM_FETCH_TIMEOUT,
+                    process_hook=lambda process, running: self._track_preview_process(process, 'ytdlp', running))
+
+            stream_url = self.retry_network_operation(_get_stream_url, "Get stream URL for preview")
+            self.stream_url_cache.put(video_id, PREVIEW_STREAM_FORMAT, stream_url)
+            return stream_url
+
+    def extract_frame(self, timestamp, generation=None):
+        """Extract a single frame at the given timestamp.
+
+        Args:
+            timestamp: Position in seconds
+            generation: Preview generation token; extraction stops once it is superseded
+
+        Returns:
+            PIL.Image.Image: Ready-to-display preview image (extracted or cached), or None
+        """
         if not self.current_video_url:
             return None
 
-        # Check cache first
-        cached = self._get_cached_frame(timestamp)
-        if cached and os.path.exists(cached):
+        # Check cache first (memory, then persistent disk tier)
+        video_key = self._preview_video_key()
+        cached = self.preview_cache.get(video_key, timestamp, PREVIEW_SIZE_KEY) if video_key else None
+        if cached is not None:
             logger.debug(f"Using cached frame for timestamp {timestamp}s")
             return cached
 
         try:
-            # Create unique temp file for this frame
-            temp_file = os.path.join(self.temp_dir, f"frame_{timestamp}.jpg")
-
             # Handle local files differently
-            if self.is_local_file(self.current_video_url):
+            is_local = self.is_local_file(self.current_video_url)
+            if is_local:
                 # For local files, use the file path directly
                 video_url = self.current_video_url
             else:
-                # Get the actual video stream URL using yt-dlp with retry
-                # Use a format that includes video+audio to avoid segmented streams
-                def _get_stream_url():
-                    get_url_cmd = [
-                        self.ytdlp_path,
-                        '-f', 'best[height<=480]/best',  # Combined format is more reliable for frame extraction
-                        '--no-playlist',
-                        '-g',
-                        self.current_video_url
-                    ]
-                    return subprocess.run(get_url_cmd, capture_output=True, text=True, timeout=STREAM_FETCH_TIMEOUT, check=True)
-
-                result = self.retry_network_operation(_get_stream_url, f"Get stream URL for frame at {timestamp}s")
-                video_url = result.stdout.strip().split('\n')[0]
-
-                if not video_url:
-                    logger.error("Failed to get stream URL - empty response")
-                    return None
-
-                # Validate that the stream URL looks like a valid URL
-                if not (video_url.startswith('http://') or video_url.startswith('https://')):
-                    logger.error(f"Invalid stream URL format: {video_url[:100]}")
-                    return None
+                # Cached googlevideo URL - yt-dlp only runs on the first preview or after expiry
+                video_url = self._get_preview_stream_url()
 
             # Now extract frame from the actual stream with retry
-            def _extract_frame():
-                cmd = [
-                    self.ffmpeg_path,
-                    '-nostdin',
-                ]
-                # Add HTTP streaming options for YouTube URLs
-                if video_url.startswith('http'):
-                    cmd.extend([
-                        '-reconnect', '1',
-                        '-reconnect_streamed', '1',
-                        '-reconnect_delay_max', '5',
-                        '-timeout', '10000000',  # 10 second timeout in microseconds
-                    ])
-                cmd.extend([
-                    '-ss', str(timestamp),
-                    '-i', video_url,
-                    '-vframes', '1',
-                    '-q:v', '2',
-                    '-y',
-                    temp_file
-                ])
-                return subprocess.run(cmd, capture_output=True, timeout=STREAM_FETCH_TIMEOUT, check=True)
+            # ffmpeg scales to preview size itself and pipes a small JPEG to stdout (no temp file)
+            def _extract_frame(source_url):
+                cmd = build_preview_frame_command(self.ffmpeg_path, source_url, timestamp,
+                                                  PREVIEW_WIDTH, PREVIEW_HEIGHT)
+                if self._is_preview_superseded(generation):
+                    raise OperationCancelled(f"Preview request for {timestamp}s superseded")
+                result = self._run_preview_process(cmd, STREAM_FETCH_TIMEOUT)
+                if result.returncode != 0:
+                    if self._is_preview_superseded(generation):
+                        # Killed by a newer preview request
+                        raise OperationCancelled(f"Preview request for {timestamp}s superseded")
+                    stderr = result.stderr.decode('utf-8', errors='replace')
+                    if not is_local and '403' in stderr:
+                        # Stream URL expired or rejected - retrying the same URL is pointless
+                        return False
+                    raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+                return result.stdout
 
-            self.retry_network_operation(_extract_frame, f"Extract frame at {timestamp}s")
+            try:
+                frame_data = self.retry_network_operation(_extract_frame, f"Extract frame at {timestamp}s", video_url)
+            except subprocess.CalledProcessError:
+                if is_local:
+                    raise
+                frame_data = False
+
+            if frame_data is False:
+                # Invalidate and re-resolve the stream URL once
+                logger.info(f"Stream URL failed for frame at {timestamp}s, re-resolving")
+                video_url = self._get_preview_stream_url(force_refresh=True)
+                frame_data = self.retry_network_operation(_extract_frame, f"Extract frame at {timestamp}s", video_url)
+                if frame_data is False:
+                    logger.error(f"Stream URL rejected (HTTP 403) for frame at {timestamp}s")
+                    return None
 
-            if os.path.exists(temp_file):
-                # Cache the extracted frame
-                self._cache_preview_frame(timestamp, temp_file)
-                return temp_file
+            if frame_data:
+                # Cache the extracted frame in both tiers
+                if video_key:
+                    return self.preview_cache.put(video_key, timestamp, PREVIEW_SIZE_KEY, frame_data)
+                return self._decode_preview_image(frame_data)
+            logger.warning(f"ffmpeg returned no frame data at {timestamp}s (past end of stream?)")
 
+        except OperationCancelled as e:
+            logger.debug(f"{e}")
         except subprocess.TimeoutExpired:
             logger.warning(f"Timeout while extracting frame at {timestamp}s")
         except subprocess.CalledProcessError as e:
@@ -3118,72 +3870,158 @@ class YouTubeDownloader:
         if not self.current_video_url or self.video_duration == 0:
             return
 
-        # Prevent spawning multiple preview threads (thread-safe)
-        with self.preview_lock:
-            if self.preview_thread_running:
-                return
-            self.preview_thread_running = True
+        # Latest request wins: supersede (and kill) any in-flight extraction
+        generation = self._supersede_previews()
 
         start_time = int(self.start_time_var.get())
         end_time = int(self.end_time_var.get())
 
-        # Show loading indicators
-        self.start_preview_label.config(image=self.loading_image)
-        self.end_preview_label.config(image=self.loading_image)
+        # Show filmstrip tiles (or loading indicators) until the exact frames are ready
+        if not self._show_filmstrip_previews(start_time, end_time):
+            self.start_preview_label.config(image=self.loading_image)
+            self.end_preview_label.config(image=self.loading_image)
+
+        # Adjust end_time if it's at or near the video end (ffmpeg struggles with exact EOF)
+        adjusted_end_time = end_time
+        if self.video_duration > 0 and end_time >= self.video_duration - 1:
+            adjusted_end_time = max(0, self.video_duration - 3)  # 3 seconds before end
+            logger.debug(f"Adjusted end preview time from {end_time}s to {adjusted_end_time}s (near EOF)")
+
+        logger.info(f"Extracting preview frames at {start_time}s and {adjusted_end_time}s")
+
+        # Extract both frames concurrently; each is shown as soon as it is ready
+        self.preview_pool.submit(self._update_preview_frame, start_time, 'start', generation)
+        self.preview_pool.submit(self._update_preview_frame, adjusted_end_time, 'end', generation)
+
+    def start_filmstrip_generation(self, url, duration):
+        """Build the filmstrip sprite sheet for url in the background (one ffmpeg pass)."""
+        self._cancel_filmstrip()
+        self.filmstrip_pool.submit(self._generate_filmstrip, url, duration)
+
+    def _cancel_filmstrip(self):
+        """Drop the current filmstrip and stop a running ffmpeg filmstrip pass."""
+        with self.filmstrip_lock:
+            self.filmstrip = None
+            self.filmstrip_image = None
+            self.filmstrip_url = None
+            process = self.filmstrip_process
+            self.filmstrip_process = None
+        if process:
+            self.safe_process_cleanup(process)
 
-        # Submit to thread pool instead of creating new thread
-        self.thread_pool.submit(self._update_previews_thread, start_time, end_time)
+    def _generate_filmstrip(self, url, duration):
+        """Background job: run the filmstrip ffmpeg pass and load the sprite sheet."""
+        if url != self.current_video_url:
+            return  # Superseded while queued
 
-    def _update_previews_thread(self, start_time, end_time):
-        """Background thread to extract and update preview frames"""
+        process = None
+        output_path = None
         try:
-            # Adjust end_time if it's at or near the video end (ffmpeg struggles with exact EOF)
-            adjusted_end_time = end_time
-            if self.video_duration > 0 and end_time >= self.video_duration - 1:
-                adjusted_end_time = max(0, self.video_duration - 3)  # 3 seconds before end
-                logger.debug(f"Adjusted end preview time from {end_time}s to {adjusted_end_time}s (near EOF)")
-
-            logger.info(f"Extracting preview frames at {start_time}s and {adjusted_end_time}s")
-
-            # Extract start frame
-            start_frame_path = self.extract_frame(start_time)
-            if start_frame_path:
-                self._update_preview_image(start_frame_path, 'start')
-            else:
-                # Show error placeholder if extraction failed
-                error_img = self.create_placeholder_image(PREVIEW_WIDTH, PREVIEW_HEIGHT, "Error")
-                self.root.after(0, lambda img=error_img: self._set_start_preview(img))
-
-            # Extract end frame (using adjusted time to avoid EOF issues)
-            end_frame_path = self.extract_frame(adjusted_end_time)
-            if end_frame_path:
-                self._update_preview_image(end_frame_path, 'end')
-            else:
-                # Show error placeholder if extraction failed
-                error_img = self.create_placeholder_image(PREVIEW_WIDTH, PREVIEW_HEIGHT, "Error")
-                self.root.after(0, lambda img=error_img: self._set_end_preview(img))
+            filmstrip = Filmstrip(duration)
+            source = url if self.is_local_file(url) else self._get_preview_stream_url()
+            output_path = os.path.join(self.temp_dir, f"filmstrip_{int(time.time() * 1000)}.jpg")
+            cmd = filmstrip.build_command(self.ffmpeg_path, source, output_path)
+
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            with self.filmstrip_lock:
+                superseded = url != self.current_video_url
+                if not superseded:
+                    self.filmstrip_process = process
+            if superseded:
+                self.safe_process_cleanup(process)
+                return
+
+            _, stderr = process.communicate(timeout=FILMSTRIP_TIMEOUT)
+            with self.filmstrip_lock:
+                cancelled = self.filmstrip_process is not process
+            if cancelled:
+                # Killed by _cancel_filmstrip() for a newer video
+                logger.debug(f"Filmstrip pass cancelled (code {process.returncode}): {url}")
+                return
+            if process.returncode != 0 or not os.path.exists(output_path):
+                logger.warning(f"Filmstrip generation failed (code {process.returncode}): "
+                               f"{stderr.decode('utf-8', errors='replace').strip()[:200]}")
+                return
+
+            with Image.open(output_path) as img:
+                sheet = img.convert('RGB')
+
+            with self.filmstrip_lock:
+                if url != self.current_video_url:
+                    return
+                self.filmstrip_process = None
+                self.filmstrip = filmstrip
+                self.filmstrip_image = sheet
+                self.filmstrip_url = url
+            logger.info(f"Filmstrip ready: {filmstrip.tile_count} tiles every {filmstrip.interval}s")
+
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Filmstrip generation timed out after {FILMSTRIP_TIMEOUT}s")
+            self.safe_process_cleanup(process)
+        except Exception as e:
+            logger.warning(f"Filmstrip generation failed: {e}")
+            if process:
+                self.safe_process_cleanup(process)
         finally:
-            # Use lock when resetting flag to prevent race condition with spawn check
-            with self.preview_lock:
-                self.preview_thread_running = False
+            # The sheet is decoded into memory, so the sprite file is not needed any more
+            if output_path and os.path.exists(output_path):
+                try:
+                    os.remove(output_path)
+                except OSError as e:
+                    logger.debug(f"Could not remove filmstrip file {output_path}: {e}")
+
+    def _show_filmstrip_previews(self, start_time, end_time):
+        """Show the nearest filmstrip tiles as start/end previews (main thread).
+
+        Returns:
+            bool: True if the filmstrip was available and shown
+        """
+        with self.filmstrip_lock:
+            filmstrip = self.filmstrip
+            sheet = self.filmstrip_image
+            ready = filmstrip is not None and self.filmstrip_url == self.current_video_url
+
+        if not ready:
+            return False
+
+        try:
+            for timestamp, set_preview in ((start_time, self._set_start_preview), (end_time, self._set_end_preview)):
+                tile = sheet.crop(filmstrip.tile_box(timestamp))
+                tile = tile.resize((PREVIEW_WIDTH, PREVIEW_HEIGHT), Image.Resampling.BILINEAR)
+                set_preview(ImageTk.PhotoImage(tile))
+        except Exception as e:
+            logger.warning(f"Error showing filmstrip tile: {e}")
+            return False
+        return True
+
+    def _update_preview_frame(self, timestamp, position, generation):
+        """Preview pool job: extract one frame and show it ('start' or 'end')"""
+        if self._is_preview_superseded(generation):
+            return  # A newer request was made while this one was queued
+
+        frame = self.extract_frame(timestamp, generation)
+        if self._is_preview_superseded(generation):
+            return
+        if frame is not None:
+            self._update_preview_image(frame, position, generation)
+        else:
+            # Show error placeholder if extraction failed
+            error_img = self.create_placeholder_image(PREVIEW_WIDTH, PREVIEW_HEIGHT, "Error")
+            set_preview = self._set_start_preview if position == 'start' else self._set_end_preview
+            self.root.after(0, lambda img=error_img: (
+                None if self._is_preview_superseded(generation) else set_preview(img)))
 
-    def _update_preview_image(self, image_path, position):
+    def _update_preview_image(self, image, position, generation=None):
         """Update preview image in UI (must be called from main thread or scheduled)"""
         try:
-            # Load and resize image (using context manager for proper cleanup)
-            with Image.open(image_path) as img:
-                img.thumbnail((PREVIEW_WIDTH, PREVIEW_HEIGHT), Image.Resampling.LANCZOS)
-                # Convert to PhotoImage (must be done before context exits)
-                photo = ImageTk.PhotoImage(img)
-
-            # CRITICAL: Store reference BEFORE scheduling to prevent GC
-            # The lambda uses default argument to capture the photo object immediately
-            if position == 'start':
-                self.start_preview_image = photo  # Keep reference to avoid GC
-                self.root.after(0, lambda p=photo: self._set_start_preview(p))
-            else:
-                self.end_preview_image = photo  # Keep reference to avoid GC
-                self.root.after(0, lambda p=photo: self._set_end_preview(p))
+            # Image is already decoded and preview-sized (ffmpeg scaled it, the cache decoded it)
+            photo = ImageTk.PhotoImage(image)
+
+            # The lambda default argument keeps a reference to the photo until it is shown (prevents GC).
+            # Frames of superseded requests are dropped so the latest positions are always rendered last.
+            set_preview = self._set_start_preview if position == 'start' else self._set_end_preview
+            self.root.after(0, lambda p=photo: (
+                None if self._is_preview_superseded(generation) else set_preview(p)))
 
         except Exception as e:
             logger.error(f"Error updating preview image for {position}: {e}")
@@ -3420,6 +4258,11 @@ class YouTubeDownloader:
             # Check if it's a playlist and update flag
             self.is_playlist = self.is_playlist_url(url)
 
+            # Ask before fetching a video again with the same quality and trim range
+            if self.download_archive.contains(self._trimmer_archive_key(url)):
+                if not messagebox.askyesno(tr('confirm_redownload_title'), tr('confirm_redownload')):
+                    return
+
         if not self.dependencies_ok:
             messagebox.showerror(tr('error_title'), tr('error_missing_dependencies'))
             return
@@ -3432,13 +4275,20 @@ class YouTubeDownloader:
             self.last_progress_time = time.time()
         self.download_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
-        self.progress['value'] = 0
-        self.progress_label.config(text="0%")
+        self.update_progress(0)
 
         # Submit download and timeout monitor to thread pool
         self.thread_pool.submit(self.download, url)
         self.thread_pool.submit(self._monitor_download_timeout)
 
+    def _trimmer_archive_key(self, url):
+        """Return the download archive key of a Trimmer URL at the current settings."""
+        quality = self._get_selected_quality()
+        if self.trim_enabled_var.get():
+            return archive_key(extract_video_id(url), quality,
+                               int(self.start_time_var.get()), int(self.end_time_var.get()))
+        return archive_key(extract_video_id(url), quality)
+
     def _monitor_download_timeout(self):
         """Monitor download for timeouts (absolute and progress-based)"""
         while True:
@@ -3475,8 +4325,8 @@ class YouTubeDownloader:
             self.update_status(reason, "red")
             self.stop_download()
 
-    def _get_speed_limit_args(self, speed_limit_var=None):
-        """Get yt-dlp speed limit arguments if speed limit is set
+    def _get_speed_limit(self, speed_limit_var=None):
+        """Get a speed limit in bytes/second, or None if unset
 
         Args:
             speed_limit_var: Optional StringVar to use. Defaults to self.speed_limit_var
@@ -3489,31 +4339,147 @@ class YouTubeDownloader:
                 speed_limit = float(speed_limit_str)
                 if speed_limit > 0:
                     # yt-dlp expects rate in bytes/second, user enters MB/s
-                    rate_bytes = int(speed_limit * BYTES_PER_MB)
-                    return ['--limit-rate', f'{rate_bytes}']
+                    return int(speed_limit * BYTES_PER_MB)
             except ValueError:
                 # Invalid input, ignore
                 pass
-        return []
+        return None
+
+    def _start_ytdlp_download(self, cmd, priority, speed_limit_var=None, url=None, info=None):
+        """Start a yt-dlp download within the global bandwidth budget.
+
+        The download's share of the budget is recomputed whenever another one
+        starts or finishes; the caller must release the returned job.
+
+        Args:
+            cmd: yt-dlp command (without --limit-rate)
+            priority: BANDWIDTH_PRIORITY_INTERACTIVE or BANDWIDTH_PRIORITY_BACKGROUND
+            speed_limit_var: The tab's own speed limit StringVar (defaults to the Trimmer's)
+            url: URL in cmd, passed to the engine with info
+            info: Optional cached yt-dlp info dict
+
+        Returns:
+            tuple: (process handle, bandwidth job ID)
+        """
+        job = self.bandwidth.register(priority, self._get_speed_limit(speed_limit_var))
+        try:
+            process = self.ytdlp_engine.start(cmd, url=url, info=info, rate_limit=self.bandwidth.rate(job))
+        except Exception:
+            self.bandwidth.release(job)
+            raise
+        self.bandwidth.attach(job, process.set_rate_limit)
+        return process, job
+
+    def _download_playlist_entries(self, url, build_command, quality, workers, should_stop, on_update,
+                                   speed_limit_var=None, processes=None, sync=False, stop_early=False):
+        """Download a playlist in two stages: a flat listing, then the entries in parallel (blocking).
+
+        Every entry is a single-video download with its own progress, journal
+        entry and retries (see PlaylistRunner); entries already in the download
+        archive are skipped without any network call. Entries handled by any
+        run are remembered per playlist, so a sync run only downloads the ones
+        that are new since.
+
+        Args:
+            url: Playlist URL
+            build_command: Callable(entry) -> single-video yt-dlp command for the entry
+            quality: Quality of the commands, for the download archive
+            workers: Entries downloaded at once
+            should_stop: Callable() -> bool, polled while downloading
+            on_update: Callable(runner, entry), called from pool threads on every progress or state change
+            speed_limit_var: The tab's own speed limit StringVar
+            processes: Optional set the running entry processes are kept in (under download_lock),
+                so they can be killed from outside
+            sync: Only download entries not seen by an earlier run of this playlist
+            stop_early: With sync, stop the listing at the first seen entry (newest-first playlists)
+
+        Returns:
+            PlaylistRunner: The finished run (see counts())
+
+        Raises:
+            YtDlpError: If the playlist can't be listed
+        """
+        sync_key = playlist_key(url)
+        if sync:
+            listing = self.ytdlp_engine.iter_flat_playlist(url)
+            try:
+                entries = select_new_entries(listing, self.playlist_sync.known_ids(sync_key), stop_early)
+            finally:
+                listing.close()
+            logger.info(f"Playlist sync: {len(entries)} new entries: {url}")
+        else:
+            entries = parse_flat_playlist(self.ytdlp_engine.extract_flat_playlist(url))
+            logger.info(f"Playlist listed: {len(entries)} entries: {url}")
+
+        def download_entry(entry, report):
+            cmd = build_command(entry)
+            process = None
+            bandwidth_job = None
+            output_file = None
+            journal_job = self.job_journal.start('playlist_entry', entry['url'], cmd, cmd[cmd.index('-o') + 1])
+            try:
+                process, bandwidth_job = self._start_ytdlp_download(
+                    cmd, BANDWIDTH_PRIORITY_BACKGROUND, speed_limit_var, url=entry['url'])
+                if processes is not None:
+                    with self.download_lock:
+                        processes.add(process)
+                for event in process.events():
+                    if should_stop():
+                        self.safe_process_cleanup(process)
+                        return False
+                    self.job_journal.record_event(journal_job, event)
+                    if event.get('filename'):
+                        output_file = event['filename']
+                    if event['status'] == 'downloading' and event['percent'] is not None:
+                        report(event['percent'])
+                process.wait()
+                if process.returncode != 0:
+                    logger.warning(f"Playlist entry failed: {entry['url']}, returncode={process.returncode}")
+                    return False
+                self.download_archive.add(archive_key(entry['id'], quality), output_file)
+                return True
+            finally:
+                if process:
+                    if processes is not None:
+                        with self.download_lock:
+                            processes.discard(process)
+                    self.safe_process_cleanup(process)
+                if bandwidth_job:
+                    self.bandwidth.release(bandwidth_job)
+                self.job_journal.finish(journal_job)
+
+        runner = PlaylistRunner(entries, download_entry, workers, on_update=on_update, should_stop=should_stop)
+        for entry in entries:
+            if self.download_archive.contains(archive_key(entry['id'], quality)):
+                runner.skip(entry)
+        counts = runner.run()
+        self.playlist_sync.mark_seen(sync_key, [entry['id'] for entry in entries
+                                                if runner.states[entry['id']] in (ENTRY_COMPLETED, ENTRY_SKIPPED)])
+        logger.info(f"Playlist finished: {counts}: {url}")
+        return runner
 
     def stop_download(self):
         """Stop download gracefully, with forced termination as fallback"""
         with self.download_lock:
             process_to_cleanup = self.current_process
+            encode_processes = list(self.encode_processes) + list(self.playlist_processes)
             is_active = self.is_downloading
 
-        if process_to_cleanup and is_active:
-            self.safe_process_cleanup(process_to_cleanup)
+        if (process_to_cleanup or encode_processes) and is_active:
+            for process in [process_to_cleanup] + encode_processes:
+                if process:
+                    self.safe_process_cleanup(process)
 
             with self.download_lock:
                 self.is_downloading = False
             self.update_status(tr('status_download_stopped'), "orange")
             self.download_btn.config(state='normal')
             self.stop_btn.config(state='disabled')
-            self.progress['value'] = 0
-            self.progress_label.config(text="0%")
+            self.update_progress(0)
 
     def download(self, url):
+        bandwidth_job = None
+        journal_job = None
         try:
             # Route to local file handler if needed
             if self.is_local_file(url):
@@ -3523,7 +4489,7 @@ class YouTubeDownloader:
             # (playlist downloads are only supported in clipboard mode)
             is_playlist_url = self.is_playlist_url(url)
 
-            quality = self.quality_var.get()
+            quality = self._get_selected_quality()
             trim_enabled = self.trim_enabled_var.get()
             audio_only = quality.startswith("none")
 
@@ -3570,7 +4536,7 @@ class YouTubeDownloader:
 
                 cmd = [
                     self.ytdlp_path,
-                    '--concurrent-fragments', '5',  # Download fragments in parallel
+                    '--concurrent-fragments', CONCURRENT_FRAGMENTS,  # Download fragments in parallel
                     '--buffer-size', BUFFER_SIZE,  # Better buffering
                     '--http-chunk-size', CHUNK_SIZE,  # Larger chunks = fewer requests
                     '-f', 'bestaudio',
@@ -3597,9 +4563,6 @@ class YouTubeDownloader:
                 if ffmpeg_args:
                     cmd.extend(['--postprocessor-args', 'ffmpeg:' + ' '.join(ffmpeg_args)])
 
-                # Add speed limit if set
-                cmd.extend(self._get_speed_limit_args())
-
                 # Always use --no-playlist in trimmer mode
                 if is_playlist_url:
                     cmd.append('--no-playlist')
@@ -3635,7 +4598,7 @@ class YouTubeDownloader:
 
                 cmd = [
                     self.ytdlp_path,
-                    '--concurrent-fragments', '5',  # Download fragments in parallel
+                    '--concurrent-fragments', CONCURRENT_FRAGMENTS,  # Download fragments in parallel
                     '--buffer-size', BUFFER_SIZE,  # Better buffering
                     '--http-chunk-size', CHUNK_SIZE,  # Larger chunks = fewer requests
                     '-f', f'bestvideo[height<={height}]+bestaudio/best[height<={height}]',
@@ -3654,21 +4617,13 @@ class YouTubeDownloader:
 
                 # Build ffmpeg postprocessor args for video (only if needed)
                 volume_multiplier = self.validate_volume(self.volume_var.get())
-                needs_processing = trim_enabled or volume_multiplier != 1.0
-
-                if needs_processing:
-                    # Need to re-encode due to trimming or volume change
-                    ffmpeg_video_args = ['-c:v', 'libx264', '-crf', str(VIDEO_CRF), '-preset', 'faster', '-c:a', 'aac', '-b:a', AUDIO_BITRATE]
-
-                    # Add volume filter if needed
-                    if volume_multiplier != 1.0:
-                        ffmpeg_video_args.extend(['-af', f'volume={volume_multiplier}'])
 
+                # yt-dlp cuts the sections on keyframes (--force-keyframes-at-cuts), so the
+                # video is copied; a volume change re-encodes just the audio
+                ffmpeg_video_args = build_postprocessor_args(volume_multiplier, reencode_video=False)
+                if ffmpeg_video_args:
                     cmd.extend(['--postprocessor-args', 'ffmpeg:' + ' '.join(ffmpeg_video_args)])
 
-                # Add speed limit if set
-                cmd.extend(self._get_speed_limit_args())
-
                 # Always use --no-playlist in trimmer mode
                 if is_playlist_url:
                     cmd.append('--no-playlist')
@@ -3682,75 +4637,63 @@ class YouTubeDownloader:
 
             logger.info(f"Download command: {' '.join(cmd)}")
 
-            self.current_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
-            )
+            journal_job = self.job_journal.start('trimmer', url, cmd, os.path.join(self.download_path, output_template))
+            self.current_process, bandwidth_job = self._start_ytdlp_download(cmd, BANDWIDTH_PRIORITY_INTERACTIVE)
 
-            # Parse output for progress
+            # Consume structured progress events
             error_lines = []  # Capture error output for debugging
             try:
-                for line in self.current_process.stdout:
+                for event in self.current_process.events():
                     if not self.is_downloading:
                         break
 
+                    status = event['status']
+                    self.job_journal.record_event(journal_job, event)
+
                     # Capture ERROR lines for debugging
-                    if 'ERROR' in line or 'error' in line.lower():
-                        error_lines.append(line.strip())
-                        logger.warning(f"yt-dlp: {line.strip()}")
-
-                    # Look for download progress - multiple patterns for reliability
-                    if '[download]' in line or 'Downloading' in line:
-                        # Parse progress percentage
-                        progress_match = PROGRESS_REGEX.search(line)
-                        if progress_match:
-                            progress = float(progress_match.group(1))
-                            self.update_progress(progress)
-
-                            # Try to extract speed and ETA from the line
-                            status_msg = f"Downloading... {progress:.1f}%"
-
-                            # Look for speed (e.g., "1.23MiB/s" or "500.00KiB/s")
-                            speed_match = SPEED_REGEX.search(line)
-                            if speed_match:
-                                speed = speed_match.group(1)
-                                status_msg += f" at {speed}"
-
-                            # Look for ETA (e.g., "00:05" or "01:23:45")
-                            eta_match = ETA_REGEX.search(line)
-                            if eta_match:
-                                eta = eta_match.group(1)
-                                status_msg += f" | ETA: {eta}"
-
-                            self.update_status(status_msg, "blue")
-                            self.last_progress_time = time.time()  # Update progress timestamp
-                        elif 'Destination' in line:
-                            # yt-dlp is starting download
-                            self.update_status(tr('status_starting_download'), "blue")
-                            self.last_progress_time = time.time()
+                    if status == 'log':
+                        if event['level'] == 'error':
+                            error_lines.append(event['message'])
+                        logger.warning(f"yt-dlp: {event['message']}")
+
+                    elif status == 'downloading':
+                        if event['percent'] is None:
+                            continue
+                        progress = event['percent']
+                        self.update_progress(progress)
+
+                        status_msg = f"Downloading... {progress:.1f}%"
+                        if event['speed_str']:
+                            status_msg += f" at {event['speed_str']}"
+                        if event['eta_str']:
+                            status_msg += f" | ETA: {event['eta_str']}"
+
+                        self.update_status(status_msg, "blue")
+                        self.last_progress_time = time.time()  # Update progress timestamp
 
                     # Look for different download phases
-                    elif '[info]' in line and 'Downloading' in line:
-                        self.update_status(tr('status_preparing_download'), "blue")
-                        self.last_progress_time = time.time()
-                    elif '[ExtractAudio]' in line:
-                        self.update_status(tr('status_extracting_audio'), "blue")
-                        self.last_progress_time = time.time()
-                    elif '[Merger]' in line or 'Merging' in line:
-                        self.update_status(tr('status_merging'), "blue")
+                    elif status == 'starting':
+                        self.update_status(tr('status_starting_download'), "blue")
                         self.last_progress_time = time.time()
-                    elif '[ffmpeg]' in line:
-                        self.update_status(tr('status_processing_ffmpeg'), "blue")
+                    elif status == 'preparing':
+                        self.update_status(tr('status_preparing_download'), "blue")
                         self.last_progress_time = time.time()
-                    elif 'Post-processing' in line or 'Postprocessing' in line:
-                        self.update_status(tr('status_post_processing'), "blue")
+                    elif status == 'postprocessing':
+                        postprocessor = event['postprocessor']
+                        if postprocessor == 'ExtractAudio':
+                            self.update_status(tr('status_extracting_audio'), "blue")
+                        elif postprocessor == 'Merger':
+                            self.update_status(tr('status_merging'), "blue")
+                        elif postprocessor:
+                            self.update_status(tr('status_processing_ffmpeg'), "blue")
+                        else:
+                            self.update_status(tr('status_post_processing'), "blue")
                         self.last_progress_time = time.time()
-                    elif 'has already been downloaded' in line:
+                    elif status == 'already_downloaded':
                         self.update_status(tr('status_file_exists'), "orange")
                         self.last_progress_time = time.time()
+                    elif status == 'finished':
+                        self.last_progress_time = time.time()
             except (BrokenPipeError, IOError) as e:
                 if self.is_downloading:
                     logger.warning(f"Pipe error while reading process output: {e}")
@@ -3767,6 +4710,10 @@ class YouTubeDownloader:
                 latest_file = self._find_latest_file()
                 self._enable_upload_button(latest_file)
 
+                # Record it so the clipboard queue and later runs know it is done
+                trim_range = (start_time, end_time) if trim_enabled else (None, None)
+                self.download_archive.add(archive_key(extract_video_id(url), quality, *trim_range), latest_file)
+
             elif self.is_downloading:
                 self.update_status(tr('status_download_failed'), "red")
                 logger.error(f"Download failed with return code {self.current_process.returncode}")
@@ -3794,6 +4741,9 @@ class YouTubeDownloader:
                 logger.exception(f"Unexpected error during download: {e}")
 
         finally:
+            if bandwidth_job:
+                self.bandwidth.release(bandwidth_job)
+            self.job_journal.finish(journal_job)
             with self.download_lock:
                 self.is_downloading = False
             self.download_btn.config(state='normal')
@@ -3803,7 +4753,7 @@ class YouTubeDownloader:
     def download_local_file(self, filepath):
         """Process local video file with trimming, quality adjustment, and volume control"""
         try:
-            quality = self.quality_var.get()
+            quality = self._get_selected_quality()
             trim_enabled = self.trim_enabled_var.get()
             audio_only = quality.startswith("none")
 
@@ -3852,21 +4802,38 @@ class YouTubeDownloader:
                     output_name = f"{base_name}_processed"
 
             volume_multiplier = self.validate_volume(self.volume_var.get())
-
-            if audio_only:
+            fast_cut = self.fast_cut_var.get() and not audio_only
+            trim_start, trim_end = (start_time, end_time) if trim_enabled else (None, None)
+
+            smart_cut = None
+            parallel_segments = None
+            if fast_cut and trim_enabled:
+                smart_cut = self._plan_local_smart_cut(start_time, end_time)
+                if not smart_cut and self._fast_cut_needs_reencode(start_time):
+                    logger.info(f"{self.keyframe_stream.get('codec_name')} can't be smart-cut, re-encoding the clip")
+                    fast_cut = False
+
+            if smart_cut:
+                # Frame-accurate: only the boundary GOPs are re-encoded, see _smart_cut_local_file
+                output_file = os.path.join(self.download_path, f"{output_name}{Path(filepath).suffix or '.mp4'}")
+                cmd = None
+            elif fast_cut:
+                # Lossless stream copy in the original container and resolution (quality is ignored)
+                cut_start, cut_end = 0, None
+                if trim_enabled:
+                    cut_start, cut_end = start_time, end_time
+                    if self.keyframe_path == filepath:
+                        cut_start = snap_to_keyframe(self.keyframe_times, start_time)
+                    else:
+                        logger.info("Keyframe index not ready; ffmpeg will start at the previous keyframe")
+                output_file = os.path.join(self.download_path, f"{output_name}{Path(filepath).suffix or '.mp4'}")
+                cmd = build_fast_cut_command(self.ffmpeg_path, filepath, cut_start, cut_end, output_file,
+                                             volume=volume_multiplier)
+            elif audio_only:
                 # Extract audio only
                 output_file = os.path.join(self.download_path, f"{output_name}.mp3")
-                cmd = [self.ffmpeg_path, '-i', filepath]
-
-                if trim_enabled:
-                    cmd.extend(['-ss', str(start_time), '-to', str(end_time)])
-
-                cmd.extend(['-vn', '-c:a', 'libmp3lame', '-b:a', '128k'])
-
-                if volume_multiplier != 1.0:
-                    cmd.extend(['-af', f'volume={volume_multiplier}'])
-
-                cmd.extend(['-progress', 'pipe:1', '-y', output_file])
+                cmd = build_local_audio_command(self.ffmpeg_path, filepath, output_file,
+                                                start=trim_start, end=trim_end, volume=volume_multiplier)
             else:
                 # Video processing
                 if quality.startswith("none"):
@@ -3880,48 +4847,32 @@ class YouTubeDownloader:
                 height = quality
                 output_file = os.path.join(self.download_path, f"{output_name}.mp4")
 
-                cmd = [self.ffmpeg_path, '-i', filepath]
-
-                if trim_enabled:
-                    cmd.extend(['-ss', str(start_time), '-to', str(end_time)])
-
-                cmd.extend(['-vf', f'scale=-2:{height}', '-c:v', 'libx264', '-crf', str(VIDEO_CRF),
-                           '-preset', 'faster', '-c:a', 'aac', '-b:a', AUDIO_BITRATE])
-
-                if volume_multiplier != 1.0:
-                    cmd.extend(['-af', f'volume={volume_multiplier}'])
-
-                cmd.extend(['-progress', 'pipe:1', '-y', output_file])
-
-            logger.info(f"Processing local file: {' '.join(cmd)}")
-
-            # Execute ffmpeg
-            self.current_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                                     universal_newlines=True, bufsize=1)
-
-            # Parse ffmpeg progress
-            total_duration = self.video_duration if not trim_enabled else (end_time - start_time)
-
-            for line in self.current_process.stdout:
-                if not self.is_downloading:
-                    break
-
-                if 'out_time_ms=' in line:
-                    try:
-                        time_ms = int(line.split('=')[1].strip())
-                        current_time = time_ms / 1000000
-
-                        if total_duration > 0:
-                            progress = min(100, (current_time / total_duration) * 100)
-                            self.update_progress(progress)
-                            self.update_status(tr('status_processing', progress=f"{progress:.1f}"), "blue")
-                            self.last_progress_time = time.time()
-                    except (ValueError, IndexError):
-                        pass
+                copy_video = not trim_enabled and not self._local_needs_rescale(filepath, height)
+                if not copy_video:
+                    parallel_segments = self._plan_parallel_encode(filepath, trim_start or 0, trim_end)
 
-            self.current_process.wait()
+                if parallel_segments:
+                    # Long re-encode: one ffmpeg per keyframe-aligned segment, see _parallel_encode_local_file
+                    cmd = None
+                else:
+                    # copy_video: already at or below the selected height, so only the audio is re-encoded
+                    cmd = build_local_video_command(self.ffmpeg_path, filepath, output_file, height,
+                                                    start=trim_start, end=trim_end, volume=volume_multiplier,
+                                                    copy_video=copy_video)
+
+            if smart_cut:
+                logger.info(f"Smart cut of local file: {smart_cut}")
+                returncode, stderr = self._smart_cut_local_file(filepath, smart_cut, output_file, volume_multiplier)
+            elif parallel_segments:
+                logger.info(f"Parallel encode of local file in {len(parallel_segments)} segments")
+                returncode, stderr = self._parallel_encode_local_file(filepath, parallel_segments, height,
+                                                                      output_file, volume_multiplier)
+            else:
+                logger.info(f"Processing local file: {' '.join(cmd)}")
+                total_duration = self.video_duration if not trim_enabled else (end_time - start_time)
+                returncode, stderr = self._run_ffmpeg_progress(cmd, total_duration)
 
-            if self.current_process.returncode == 0 and self.is_downloading:
+            if returncode == 0 and self.is_downloading:
                 self.update_progress(100)
                 self.update_status(tr('status_processing_complete'), "green")
                 logger.info(f"Local file processed: {output_file}")
@@ -3930,7 +4881,6 @@ class YouTubeDownloader:
                 self._enable_upload_button(output_file)
 
             elif self.is_downloading:
-                stderr = self.current_process.stderr.read() if self.current_process.stderr else ""
                 self.update_status(tr('status_processing_failed'), "red")
                 logger.error(f"ffmpeg failed: {stderr}")
 
@@ -3949,129 +4899,261 @@ class YouTubeDownloader:
             self.stop_btn.config(state='disabled')
             self.current_process = None
 
-    def download_playlist(self, url):
-        """Download entire YouTube playlist with quality and volume settings"""
+    def _local_needs_rescale(self, filepath, height):
+        """Return False only if the probed video of filepath can be copied as-is into an MP4 of height."""
+        if self.keyframe_path != filepath or self.keyframe_stream.get('codec_name') not in MP4_COPY_CODECS:
+            return True
+        source_height = self.keyframe_stream.get('height')
         try:
-            quality = self.quality_var.get()
-            audio_only = quality.startswith("none")
-            volume_multiplier = self.validate_volume(self.volume_var.get())
+            return not source_height or int(source_height) > int(height)
+        except (TypeError, ValueError):
+            return True
 
-            # Check for custom filename
-            custom_name = self.sanitize_filename(self.filename_entry.get().strip())
-            if custom_name:
-                # Use custom name with playlist index: MyVideo-1, MyVideo-2, etc.
-                output_template = f'{custom_name}-%(playlist_index)s.%(ext)s'
-            else:
-                # Use default: index-title format
-                output_template = '%(playlist_index)s-%(title)s.%(ext)s'
+    def _plan_parallel_encode(self, filepath, start, end):
+        """Return keyframe-aligned segments for encoding filepath in parallel, or None.
 
-            self.update_status(tr('status_playlist_downloading'), "blue")
-            logger.info(f"Starting playlist download: {url}")
+        None means a single ffmpeg process is used: too few cores, no keyframe
+        index yet, or a range too short to be worth splitting.
 
-            if audio_only:
-                # Audio-only playlist
-                cmd = [
-                    self.ytdlp_path,
-                    '--concurrent-fragments', '5',  # Download fragments in parallel
-                    '--buffer-size', BUFFER_SIZE,  # Better buffering
-                    '--http-chunk-size', CHUNK_SIZE,  # Larger chunks = fewer requests
-                    '-f', 'bestaudio',
-                    '--extract-audio',
-                    '--audio-format', 'mp3',
-                    '--audio-quality', '128K',
-                    '--newline',
-                    '--progress',
-                    '-o', os.path.join(self.download_path, output_template),
-                ]
+        Args:
+            filepath: Local video file
+            start: Range start in seconds
+            end: Range end in seconds, or None for the end of the file
+        """
+        workers = (os.cpu_count() or 1) // PARALLEL_ENCODE_THREADS
+        if workers < 2 or self.keyframe_path != filepath or not self.keyframe_times:
+            return None
+        segments = plan_parallel_segments(self.keyframe_times, start, self.video_duration if end is None else end,
+                                          workers * PARALLEL_ENCODE_SEGMENTS_PER_WORKER)
+        if len(segments) < 2:
+            return None
+        if end is None:
+            # video_duration is whole seconds; let the last segment run to the real end of the file
+            segments[-1] = (segments[-1][0], None)
+        return segments
 
-                # Add volume filter
-                if volume_multiplier != 1.0:
-                    cmd.extend(['--postprocessor-args', f'ffmpeg:-af volume={volume_multiplier}'])
+    def _parallel_encode_local_file(self, filepath, segments, height, output_file, volume):
+        """Encode segments of filepath concurrently, then join them losslessly.
 
-                # Add speed limit if set
-                cmd.extend(self._get_speed_limit_args())
+        Each segment is scaled and encoded by its own ffmpeg process (a pool
+        sized to the CPU cores); their -progress output is summed into one
+        overall progress. The encoded parts are joined with the concat demuxer
+        and the audio is added in the same pass.
 
-                cmd.append(url)
+        Returns:
+            tuple: (returncode, stderr text) of the failing or last command
+        """
+        workers = max(1, min(len(segments), (os.cpu_count() or 1) // PARALLEL_ENCODE_THREADS))
+        start, end = segments[0][0], segments[-1][1]
+        total_duration = (self.video_duration if end is None else end) - start
+        encode_share = 100 / (1 + STREAM_COPY_PROGRESS_WEIGHT)  # The rest is the final join
+        encoder_args = ['-c:v', 'libx264', '-crf', str(VIDEO_CRF), '-preset', 'faster',
+                        '-threads', str(PARALLEL_ENCODE_THREADS)]
+
+        encoded = [0.0] * len(segments)  # Seconds encoded per segment
+        progress_lock = threading.Lock()
+        failed = threading.Event()
+        work_dir = tempfile.mkdtemp(prefix="parallel_", dir=self.temp_dir)
+        part_files = [os.path.join(work_dir, f"part{index}.mkv") for index in range(len(segments))]
+
+        def encode_segment(index):
+            if failed.is_set() or not self.is_downloading:
+                return None, ""
+            segment_start, segment_end = segments[index]
+            cmd = build_segment_command(self.ffmpeg_path, filepath, segment_start, segment_end, part_files[index],
+                                        encoder_args=encoder_args, video_filter=f'scale=-2:{height}')
+            try:
+                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                           universal_newlines=True, bufsize=1)
+            except OSError:
+                failed.set()
+                raise
+            with self.download_lock:
+                self.encode_processes.add(process)
+            try:
+                for line in process.stdout:
+                    if failed.is_set() or not self.is_downloading:
+                        self.safe_process_cleanup(process)
+                        break
+                    if 'out_time_ms=' in line:
+                        try:
+                            encoded_time = int(line.split('=')[1].strip()) / 1000000
+                        except (ValueError, IndexError):
+                            continue
+                        with progress_lock:
+                            encoded[index] = encoded_time
+                            progress = min(1.0, sum(encoded) / total_duration) * encode_share
+                        self.update_progress(progress)
+                        self.update_status(tr('status_processing', progress=f"{progress:.1f}"), "blue")
+                        self.last_progress_time = time.time()
+                process.wait()
+                stderr = process.stderr.read() if process.stderr else ""
+            finally:
+                with self.download_lock:
+                    self.encode_processes.discard(process)
+            if process.returncode != 0:
+                failed.set()  # Stop the other segments early
+            return process.returncode, stderr
 
-            else:
-                # Video playlist
-                if quality.startswith("none"):
-                    self.update_status(tr('error_select_quality'), "red")
-                    self.download_btn.config(state='normal')
-                    self.stop_btn.config(state='disabled')
-                    with self.download_lock:
-                        self.is_downloading = False
-                    return
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ytdl_encode") as pool:
+                results = list(pool.map(encode_segment, range(len(segments))))
+            if not self.is_downloading:
+                return None, ""
+            failures = [result for result in results if result[0] not in (0, None)]
+            if failures:
+                return failures[0]
+
+            list_path = os.path.join(work_dir, "parts.txt")
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write(build_concat_list(part_files))
+            cmd = build_concat_parts_command(self.ffmpeg_path, list_path, filepath, start, end,
+                                             output_file, volume=volume)
+            return self._run_ffmpeg_progress(cmd, total_duration, encode_share, 100)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
 
-                height = quality
-                cmd = [
-                    self.ytdlp_path,
-                    '--concurrent-fragments', '5',  # Download fragments in parallel
-                    '--buffer-size', BUFFER_SIZE,  # Better buffering
-                    '--http-chunk-size', CHUNK_SIZE,  # Larger chunks = fewer requests
-                    '-f', f'bestvideo[height<={height}]+bestaudio/best[height<={height}]',
-                    '--merge-output-format', 'mp4',
-                ]
+    def _run_ffmpeg_progress(self, cmd, duration, progress_start=0.0, progress_end=100.0):
+        """Run an ffmpeg command as the current process and report its -progress output.
 
-                # Build ffmpeg postprocessor args for video (only if volume changed)
-                if volume_multiplier != 1.0:
-                    # Need to re-encode for volume adjustment
-                    ffmpeg_video_args = ['-c:v', 'libx264', '-crf', str(VIDEO_CRF), '-preset', 'faster', '-c:a', 'aac', '-b:a', AUDIO_BITRATE]
-                    ffmpeg_video_args.extend(['-af', f'volume={volume_multiplier}'])
-                    cmd.extend(['--postprocessor-args', 'ffmpeg:' + ' '.join(ffmpeg_video_args)])
+        Args:
+            cmd: ffmpeg command writing progress to stdout (-progress pipe:1)
+            duration: Output duration in seconds, for the progress percentage
+            progress_start: Overall progress when this command starts
+            progress_end: Overall progress when this command finishes
 
-                # Add speed limit if set
-                cmd.extend(self._get_speed_limit_args())
+        Returns:
+            tuple: (returncode, stderr text)
+        """
+        self.current_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                                universal_newlines=True, bufsize=1)
 
-                cmd.extend([
-                    '--newline',
-                    '--progress',
-                    '-o', os.path.join(self.download_path, output_template),
-                    url
-                ])
+        for line in self.current_process.stdout:
+            if not self.is_downloading:
+                break
 
-            logger.info(f"Playlist download command: {' '.join(cmd)}")
+            if 'out_time_ms=' in line:
+                try:
+                    time_ms = int(line.split('=')[1].strip())
+                    current_time = time_ms / 1000000
+
+                    if duration > 0:
+                        fraction = min(1.0, current_time / duration)
+                        progress = progress_start + (progress_end - progress_start) * fraction
+                        self.update_progress(progress)
+                        self.update_status(tr('status_processing', progress=f"{progress:.1f}"), "blue")
+                        self.last_progress_time = time.time()
+                except (ValueError, IndexError):
+                    pass
 
-            # Execute yt-dlp
-            self.current_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                                     universal_newlines=True, bufsize=1)
+        self.current_process.wait()
+        stderr = self.current_process.stderr.read() if self.current_process.stderr else ""
+        return self.current_process.returncode, stderr
 
-            # Parse yt-dlp output
-            for line in self.current_process.stdout:
-                if not self.is_downloading:
-                    break
+    def _smart_cut_local_file(self, filepath, parts, output_file, volume):
+        """Frame-accurate trim that re-encodes only the boundary GOPs.
 
-                logger.debug(f"yt-dlp output: {line.strip()}")
-
-                # Parse progress
-                if '[download]' in line and '%' in line:
-                    try:
-                        # Extract percentage
-                        match = PROGRESS_REGEX.search(line)
-                        if match:
-                            progress = float(match.group(1))
-                            self.update_progress(progress)
-                            self.last_progress_time = time.time()
-
-                            # Extract current file info
-                            if 'Downloading item' in line:
-                                self.update_status(line.strip(), "blue")
-                            else:
-                                self.update_status(tr('status_downloading_playlist', progress=f"{progress:.1f}"), "blue")
-                    except (ValueError, AttributeError):
-                        pass
+        Each part from _plan_local_smart_cut is written to its own file (the
+        boundary parts re-encoded with the source codec, the middle stream-copied),
+        then the parts are joined with the concat demuxer and the audio is added.
 
-            self.current_process.wait()
+        Returns:
+            tuple: (returncode, stderr text) of the last command run
+        """
+        encoder_args = SMART_CUT_ENCODERS[self.keyframe_stream['codec_name']]
+        pix_fmt = self.keyframe_stream.get('pix_fmt')
+        start, end = parts[0][1], parts[-1][2]
 
-            if self.current_process.returncode == 0 and self.is_downloading:
+        # Progress is weighted by work: copying and the final join are far cheaper than encoding
+        weights = [(part_end - part_start) * (1.0 if mode == 'encode' else STREAM_COPY_PROGRESS_WEIGHT)
+                   for mode, part_start, part_end in parts]
+        weights.append((end - start) * STREAM_COPY_PROGRESS_WEIGHT)
+        total_weight = sum(weights) or 1.0
+
+        work_dir = tempfile.mkdtemp(prefix="smartcut_", dir=self.temp_dir)
+        try:
+            part_files = []
+            done = 0.0
+            for index, (mode, part_start, part_end) in enumerate(parts):
+                part_file = os.path.join(work_dir, f"part{index}.mkv")
+                cmd = build_segment_command(self.ffmpeg_path, filepath, part_start, part_end, part_file,
+                                            encoder_args=encoder_args if mode == 'encode' else None, pix_fmt=pix_fmt)
+                returncode, stderr = self._run_ffmpeg_progress(
+                    cmd, part_end - part_start,
+                    done / total_weight * 100, (done + weights[index]) / total_weight * 100)
+                if returncode != 0 or not self.is_downloading:
+                    return returncode, stderr
+                part_files.append(part_file)
+                done += weights[index]
+
+            list_path = os.path.join(work_dir, "parts.txt")
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write(build_concat_list(part_files))
+            cmd = build_concat_parts_command(self.ffmpeg_path, list_path, filepath, start, end,
+                                             output_file, volume=volume)
+            return self._run_ffmpeg_progress(cmd, end - start, done / total_weight * 100, 100)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def download_playlist(self, url):
+        """Download entire YouTube playlist with quality and volume settings.
+
+        The playlist is listed first, then its entries are downloaded in
+        parallel, each with its own retries (see _download_playlist_entries).
+        """
+        try:
+            quality = self._get_selected_quality()
+            audio_only = quality.startswith("none")
+            volume_multiplier = self.validate_volume(self.volume_var.get())
+
+            # Check for custom filename
+            custom_name = self.sanitize_filename(self.filename_entry.get().strip())
+
+            def build_command(entry):
+                if custom_name:
+                    # Use custom name with playlist index: MyVideo-1, MyVideo-2, etc.
+                    output_template = f"{custom_name}-{entry['index']}.%(ext)s"
+                else:
+                    # Use default: index-title format
+                    output_template = f"{entry['index']}-%(title)s.%(ext)s"
+                output_path = os.path.join(self.download_path, output_template)
+                if audio_only:
+                    cmd = self.build_audio_ytdlp_command(entry['url'], output_path, volume=volume_multiplier)
+                else:
+                    cmd = self.build_video_ytdlp_command(entry['url'], output_path, quality,
+                                                         volume=volume_multiplier)
+                cmd.insert(1, '--no-playlist')
+                return cmd
+
+            def on_update(runner, entry):
+                self.last_progress_time = time.time()
+                self.update_progress(runner.overall_progress())
+                self.update_status(self._playlist_status(runner), "blue")
+
+            self.update_status(tr('status_playlist_listing'), "blue")
+            logger.info(f"Starting playlist download: {url}")
+
+            runner = self._download_playlist_entries(
+                url, build_command, quality, PLAYLIST_WORKERS, lambda: not self.is_downloading, on_update,
+                processes=self.playlist_processes, sync=self.playlist_sync_var.get(),
+                stop_early=self.playlist_sync_stop_early_var.get())
+
+            counts = runner.counts()
+            if self.is_downloading and counts.get(ENTRY_FAILED):
+                self.update_status(tr('status_playlist_partial', completed=counts.get(ENTRY_COMPLETED, 0),
+                                      failed=counts[ENTRY_FAILED]), "orange")
+                logger.error(f"Playlist download: {counts[ENTRY_FAILED]} entries failed: {url}")
+            elif self.is_downloading:
                 self.update_progress(100)
-                self.update_status(tr('status_playlist_complete'), "green")
+                self.update_status(tr('status_playlist_complete' if runner.entries else 'status_playlist_up_to_date'),
+                                   "green")
                 logger.info(f"Playlist downloaded successfully: {url}")
                 # Note: Upload is disabled for playlists
-            elif self.is_downloading:
-                self.update_status(tr('status_playlist_failed'), "red")
-                logger.error(f"Playlist download failed with return code {self.current_process.returncode}")
 
+        except YtDlpError as e:
+            if self.is_downloading:
+                self.update_status(tr('status_playlist_failed'), "red")
+                logger.error(f"Playlist listing failed: {e}")
         except FileNotFoundError as e:
             if self.is_downloading:
                 self.update_status(tr('error_ytdlp_not_found'), "red")
@@ -4088,17 +5170,27 @@ class YouTubeDownloader:
             self.current_process = None
 
     def update_progress(self, value):
-        """Update main progress bar with validation"""
+        """Update main progress bar with validation (thread-safe, applied on the next UI tick)"""
         try:
             value = float(value)
             value = max(0, min(100, value))  # Clamp to 0-100
-            self.progress['value'] = value
-            self.progress_label.config(text=f"{value:.1f}%")
         except (ValueError, TypeError) as e:
             logger.warning(f"Invalid progress value: {value} - {e}")
+            return
+        self.ui_events.publish('progress', self._show_progress, value)
+
+    def _show_progress(self, value):
+        self.progress['value'] = value
+        self.progress_label.config(text=f"{value:.1f}%")
 
     def update_status(self, message, color):
-        self.status_label.config(text=message, foreground=color)
+        """Update the Trimmer status label (thread-safe, applied on the next UI tick)"""
+        self.ui_events.publish('status', self.status_label.config, {'text': message, 'foreground': color})
+
+    def _drain_ui_events(self):
+        """Apply the latest published update of each widget, then schedule the next tick (main thread)"""
+        self.ui_events.drain()
+        self.ui_events_after_id = self.root.after(UI_EVENT_INTERVAL_MS, self._drain_ui_events)
 
     def cleanup_temp_files(self):
         """Clean up temporary preview files"""
@@ -4116,6 +5208,14 @@ class YouTubeDownloader:
         """Handle window close event with proper resource cleanup"""
         logger.info("Application shutdown initiated...")
 
+        # Close the job journal first: downloads torn down below stay journaled and resume next start
+        self.job_journal.close()
+
+        # Stop applying worker updates; the widgets are about to be destroyed
+        if self.ui_events_after_id:
+            self.root.after_cancel(self.ui_events_after_id)
+            self.ui_events_after_id = None
+
         # Save clipboard URLs before shutdown
         try:
             self._save_clipboard_urls()
@@ -4134,11 +5234,14 @@ class YouTubeDownloader:
         # Stop any ongoing downloads gracefully
         with self.download_lock:
             process_to_cleanup = self.current_process
+            encode_processes = list(self.encode_processes) + list(self.playlist_processes)
             is_active = self.is_downloading
 
         if is_active and process_to_cleanup:
             logger.info("Terminating active download process...")
             self.safe_process_cleanup(process_to_cleanup)
+        for process in encode_processes:
+            self.safe_process_cleanup(process)
 
         # Clean up temp files
         try:
@@ -4146,6 +5249,19 @@ class YouTubeDownloader:
         except Exception as e:
             logger.error(f"Error cleaning temp files: {e}")
 
+        # Stop the filmstrip pass and pending preview extractions
+        self._cancel_filmstrip()
+        self.filmstrip_pool.shutdown(wait=False, cancel_futures=True)
+        self.preview_pool.shutdown(wait=False, cancel_futures=True)
+        self.clipboard_pool.shutdown(wait=False, cancel_futures=True)
+
+        # Close persistent caches
+        self.metadata_prefetcher.shutdown()
+        self.metadata_cache.close()
+        self.preview_cache.close()
+        self.download_archive.close()
+        self.playlist_sync.close()
+
         # Shutdown thread pool gracefully with timeout
         logger.info("Shutting down thread pool...")
         try:
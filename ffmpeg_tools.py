@@ -0,0 +1,469 @@
+"""YoutubeDownloader ffmpeg Tools Module
+
+Pure builders for ffmpeg command lines used by the app. Kept free of Tk
+state so they can be unit tested and reused (e.g. by benchmarks).
+"""
+import bisect
+import json
+
+from constants import AUDIO_BITRATE, VIDEO_CRF, KEYFRAME_SNAP_TOLERANCE, PARALLEL_ENCODE_MIN_SEGMENT
+
+# Input options for reading YouTube streams over HTTP
+HTTP_INPUT_ARGS = [
+    '-reconnect', '1',
+    '-reconnect_streamed', '1',
+    '-reconnect_delay_max', '5',
+    '-timeout', '10000000',  # 10 second timeout in microseconds
+]
+
+# libx264 preset for local re-encodes (speed over size; see benchmark.py to compare)
+LOCAL_ENCODE_PRESET = 'faster'
+
+# JPEG quality (2-31, lower is better) for small preview frames
+PREVIEW_JPEG_QUALITY = '3'
+
+# Encoders for the re-encoded boundary parts of a smart cut, by source codec.
+# They must produce the source codec so the parts can be concatenated losslessly;
+# quality is set high since these few seconds sit next to untouched footage.
+# Only codecs whose copied packets decode without the encoder's extradata are
+# listed: the concat demuxer re-inserts parameter sets in-band for H.264 only,
+# and VP9 keyframes carry their own headers. HEVC and MPEG-4 Part 2 parts would
+# be decoded against the first part's VPS/SPS/PPS or VOL, so those are re-encoded.
+SMART_CUT_ENCODERS = {
+    'h264': ['-c:v', 'libx264', '-preset', 'faster', '-crf', '18'],
+    'vp9': ['-c:v', 'libvpx-vp9', '-crf', '24', '-b:v', '0', '-row-mt', '1'],
+}
+
+# Video codecs that can be stream-copied into an MP4 container
+MP4_COPY_CODECS = ('h264', 'hevc', 'av1', 'mpeg4')
+
+
+def build_trim_input_args(source, start=None, end=None):
+    """Return the input options for reading [start, end) of source.
+
+    The seek goes before -i (input side), so ffmpeg jumps to the nearest
+    keyframe instead of decoding everything before start. When transcoding,
+    ffmpeg still decodes from that keyframe and drops frames up to start, so
+    the cut is frame-accurate. The end becomes a duration (-t), because output
+    timestamps start at zero after an input-side seek.
+
+    Args:
+        source: Input file
+        start: Start in seconds, or None for the whole file
+        end: End in seconds (used together with start)
+
+    Returns:
+        list: ffmpeg options ending with "-i source"
+    """
+    if start is None or end is None:
+        return ['-i', source]
+    return ['-ss', str(start), '-i', source, '-t', str(max(0, end - start))]
+
+
+def build_local_audio_command(ffmpeg_path, source, output_path, start=None, end=None, volume=1.0):
+    """Build the MP3 extraction command for a local file.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        source: Local media file
+        output_path: MP3 file to write
+        start: Trim start in seconds, or None for the whole file
+        end: Trim end in seconds (used together with start)
+        volume: Volume multiplier
+
+    Returns:
+        list: ffmpeg command reporting progress on stdout (-progress pipe:1)
+    """
+    cmd = [ffmpeg_path]
+    cmd.extend(build_trim_input_args(source, start, end))
+    cmd.extend(['-vn', '-c:a', 'libmp3lame', '-b:a', AUDIO_BITRATE])
+    if volume != 1.0:
+        cmd.extend(['-af', f'volume={volume}'])
+    cmd.extend(['-progress', 'pipe:1', '-y', output_path])
+    return cmd
+
+
+def build_local_video_command(ffmpeg_path, source, output_path, height, start=None, end=None, volume=1.0,
+                              copy_video=False, preset=LOCAL_ENCODE_PRESET):
+    """Build the single-process MP4 command for a local file.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        source: Local video file
+        output_path: MP4 file to write
+        height: Output height (the video is scaled to it)
+        start: Trim start in seconds, or None for the whole file
+        end: Trim end in seconds (used together with start)
+        volume: Volume multiplier
+        copy_video: Keep the video stream as-is (no scaling), re-encode audio only
+        preset: libx264 preset
+
+    Returns:
+        list: ffmpeg command reporting progress on stdout (-progress pipe:1)
+    """
+    cmd = [ffmpeg_path]
+    cmd.extend(build_trim_input_args(source, start, end))
+    if copy_video:
+        cmd.extend(['-map', '0:v:0', '-map', '0:a?', '-c:v', 'copy', '-c:a', 'aac', '-b:a', AUDIO_BITRATE])
+    else:
+        cmd.extend(['-vf', f'scale=-2:{height}', '-c:v', 'libx264', '-crf', str(VIDEO_CRF),
+                    '-preset', preset, '-c:a', 'aac', '-b:a', AUDIO_BITRATE])
+    if volume != 1.0:
+        cmd.extend(['-af', f'volume={volume}'])
+    cmd.extend(['-progress', 'pipe:1', '-y', output_path])
+    return cmd
+
+
+def build_preview_frame_command(ffmpeg_path, source, timestamp, width, height):
+    """Build a command that writes one frame, scaled by ffmpeg, as JPEG to stdout.
+
+    The frame is scaled inside ffmpeg to fit width x height and written over
+    a pipe, so no temp file or full-resolution decode in Python is needed.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        source: Local file path or direct http(s) stream URL
+        timestamp: Position in seconds (input-side seek)
+        width: Maximum frame width
+        height: Maximum frame height
+
+    Returns:
+        list: ffmpeg command (JPEG bytes on stdout)
+    """
+    cmd = [ffmpeg_path, '-nostdin', '-hide_banner', '-loglevel', 'error']
+    if source.startswith('http'):
+        cmd.extend(HTTP_INPUT_ARGS)
+    cmd.extend([
+        '-ss', str(timestamp),
+        '-i', source,
+        '-frames:v', '1',
+        '-an', '-sn',
+        '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease',
+        '-f', 'image2pipe',
+        '-c:v', 'mjpeg',
+        '-q:v', PREVIEW_JPEG_QUALITY,
+        'pipe:1',
+    ])
+    return cmd
+
+
+def build_keyframe_probe_command(ffprobe_path, path):
+    """Build an ffprobe command listing the video packets of a local file.
+
+    Only packet headers are read (no decoding), so even long files are
+    indexed in a few seconds. Output lines look like "12.345000,K__".
+
+    Args:
+        ffprobe_path: ffprobe executable
+        path: Local video file
+
+    Returns:
+        list: ffprobe command (CSV on stdout)
+    """
+    return [
+        ffprobe_path,
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0',
+        path,
+    ]
+
+
+def parse_keyframe_times(output):
+    """Parse build_keyframe_probe_command output into sorted keyframe times.
+
+    Args:
+        output: ffprobe stdout
+
+    Returns:
+        list: Keyframe timestamps in seconds, ascending and unique
+    """
+    times = set()
+    for line in output.splitlines():
+        parts = line.strip().split(',')
+        if len(parts) < 2 or not parts[1].startswith('K'):
+            continue
+        try:
+            times.add(float(parts[0]))
+        except ValueError:
+            continue  # pts_time is "N/A" for some packets
+    return sorted(times)
+
+
+def snap_to_keyframe(keyframes, timestamp, tolerance=KEYFRAME_SNAP_TOLERANCE):
+    """Return the last keyframe at or before timestamp.
+
+    A stream-copy cut can only start on a keyframe, so this is where a fast
+    cut requested at timestamp really begins. Keyframes up to `tolerance`
+    seconds after timestamp count as "at" it (slider values are whole seconds).
+
+    Args:
+        keyframes: Sorted keyframe times (see parse_keyframe_times)
+        timestamp: Requested cut point in seconds
+        tolerance: Slack for keyframes just after timestamp
+
+    Returns:
+        float: Keyframe time, or timestamp itself if no keyframe index is known
+    """
+    if not keyframes:
+        return timestamp
+    index = bisect.bisect_right(keyframes, timestamp + tolerance)
+    if index == 0:
+        return keyframes[0]
+    return keyframes[index - 1]
+
+
+def is_keyframe_aligned(keyframes, timestamp, tolerance=KEYFRAME_SNAP_TOLERANCE):
+    """Return True if a fast cut starting at timestamp would start exactly there."""
+    return abs(snap_to_keyframe(keyframes, timestamp, tolerance) - timestamp) <= tolerance
+
+
+def build_fast_cut_command(ffmpeg_path, source, start, end, output_path, volume=1.0):
+    """Build a lossless trim command: stream copy with input-side seek.
+
+    With input-side -ss and -c copy, ffmpeg starts at the keyframe at or
+    before `start` and copies packets without decoding, so the cut takes
+    seconds and keeps the original quality and resolution. Pass a start from
+    snap_to_keyframe to make the output begin exactly where requested.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        source: Local video file
+        start: Cut start in seconds (ideally a keyframe)
+        end: Cut end in seconds, or None to copy to the end of the file
+        output_path: Output file (same container as source is safest)
+        volume: Volume multiplier; anything but 1.0 re-encodes the audio only (Opus for
+            WebM output, AAC otherwise)
+
+    Returns:
+        list: ffmpeg command reporting progress on stdout (-progress pipe:1)
+    """
+    cmd = [
+        ffmpeg_path, '-nostdin', '-hide_banner', '-nostats', '-loglevel', 'error',
+        '-ss', f"{start:.3f}",
+        '-i', source,
+    ]
+    if end is not None:
+        cmd.extend(['-t', f"{max(0.0, end - start):.3f}"])
+    cmd.extend(['-map', '0:v:0', '-map', '0:a?'])
+    if volume != 1.0:
+        # WebM only takes Opus/Vorbis audio
+        audio_codec = 'libopus' if str(output_path).lower().endswith('.webm') else 'aac'
+        cmd.extend(['-c:v', 'copy', '-c:a', audio_codec, '-b:a', AUDIO_BITRATE, '-af', f'volume={volume}'])
+    else:
+        cmd.extend(['-c', 'copy'])
+    cmd.extend([
+        '-avoid_negative_ts', 'make_zero',
+        '-progress', 'pipe:1',
+        '-y', output_path,
+    ])
+    return cmd
+
+
+def build_video_stream_probe_command(ffprobe_path, path):
+    """Build an ffprobe command describing the first video stream (codec, pixel format, height) as JSON."""
+    return [
+        ffprobe_path,
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=codec_name,pix_fmt,height',
+        '-of', 'json',
+        path,
+    ]
+
+
+def parse_video_stream(output):
+    """Parse build_video_stream_probe_command output.
+
+    Returns:
+        dict: e.g. {'codec_name': 'h264', 'pix_fmt': 'yuv420p', 'height': 1080}, empty if unknown
+    """
+    try:
+        streams = json.loads(output).get('streams') or []
+    except (ValueError, AttributeError):
+        return {}
+    return streams[0] if streams and isinstance(streams[0], dict) else {}
+
+
+def plan_smart_cut(keyframes, start, end, tolerance=KEYFRAME_SNAP_TOLERANCE):
+    """Split a cut into re-encoded boundary parts and a stream-copied middle.
+
+    Only the part from `start` to the next keyframe and the part from the last
+    keyframe to `end` are re-encoded; everything between keyframes is copied.
+    Cut points within `tolerance` of a keyframe need no re-encoding.
+
+    Args:
+        keyframes: Sorted keyframe times (see parse_keyframe_times)
+        start: Cut start in seconds
+        end: Cut end in seconds
+
+    Returns:
+        list: (mode, part_start, part_end) tuples in order, mode 'encode' or 'copy'
+
+    Raises:
+        ValueError: If end is not after start
+    """
+    if end <= start:
+        raise ValueError(f"Invalid cut range: {start}-{end}")
+
+    first = bisect.bisect_left(keyframes, start - tolerance)
+    last = bisect.bisect_right(keyframes, end + tolerance) - 1
+    if first >= len(keyframes) or last < first:
+        return [('encode', start, end)]
+
+    copy_start = keyframes[first]
+    copy_end = keyframes[last]
+    head_aligned = abs(copy_start - start) <= tolerance
+    tail_aligned = abs(copy_end - end) <= tolerance
+    if tail_aligned:
+        copy_end = end
+    if copy_end - copy_start <= tolerance:
+        return [('encode', start, end)]
+
+    parts = []
+    if not head_aligned:
+        parts.append(('encode', start, copy_start))
+    parts.append(('copy', copy_start, copy_end))
+    if not tail_aligned:
+        parts.append(('encode', copy_end, end))
+    return parts
+
+
+def plan_parallel_segments(keyframes, start, end, count, min_length=PARALLEL_ENCODE_MIN_SEGMENT):
+    """Split [start, end) at keyframes into up to `count` segments of similar length.
+
+    Every segment but the first starts on a keyframe, so each encoder's
+    input-side seek lands exactly there without decoding earlier frames.
+
+    Args:
+        keyframes: Sorted keyframe times (see parse_keyframe_times)
+        start: Range start in seconds
+        end: Range end in seconds
+        count: Desired number of segments (e.g. worker count)
+        min_length: Shortest segment worth a separate encoder process
+
+    Returns:
+        list: (segment_start, segment_end) tuples covering [start, end) in order
+    """
+    count = min(count, int((end - start) // min_length))
+    bounds = [start]
+    for index in range(1, count):
+        keyframe = snap_to_keyframe(keyframes, start + (end - start) * index / count, tolerance=0)
+        if keyframe - bounds[-1] >= min_length / 2 and end - keyframe >= min_length / 2:
+            bounds.append(keyframe)
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:]))
+
+
+def build_segment_command(ffmpeg_path, source, start, end, output_path, encoder_args=None, pix_fmt=None,
+                          video_filter=None):
+    """Build a command writing the video of [start, end) of source to output_path.
+
+    Times are passed with microsecond precision (as reported by ffprobe), so
+    consecutive parts meeting at a keyframe neither drop nor repeat a frame.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        source: Local video file
+        start: Part start in seconds (a keyframe when stream-copying)
+        end: Part end in seconds, or None for the end of the file
+        output_path: Part file (Matroska works for every codec)
+        encoder_args: Encoder options (see SMART_CUT_ENCODERS), or None to stream-copy
+        pix_fmt: Pixel format to keep when re-encoding
+        video_filter: Optional -vf filter when re-encoding (e.g. scaling)
+
+    Returns:
+        list: ffmpeg command reporting progress on stdout (-progress pipe:1)
+    """
+    cmd = [
+        ffmpeg_path, '-nostdin', '-hide_banner', '-nostats', '-loglevel', 'error',
+        '-ss', f"{start:.6f}",
+        '-i', source,
+    ]
+    if end is not None:
+        cmd.extend(['-t', f"{max(0.0, end - start):.6f}"])
+    cmd.extend(['-map', '0:v:0', '-an', '-sn', '-dn'])
+    if encoder_args:
+        if video_filter:
+            cmd.extend(['-vf', video_filter])
+        cmd.extend(encoder_args)
+        if pix_fmt:
+            cmd.extend(['-pix_fmt', pix_fmt])
+    else:
+        cmd.extend(['-c:v', 'copy', '-avoid_negative_ts', 'make_zero'])
+    cmd.extend(['-progress', 'pipe:1', '-y', output_path])
+    return cmd
+
+
+def build_concat_list(paths):
+    """Return the contents of an ffmpeg concat demuxer list for paths."""
+    lines = []
+    for path in paths:
+        escaped = str(path).replace("'", "'\\''")
+        lines.append(f"file '{escaped}'")
+    return '\n'.join(lines) + '\n'
+
+
+def build_concat_parts_command(ffmpeg_path, list_path, source, start, end, output_path, volume=1.0):
+    """Join the video parts losslessly and add the audio of [start, end) from source.
+
+    Used for smart cuts and segment-parallel encodes. Audio is re-encoded
+    (cheap) so it is cut at exactly the same points as the frame-accurate
+    video; a stream-copied audio seek would start at the previous keyframe.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        list_path: Concat list file (see build_concat_list)
+        source: Local video file the parts were cut from
+        start: Cut start in seconds
+        end: Cut end in seconds, or None for the end of the file
+        output_path: Output file
+        volume: Volume multiplier for the audio
+
+    Returns:
+        list: ffmpeg command reporting progress on stdout (-progress pipe:1)
+    """
+    audio_codec = 'libopus' if str(output_path).lower().endswith('.webm') else 'aac'
+    cmd = [
+        ffmpeg_path, '-nostdin', '-hide_banner', '-nostats', '-loglevel', 'error',
+        '-f', 'concat', '-safe', '0', '-i', list_path,
+        '-ss', f"{start:.6f}",
+    ]
+    if end is not None:
+        cmd.extend(['-t', f"{max(0.0, end - start):.6f}"])
+    cmd.extend([
+        '-i', source,
+        '-map', '0:v:0', '-map', '1:a?',
+        '-c:v', 'copy',
+        '-c:a', audio_codec, '-b:a', AUDIO_BITRATE,
+    ])
+    if volume != 1.0:
+        cmd.extend(['-af', f'volume={volume}'])
+    cmd.extend(['-progress', 'pipe:1', '-y', output_path])
+    return cmd
+
+
+def build_postprocessor_args(volume=1.0, reencode_video=False):
+    """Return the ffmpeg options for yt-dlp's --postprocessor-args ("ffmpeg:" + joined).
+
+    The video stream is only re-encoded when reencode_video is set (cuts
+    that must be frame-accurate); a volume change alone re-encodes just the
+    audio and copies the video stream.
+
+    Args:
+        volume: Volume multiplier
+        reencode_video: Re-encode the video with libx264
+
+    Returns:
+        list: ffmpeg options, empty if the downloaded streams can be used as-is
+    """
+    if reencode_video:
+        args = ['-c:v', 'libx264', '-crf', str(VIDEO_CRF), '-preset', 'faster', '-c:a', 'aac', '-b:a', AUDIO_BITRATE]
+    elif volume != 1.0:
+        args = ['-c:v', 'copy', '-c:a', 'aac', '-b:a', AUDIO_BITRATE]
+    else:
+        return []
+    if volume != 1.0:
+        args.extend(['-af', f'volume={volume}'])
+    return args
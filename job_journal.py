@@ -0,0 +1,199 @@
+"""YoutubeDownloader Job Journal Module
+
+Crash-safe record (SQLite under APP_DATA_DIR) of every yt-dlp download while
+it runs: its kind, URL, full command, output path, phase and bytes done. A
+job's row is removed when it completes, fails or is stopped by the user, so
+rows left at startup belong to downloads interrupted by a crash or by closing
+the app. Those are re-run with the same command plus `--continue`, which makes
+yt-dlp resume from its .part files.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from constants import JOB_JOURNAL_FILE, JOB_JOURNAL_PROGRESS_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# Phases of a running job, in order
+JOB_PHASES = ('queued', 'extracting', 'downloading', 'merging', 'postprocessing')
+
+
+def phase_for_event(event):
+    """Return the journal phase a yt-dlp engine event moves a job into, or None."""
+    status = event.get('status')
+    if status == 'preparing':
+        return 'extracting'
+    if status in ('starting', 'downloading', 'playlist_item'):
+        return 'downloading'
+    if status == 'postprocessing':
+        return 'merging' if event.get('postprocessor') == 'Merger' else 'postprocessing'
+    return None
+
+
+def resume_command(cmd, ytdlp_path):
+    """Return a journaled command ready to re-run: current executable and --continue.
+
+    Args:
+        cmd: Command recorded by the journal
+        ytdlp_path: yt-dlp executable of this session (it may have moved since)
+    """
+    args = [arg for arg in cmd[1:] if arg not in ('--continue', '--no-continue', '-c')]
+    return [ytdlp_path, '--continue'] + args
+
+
+class JobJournal:
+    """SQLite journal of running downloads.
+
+    Like the caches, database errors are logged and never raised. After
+    close() all writes are ignored, so downloads torn down during shutdown
+    stay in the journal and are resumed next time.
+    """
+
+    def __init__(self, db_path=JOB_JOURNAL_FILE, progress_interval=JOB_JOURNAL_PROGRESS_INTERVAL):
+        """
+        Args:
+            db_path: SQLite file of the journal
+            progress_interval: Minimum seconds between bytes-done writes of one job
+        """
+        self.db_path = str(db_path)
+        self.progress_interval = progress_interval
+        self.phases = {}  # {job_id: last written phase}
+        self.last_progress_write = {}  # {job_id: time of last bytes write}
+        self.lock = threading.Lock()
+        self.conn = None
+
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'kind TEXT NOT NULL, '
+                'url TEXT NOT NULL, '
+                'cmd TEXT NOT NULL, '
+                'output_path TEXT, '
+                'phase TEXT NOT NULL, '
+                'downloaded_bytes INTEGER, '
+                'total_bytes INTEGER, '
+                'created_at REAL NOT NULL, '
+                'updated_at REAL NOT NULL)'
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Job journal unavailable ({self.db_path}): {e}")
+            self.conn = None
+
+    def _write(self, sql, params):
+        """Run one statement and commit it; returns the cursor or None (lock held by caller)."""
+        if self.conn is None:
+            return None
+        cursor = self.conn.execute(sql, params)
+        self.conn.commit()
+        return cursor
+
+    def start(self, kind, url, cmd, output_path=None):
+        """Record a job that is about to start.
+
+        Args:
+            kind: 'trimmer', 'clipboard', 'playlist_entry' or (older sessions) 'playlist'
+            url: URL being downloaded
+            cmd: Full yt-dlp command
+            output_path: Output path or yt-dlp output template
+
+        Returns:
+            int: Job ID, or None if the journal is unavailable
+        """
+        now = time.time()
+        try:
+            with self.lock:
+                cursor = self._write(
+                    'INSERT INTO jobs (kind, url, cmd, output_path, phase, created_at, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (kind, url, json.dumps(cmd), output_path, JOB_PHASES[0], now, now)
+                )
+            return cursor.lastrowid if cursor else None
+        except sqlite3.Error as e:
+            logger.warning(f"Job journal write failed for {url}: {e}")
+            return None
+
+    def record_event(self, job_id, event):
+        """Update phase, bytes done and output file of a job from a yt-dlp engine event.
+
+        Bytes are written at most every progress_interval seconds per job;
+        phase changes are always written.
+        """
+        if job_id is None:
+            return
+        phase = phase_for_event(event)
+        now = time.time()
+        try:
+            with self.lock:
+                if event.get('status') == 'downloading' and event.get('downloaded_bytes') is not None:
+                    if now - self.last_progress_write.get(job_id, 0) >= self.progress_interval:
+                        self.last_progress_write[job_id] = now
+                        self.phases[job_id] = phase
+                        self._write(
+                            'UPDATE jobs SET phase = ?, downloaded_bytes = ?, total_bytes = ?, updated_at = ? '
+                            'WHERE id = ?',
+                            (phase, event['downloaded_bytes'], event.get('total_bytes'), now, job_id)
+                        )
+                    return
+                if event.get('status') == 'finished' and event.get('filename'):
+                    self._write('UPDATE jobs SET output_path = ?, updated_at = ? WHERE id = ?',
+                                (event['filename'], now, job_id))
+                elif phase and phase != self.phases.get(job_id):
+                    self.phases[job_id] = phase
+                    self._write('UPDATE jobs SET phase = ?, updated_at = ? WHERE id = ?', (phase, now, job_id))
+        except sqlite3.Error as e:
+            logger.warning(f"Job journal update failed for job {job_id}: {e}")
+
+    def finish(self, job_id):
+        """Remove a job that completed, failed or was stopped by the user."""
+        if job_id is None:
+            return
+        try:
+            with self.lock:
+                self.phases.pop(job_id, None)
+                self.last_progress_write.pop(job_id, None)
+                self._write('DELETE FROM jobs WHERE id = ?', (job_id,))
+        except sqlite3.Error as e:
+            logger.warning(f"Job journal delete failed for job {job_id}: {e}")
+
+    def unfinished(self):
+        """Return the interrupted jobs, oldest first.
+
+        Returns:
+            list: Dicts with id, kind, url, cmd, output_path, phase, downloaded_bytes, total_bytes
+        """
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return []
+                rows = self.conn.execute(
+                    'SELECT id, kind, url, cmd, output_path, phase, downloaded_bytes, total_bytes '
+                    'FROM jobs ORDER BY id'
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Job journal read failed: {e}")
+            return []
+
+        jobs = []
+        for job_id, kind, url, cmd, output_path, phase, downloaded, total in rows:
+            try:
+                cmd = json.loads(cmd)
+            except json.JSONDecodeError:
+                logger.warning(f"Dropping journaled job {job_id} with corrupt command")
+                self.finish(job_id)
+                continue
+            jobs.append({'id': job_id, 'kind': kind, 'url': url, 'cmd': cmd, 'output_path': output_path,
+                         'phase': phase, 'downloaded_bytes': downloaded, 'total_bytes': total})
+        return jobs
+
+    def close(self):
+        """Close the journal; later writes are ignored."""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,223 @@
+"""YoutubeDownloader Metadata Cache Module
+
+Persistent on-disk cache (SQLite under APP_DATA_DIR) for parsed yt-dlp info
+JSON, keyed by canonical video ID. Entries expire after a TTL and the cache
+is kept within an entry-count and byte budget using LRU eviction.
+
+Also holds the in-memory cache of resolved stream URLs used for previews.
+"""
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from constants import (
+    METADATA_CACHE_FILE, METADATA_CACHE_TTL, METADATA_CACHE_MAX_ENTRIES,
+    METADATA_CACHE_MAX_BYTES, STREAM_URL_CACHE_SIZE, STREAM_URL_DEFAULT_TTL,
+    STREAM_URL_EXPIRY_MARGIN,
+)
+
+logger = logging.getLogger(__name__)
+
+# expire=<unix time> as query parameter or /expire/<unix time>/ path segment (manifest URLs)
+STREAM_EXPIRE_REGEX = re.compile(r'[?&/]expire[=/](\d+)')
+
+# Large info keys we never use (subtitles, thumbnails, heatmap) - dropped to keep entries small
+CACHE_DROP_KEYS = ('automatic_captions', 'subtitles', 'thumbnails', 'heatmap')
+
+
+class MetadataCache:
+    """SQLite-backed cache of yt-dlp info dicts with TTL and LRU eviction.
+
+    All methods are thread-safe and never raise on database errors; a broken
+    cache simply behaves like an empty one.
+    """
+
+    def __init__(self, db_path=METADATA_CACHE_FILE, ttl=METADATA_CACHE_TTL,
+                 max_entries=METADATA_CACHE_MAX_ENTRIES, max_bytes=METADATA_CACHE_MAX_BYTES):
+        self.db_path = str(db_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = None
+
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS metadata ('
+                'video_id TEXT PRIMARY KEY, '
+                'info_json TEXT NOT NULL, '
+                'size INTEGER NOT NULL, '
+                'fetched_at REAL NOT NULL, '
+                'last_access REAL NOT NULL)'
+            )
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_metadata_last_access ON metadata(last_access)')
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Metadata cache unavailable ({self.db_path}): {e}")
+            self.conn = None
+
+    def get(self, video_id):
+        """Return cached info dict for video_id, or None if missing or expired."""
+        if not video_id or self.conn is None:
+            return None
+
+        now = time.time()
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return None
+                row = self.conn.execute(
+                    'SELECT info_json, fetched_at FROM metadata WHERE video_id = ?', (video_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                info_json, fetched_at = row
+                if now - fetched_at > self.ttl:
+                    self.conn.execute('DELETE FROM metadata WHERE video_id = ?', (video_id,))
+                    self.conn.commit()
+                    return None
+
+                self.conn.execute('UPDATE metadata SET last_access = ? WHERE video_id = ?', (now, video_id))
+                self.conn.commit()
+            return json.loads(info_json)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"Metadata cache read failed for {video_id}: {e}")
+            return None
+
+    def put(self, video_id, info):
+        """Store info dict for video_id and evict old entries if over budget."""
+        if not video_id or self.conn is None or not isinstance(info, dict):
+            return
+
+        slim_info = {k: v for k, v in info.items() if k not in CACHE_DROP_KEYS}
+        try:
+            info_json = json.dumps(slim_info, separators=(',', ':'))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Metadata for {video_id} is not JSON serializable: {e}")
+            return
+
+        now = time.time()
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO metadata (video_id, info_json, size, fetched_at, last_access) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (video_id, info_json, len(info_json), now, now)
+                )
+                self._evict()
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata cache write failed for {video_id}: {e}")
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until within budget (lock held)."""
+        self.conn.execute('DELETE FROM metadata WHERE fetched_at < ?', (time.time() - self.ttl,))
+
+        count, total_bytes = self.conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM metadata').fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+
+        rows = self.conn.execute('SELECT video_id, size FROM metadata ORDER BY last_access ASC').fetchall()
+        for video_id, size in rows:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            self.conn.execute('DELETE FROM metadata WHERE video_id = ?', (video_id,))
+            count -= 1
+            total_bytes -= size
+
+    def clear(self):
+        """Remove all cached entries."""
+        if self.conn is None:
+            return
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return
+                self.conn.execute('DELETE FROM metadata')
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata cache clear failed: {e}")
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+class StreamUrlCache:
+    """In-memory LRU cache of resolved media URLs keyed by (video ID, format selector).
+
+    Entries are valid until the URL's own expire= timestamp (minus a safety
+    margin), or for a default TTL when the URL carries none.
+    """
+
+    def __init__(self, max_entries=STREAM_URL_CACHE_SIZE, default_ttl=STREAM_URL_DEFAULT_TTL,
+                 margin=STREAM_URL_EXPIRY_MARGIN):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.margin = margin
+        self.entries = OrderedDict()  # {(video_id, format_selector): (url, valid_until)}
+        self.lock = threading.Lock()
+
+    def valid_until(self, url, now=None):
+        """Return the unix time until which url may be used."""
+        now = time.time() if now is None else now
+        match = STREAM_EXPIRE_REGEX.search(url)
+        if match:
+            return int(match.group(1)) - self.margin
+        return now + self.default_ttl
+
+    def is_fresh(self, url):
+        """Check whether url is not (about to be) expired."""
+        return self.valid_until(url) > time.time()
+
+    def get(self, video_id, format_selector):
+        """Return the cached URL, or None if missing or expired."""
+        key = (video_id, format_selector)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            url, valid_until = entry
+            if valid_until <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return url
+
+    def put(self, video_id, format_selector, url):
+        """Cache url; already expired URLs are not stored.
+
+        Returns:
+            bool: True if the URL was cached
+        """
+        valid_until = self.valid_until(url)
+        if not video_id or valid_until <= time.time():
+            return False
+
+        key = (video_id, format_selector)
+        with self.lock:
+            self.entries[key] = (url, valid_until)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return True
+
+    def invalidate(self, video_id, format_selector=None):
+        """Drop one entry, or all entries of a video when format_selector is None."""
+        with self.lock:
+            if format_selector is not None:
+                self.entries.pop((video_id, format_selector), None)
+            else:
+                for key in [k for k in self.entries if k[0] == video_id]:
+                    del self.entries[key]
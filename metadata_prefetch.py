@@ -0,0 +1,105 @@
+"""YoutubeDownloader Metadata Prefetch Module
+
+Resolves title, duration and formats for URLs detected in clipboard mode on a
+small dedicated thread pool, ahead of the actual download. Results go into the
+persistent metadata cache, so the download can skip yt-dlp's extraction step.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import PREFETCH_MAX_WORKERS, PREFETCH_MAX_PENDING
+from video_info import VideoInfo, extract_video_id
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataPrefetcher:
+    """Bounded background resolver for video metadata.
+
+    At most `max_workers` extractions run at once and at most `max_pending`
+    URLs are queued or running; further submissions are dropped (the download
+    then simply extracts as usual).
+    """
+
+    def __init__(self, fetch_info, cache, on_result=None,
+                 max_workers=PREFETCH_MAX_WORKERS, max_pending=PREFETCH_MAX_PENDING):
+        """
+        Args:
+            fetch_info: Callable(url) -> yt-dlp info dict (may raise)
+            cache: MetadataCache to read from and write into
+            on_result: Optional callable(url, VideoInfo or None), called on a pool thread
+            max_workers: Concurrent extractions
+            max_pending: Maximum queued + running URLs
+        """
+        self.fetch_info = fetch_info
+        self.cache = cache
+        self.on_result = on_result
+        self.max_pending = max_pending
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ytdl_prefetch")
+        self.is_shutdown = False
+
+    def submit(self, url):
+        """Queue url for metadata resolution.
+
+        Returns:
+            bool: True if queued (or answered from cache), False if skipped
+        """
+        video_id = extract_video_id(url)
+        if not video_id:
+            return False
+
+        cached_info = self.cache.get(video_id)
+        if cached_info:
+            self._deliver(url, cached_info)
+            return True
+
+        with self.lock:
+            if self.is_shutdown or video_id in self.pending or len(self.pending) >= self.max_pending:
+                return False
+            self.pending.add(video_id)
+
+        try:
+            self.executor.submit(self._resolve, url, video_id)
+        except RuntimeError:
+            # Executor shut down concurrently
+            with self.lock:
+                self.pending.discard(video_id)
+            return False
+        return True
+
+    def _resolve(self, url, video_id):
+        """Extract metadata for url on a pool thread and store it in the cache."""
+        info = None
+        try:
+            info = self.fetch_info(url)
+            self.cache.put(video_id, info)  # Same key as the lookup in submit()
+        except Exception as e:
+            logger.info(f"Metadata prefetch failed for {url}: {e}")
+        finally:
+            with self.lock:
+                self.pending.discard(video_id)
+        self._deliver(url, info)
+
+    def _deliver(self, url, info):
+        """Pass the parsed result to on_result (None if unavailable)."""
+        if self.on_result is None:
+            return
+        video_info = None
+        if info:
+            try:
+                video_info = VideoInfo(info)
+            except ValueError:
+                video_info = None
+        try:
+            self.on_result(url, video_info)
+        except Exception as e:
+            logger.warning(f"Metadata prefetch callback failed for {url}: {e}")
+
+    def shutdown(self):
+        """Stop accepting URLs and drop queued ones (running extractions finish in background)."""
+        with self.lock:
+            self.is_shutdown = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
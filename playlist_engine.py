@@ -0,0 +1,194 @@
+"""YoutubeDownloader Playlist Engine Module
+
+Two-stage playlist downloads:
+1. expansion: one fast `--flat-playlist` listing turns the playlist into
+   entries (ID, URL, title, index) without resolving any video
+2. download: each entry is a separate single-video download, scheduled on a
+   small worker pool with its own progress and retries, so one failing entry
+   never holds up the others
+
+The actual download of an entry is injected by the caller, so this module
+does not depend on the UI or on yt-dlp.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from constants import MAX_RETRY_ATTEMPTS, RETRY_DELAY
+
+logger = logging.getLogger(__name__)
+
+# Entry states
+ENTRY_PENDING = 'pending'
+ENTRY_DOWNLOADING = 'downloading'
+ENTRY_RETRYING = 'retrying'
+ENTRY_COMPLETED = 'completed'
+ENTRY_FAILED = 'failed'
+ENTRY_SKIPPED = 'skipped'  # Already downloaded (download archive)
+ENTRY_FINISHED_STATES = (ENTRY_COMPLETED, ENTRY_FAILED, ENTRY_SKIPPED)
+
+
+def flat_entry(entry, position):
+    """Turn one flat yt-dlp playlist entry into a download entry.
+
+    Args:
+        entry: Flat entry dict (id, title, duration, ...)
+        position: 1-based position in the listing, used when the entry has no playlist_index
+
+    Returns:
+        dict: id, url, title, duration and index, or None for deleted/private placeholders
+    """
+    if not entry or not entry.get('id'):
+        return None
+    video_id = entry['id']
+    return {
+        'id': video_id,
+        'url': f"https://www.youtube.com/watch?v={video_id}",
+        'title': entry.get('title') or video_id,
+        'duration': entry.get('duration'),
+        'index': entry.get('playlist_index') or position,
+    }
+
+
+def parse_flat_playlist(info):
+    """Turn a flat yt-dlp playlist info dict into download entries.
+
+    Args:
+        info: Result of a --flat-playlist extraction
+
+    Returns:
+        list: Dicts with id, url, title, duration and index (1-based playlist position)
+    """
+    entries = (flat_entry(entry, position) for position, entry in enumerate(info.get('entries') or [], start=1))
+    return [entry for entry in entries if entry]
+
+
+def select_new_entries(flat_entries, known_ids, stop_early=False):
+    """Pick the entries of a playlist listing that are not known yet (incremental sync).
+
+    Args:
+        flat_entries: Iterable of flat yt-dlp entries in listing order, e.g. a lazy listing
+        known_ids: IDs handled by earlier runs
+        stop_early: Stop consuming the listing at the first known entry; only correct for
+            newest-first listings (channel uploads, playlists sorted by date)
+
+    Returns:
+        list: New download entries (see flat_entry()), in listing order
+    """
+    new_entries = []
+    for position, raw_entry in enumerate(flat_entries, start=1):
+        entry = flat_entry(raw_entry, position)
+        if entry is None:
+            continue
+        if entry['id'] in known_ids:
+            if stop_early:
+                logger.info(f"Playlist sync: reached known entry {entry['id']} at position {position}, stopping")
+                break
+            continue
+        new_entries.append(entry)
+    return new_entries
+
+
+class PlaylistRunner:
+    """Downloads playlist entries on a worker pool with per-entry progress and retries.
+
+    download_entry(entry, report) runs one entry to completion on a pool
+    thread and returns True on success; it calls report(percent) with its
+    progress. Failed entries are retried with increasing delays, exceptions
+    count as failures, and the other entries keep going either way.
+    """
+
+    def __init__(self, entries, download_entry, workers, on_update=None, should_stop=None,
+                 max_attempts=MAX_RETRY_ATTEMPTS, retry_delay=RETRY_DELAY):
+        """
+        Args:
+            entries: Entries from parse_flat_playlist()
+            download_entry: Callable(entry, report) -> bool
+            workers: Entries downloaded at once
+            on_update: Optional callable(runner, entry), called on a pool thread after each
+                progress or state change
+            should_stop: Optional callable() -> bool; no new attempts start once it returns True
+            max_attempts: Attempts per entry
+            retry_delay: Seconds before the first retry (multiplied by the attempt number)
+        """
+        self.entries = list(entries)
+        self.download_entry = download_entry
+        self.workers = max(1, workers)
+        self.on_update = on_update
+        self.should_stop = should_stop or (lambda: False)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lock = threading.Lock()
+        self.states = {entry['id']: ENTRY_PENDING for entry in self.entries}
+        self.progress = {entry['id']: 0.0 for entry in self.entries}
+
+    def skip(self, entry):
+        """Mark an entry as already downloaded before run()."""
+        with self.lock:
+            self.states[entry['id']] = ENTRY_SKIPPED
+            self.progress[entry['id']] = 100.0
+
+    def _set(self, entry, state=None, percent=None):
+        with self.lock:
+            if state is not None:
+                self.states[entry['id']] = state
+            if percent is not None:
+                self.progress[entry['id']] = max(0.0, min(100.0, percent))
+        if self.on_update:
+            try:
+                self.on_update(self, entry)
+            except Exception as e:
+                logger.warning(f"Playlist update callback failed: {e}")
+
+    def counts(self):
+        """Return {state: number of entries}."""
+        with self.lock:
+            states = list(self.states.values())
+        return {state: states.count(state) for state in set(states)}
+
+    def overall_progress(self):
+        """Return the playlist progress in percent (finished entries count as 100)."""
+        with self.lock:
+            if not self.entries:
+                return 100.0
+            total = sum(100.0 if self.states[entry_id] in ENTRY_FINISHED_STATES else percent
+                        for entry_id, percent in self.progress.items())
+        return total / len(self.entries)
+
+    def active_progress(self):
+        """Return [(entry, percent)] of the entries downloading right now, in playlist order."""
+        with self.lock:
+            return [(entry, self.progress[entry['id']]) for entry in self.entries
+                    if self.states[entry['id']] in (ENTRY_DOWNLOADING, ENTRY_RETRYING)]
+
+    def _run_entry(self, entry):
+        for attempt in range(1, self.max_attempts + 1):
+            if self.should_stop():
+                return
+            self._set(entry, ENTRY_DOWNLOADING if attempt == 1 else ENTRY_RETRYING, 0.0)
+            try:
+                if self.download_entry(entry, lambda percent: self._set(entry, percent=percent)):
+                    self._set(entry, ENTRY_COMPLETED, 100.0)
+                    return
+            except Exception as e:
+                logger.exception(f"Playlist entry {entry['id']} failed: {e}")
+
+            if attempt < self.max_attempts and not self.should_stop():
+                logger.warning(f"Playlist entry {entry['id']} failed (attempt {attempt}/{self.max_attempts}), "
+                               f"retrying in {self.retry_delay * attempt}s")
+                time.sleep(self.retry_delay * attempt)
+        self._set(entry, ENTRY_FAILED)
+
+    def run(self):
+        """Download all pending entries; blocks until they are done (or stopped).
+
+        Returns:
+            dict: {state: number of entries}, see counts()
+        """
+        pending = [entry for entry in self.entries if self.states[entry['id']] == ENTRY_PENDING]
+        logger.info(f"Playlist: {len(pending)} of {len(self.entries)} entries to download, {self.workers} parallel")
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ytdl_playlist") as executor:
+            for future in [executor.submit(self._run_entry, entry) for entry in pending]:
+                future.result()
+        return self.counts()
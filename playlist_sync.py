@@ -0,0 +1,86 @@
+"""YoutubeDownloader Playlist Sync Module
+
+Remembers, per playlist, the entry IDs already handled (downloaded or found
+in the download archive), so a sync run only downloads the entries that are
+new since the last run. Stored in SQLite under APP_DATA_DIR.
+"""
+import logging
+import sqlite3
+import threading
+import time
+
+from constants import PLAYLIST_SYNC_FILE
+from video_info import extract_playlist_id
+
+logger = logging.getLogger(__name__)
+
+
+def playlist_key(url):
+    """Return the key a playlist's seen entries are stored under: its list= ID, or the URL itself."""
+    return extract_playlist_id(url) or url.strip()
+
+
+class PlaylistSyncStore:
+    """Thread-safe store of the last-seen entry IDs of each playlist.
+
+    Like the caches, database errors are logged and never raised; a sync
+    without the database simply treats every entry as new.
+    """
+
+    def __init__(self, db_path=PLAYLIST_SYNC_FILE):
+        self.db_path = str(db_path)
+        self.lock = threading.Lock()
+        self.conn = None
+
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS seen_entries ('
+                'playlist TEXT NOT NULL, '
+                'video_id TEXT NOT NULL, '
+                'seen_at REAL NOT NULL, '
+                'PRIMARY KEY (playlist, video_id))'
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Playlist sync store unavailable ({self.db_path}): {e}")
+            self.conn = None
+
+    def known_ids(self, playlist):
+        """Return the set of entry IDs seen in a playlist (see playlist_key())."""
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return set()
+                rows = self.conn.execute('SELECT video_id FROM seen_entries WHERE playlist = ?',
+                                         (playlist,)).fetchall()
+            return {video_id for (video_id,) in rows}
+        except sqlite3.Error as e:
+            logger.warning(f"Playlist sync read failed for {playlist}: {e}")
+            return set()
+
+    def mark_seen(self, playlist, video_ids):
+        """Record entry IDs of a playlist as handled."""
+        video_ids = list(video_ids)
+        if not video_ids:
+            return
+        now = time.time()
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO seen_entries (playlist, video_id, seen_at) VALUES (?, ?, ?)',
+                    [(playlist, video_id, now) for video_id in video_ids]
+                )
+                self.conn.commit()
+            logger.info(f"Playlist sync: {len(video_ids)} entries recorded for {playlist}")
+        except sqlite3.Error as e:
+            logger.warning(f"Playlist sync write failed for {playlist}: {e}")
+
+    def close(self):
+        """Close the database."""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,203 @@
+"""YoutubeDownloader Preview Cache Module
+
+Two-tier cache for preview frames keyed by (video ID, timestamp, size):
+- memory tier: decoded, ready-to-display images within a byte budget (LRU)
+- disk tier: JPEG bytes in SQLite under APP_DATA_DIR, kept across restarts
+  and evicted least-recently-used by total size
+
+Image decoding is injected by the caller, so this module does not depend on PIL.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from constants import (
+    PREVIEW_CACHE_FILE, PREVIEW_CACHE_SIZE, PREVIEW_MEMORY_CACHE_BYTES, PREVIEW_DISK_CACHE_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewCache:
+    """Memory + SQLite cache of preview frames.
+
+    Like MetadataCache, database errors are logged and never raised; a broken
+    disk tier simply behaves like an empty one.
+    """
+
+    def __init__(self, decode, image_bytes, db_path=PREVIEW_CACHE_FILE,
+                 memory_bytes=PREVIEW_MEMORY_CACHE_BYTES, memory_entries=PREVIEW_CACHE_SIZE,
+                 disk_bytes=PREVIEW_DISK_CACHE_BYTES):
+        """
+        Args:
+            decode: Callable(JPEG bytes) -> ready-to-display image
+            image_bytes: Callable(image) -> memory footprint in bytes
+            db_path: SQLite file of the disk tier
+            memory_bytes: Byte budget of the memory tier
+            memory_entries: Maximum images in the memory tier
+            disk_bytes: Byte budget of the disk tier
+        """
+        self.decode = decode
+        self.image_bytes = image_bytes
+        self.db_path = str(db_path)
+        self.memory_bytes = memory_bytes
+        self.memory_entries = memory_entries
+        self.disk_bytes = disk_bytes
+
+        self.memory = OrderedDict()  # {(video_id, timestamp, size): (image, nbytes)}
+        self.memory_used = 0
+        self.memory_lock = threading.Lock()
+
+        self.lock = threading.Lock()
+        self.conn = None
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS previews ('
+                'video_id TEXT NOT NULL, '
+                'timestamp INTEGER NOT NULL, '
+                'size TEXT NOT NULL, '
+                'data BLOB NOT NULL, '
+                'bytes INTEGER NOT NULL, '
+                'last_access REAL NOT NULL, '
+                'PRIMARY KEY (video_id, timestamp, size))'
+            )
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_previews_last_access ON previews(last_access)')
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Preview disk cache unavailable ({self.db_path}): {e}")
+            self.conn = None
+
+    # Memory tier
+
+    def _memory_get(self, key):
+        with self.memory_lock:
+            entry = self.memory.get(key)
+            if entry is None:
+                return None
+            self.memory.move_to_end(key)
+            return entry[0]
+
+    def _memory_put(self, key, image):
+        nbytes = self.image_bytes(image)
+        with self.memory_lock:
+            old = self.memory.pop(key, None)
+            if old is not None:
+                self.memory_used -= old[1]
+            self.memory[key] = (image, nbytes)
+            self.memory_used += nbytes
+            while self.memory and (self.memory_used > self.memory_bytes or len(self.memory) > self.memory_entries):
+                _, (_, evicted_bytes) = self.memory.popitem(last=False)
+                self.memory_used -= evicted_bytes
+
+    def clear_memory(self):
+        """Drop all decoded images (the disk tier is kept)."""
+        with self.memory_lock:
+            self.memory.clear()
+            self.memory_used = 0
+
+    # Disk tier
+
+    def _disk_get(self, key):
+        if self.conn is None:
+            return None
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return None
+                row = self.conn.execute(
+                    'SELECT data FROM previews WHERE video_id = ? AND timestamp = ? AND size = ?', key
+                ).fetchone()
+                if row is None:
+                    return None
+                self.conn.execute(
+                    'UPDATE previews SET last_access = ? WHERE video_id = ? AND timestamp = ? AND size = ?',
+                    (time.time(),) + key
+                )
+                self.conn.commit()
+            return bytes(row[0])
+        except sqlite3.Error as e:
+            logger.warning(f"Preview disk cache read failed: {e}")
+            return None
+
+    def _disk_put(self, key, data):
+        if self.conn is None:
+            return
+        try:
+            with self.lock:
+                if self.conn is None:
+                    return
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO previews (video_id, timestamp, size, data, bytes, last_access) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    key + (sqlite3.Binary(data), len(data), time.time())
+                )
+                self._evict_disk()
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Preview disk cache write failed: {e}")
+
+    def _evict_disk(self):
+        """Drop least recently used frames until within the byte budget (lock held)."""
+        total_bytes = self.conn.execute('SELECT COALESCE(SUM(bytes), 0) FROM previews').fetchone()[0]
+        if total_bytes <= self.disk_bytes:
+            return
+
+        rows = self.conn.execute(
+            'SELECT video_id, timestamp, size, bytes FROM previews ORDER BY last_access ASC'
+        ).fetchall()
+        for video_id, timestamp, size, nbytes in rows:
+            if total_bytes <= self.disk_bytes:
+                break
+            self.conn.execute(
+                'DELETE FROM previews WHERE video_id = ? AND timestamp = ? AND size = ?',
+                (video_id, timestamp, size)
+            )
+            total_bytes -= nbytes
+
+    # Public API
+
+    def get(self, video_id, timestamp, size):
+        """Return a ready-to-display image, or None.
+
+        Args:
+            video_id: Video ID (or local file identity)
+            timestamp: Position in seconds
+            size: Preview size string, e.g. "240x135"
+        """
+        key = (video_id, int(timestamp), size)
+        image = self._memory_get(key)
+        if image is not None:
+            return image
+
+        data = self._disk_get(key)
+        if data is None:
+            return None
+        try:
+            image = self.decode(data)
+        except Exception as e:
+            logger.warning(f"Corrupt cached preview for {key}: {e}")
+            return None
+        self._memory_put(key, image)
+        return image
+
+    def put(self, video_id, timestamp, size, data):
+        """Decode and store JPEG bytes in both tiers.
+
+        Returns:
+            The decoded ready-to-display image
+        """
+        key = (video_id, int(timestamp), size)
+        image = self.decode(data)
+        self._memory_put(key, image)
+        self._disk_put(key, data)
+        return image
+
+    def close(self):
+        """Close the disk tier."""
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
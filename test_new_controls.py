@@ -78,23 +78,26 @@ def test_new_controls():
     # Test 4: Speed limit helper method
     print("\n4. Testing speed limit implementation...")
 
-    if 'def _get_speed_limit_args(self' in code:
-        print("   ✓ _get_speed_limit_args method exists")
+    if 'def _get_speed_limit(self' in code:
+        print("   ✓ _get_speed_limit method exists")
         tests_passed += 1
     else:
-        print("   ✗ _get_speed_limit_args method missing")
+        print("   ✗ _get_speed_limit method missing")
         tests_failed += 1
 
-    if "'--limit-rate'" in code:
+    with open('ytdlp_engine.py', 'r') as f:
+        engine_code = f.read()
+
+    if "'--limit-rate'" in engine_code:
         print("   ✓ Uses yt-dlp --limit-rate flag")
         tests_passed += 1
     else:
         print("   ✗ --limit-rate flag not used")
         tests_failed += 1
 
-    # Check speed limit is applied in multiple places
-    speed_limit_calls = code.count('self._get_speed_limit_args()')
-    if speed_limit_calls >= 4:
+    # Check every yt-dlp download goes through the bandwidth budget
+    speed_limit_calls = code.count('self._start_ytdlp_download(')
+    if speed_limit_calls >= 3:
         print(f"   ✓ Speed limit applied in {speed_limit_calls} places")
         tests_passed += 1
     else:
@@ -113,14 +116,14 @@ def test_new_controls():
         print("   ✗ Custom filename not retrieved")
         tests_failed += 1
 
-    if "output_template = f'{custom_name}-%(playlist_index)s.%(ext)s'" in playlist_section:
+    if "output_template = f\"{custom_name}-{entry['index']}.%(ext)s\"" in playlist_section:
         print("   ✓ Custom filename template: name-1, name-2, etc.")
         tests_passed += 1
     else:
         print("   ✗ Custom filename template not found")
         tests_failed += 1
 
-    if "'%(playlist_index)s-%(title)s.%(ext)s'" in playlist_section:
+    if "f\"{entry['index']}-%(title)s.%(ext)s\"" in playlist_section:
         print("   ✓ Default template: index-title format")
         tests_passed += 1
     else:
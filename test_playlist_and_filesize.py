@@ -78,7 +78,11 @@ def test_playlist_and_filesize():
         print("   ✗ _fetch_file_size method missing")
         tests_failed += 1
 
-    if '--dump-json' in code:
+    # Metadata (and size) lookups go through YtDlpEngine.extract_info()
+    with open('ytdlp_engine.py', 'r') as f:
+        engine_code = f.read()
+
+    if "args = ['--dump-json']" in engine_code and 'self.ytdlp_engine.extract_info(' in code:
         print("   ✓ Using yt-dlp --dump-json for size estimation")
         tests_passed += 1
     else:
@@ -101,7 +105,7 @@ def test_playlist_and_filesize():
         print("   ✗ download_playlist method missing")
         tests_failed += 1
 
-    if '%(playlist_index)s-%(title)s' in code:
+    if "{entry['index']}-%(title)s" in code:
         print("   ✓ Playlist filename template")
         tests_passed += 1
     else:
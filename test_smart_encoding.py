@@ -17,15 +17,24 @@ def test_smart_encoding():
     # Test 1: Video download checks if processing is needed
     print("\n1. Testing video download smart encoding...")
 
-    if 'needs_processing = trim_enabled or volume_multiplier != 1.0' in code:
+    # The yt-dlp postprocessor args are built by ffmpeg_tools.build_postprocessor_args():
+    # nothing without trim/volume, video copied for a volume change, re-encoded for a trim
+    from ffmpeg_tools import build_postprocessor_args
+
+    untouched = build_postprocessor_args(1.0, reencode_video=False)
+    volume_only = build_postprocessor_args(1.5, reencode_video=False)
+    trimmed = build_postprocessor_args(1.0, reencode_video=True)
+    if untouched == [] and volume_only[:2] == ['-c:v', 'copy'] and trimmed[:2] == ['-c:v', 'libx264']:
         print("   ✓ Checks if processing is actually needed")
         tests_passed += 1
     else:
         print("   ✗ Doesn't check if processing is needed")
         tests_failed += 1
 
-    if 'if needs_processing:' in code:
-        print("   ✓ Conditional re-encoding based on needs_processing")
+    # Trimmed downloads are cut on keyframes by yt-dlp, so they never re-encode the video
+    if code.count('build_postprocessor_args(') >= 2 and 'reencode_video=trim_enabled' not in code and \
+            code.count('reencode_video=False)') >= 2:
+        print("   ✓ Conditional re-encoding (video copied, audio only for volume changes)")
         tests_passed += 1
     else:
         print("   ✗ No conditional re-encoding")
@@ -65,7 +74,7 @@ def test_smart_encoding():
     print("\n4. Testing playlist audio smart encoding...")
 
     if playlist_section_start > 0:
-        if "if volume_multiplier != 1.0:" in playlist_section and "postprocessor-args" in playlist_section:
+        if "build_audio_ytdlp_command(entry['url'], output_path, volume=volume_multiplier)" in playlist_section:
             print("   ✓ Playlist audio only processes when volume changed")
             tests_passed += 1
         else:
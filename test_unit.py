@@ -8,12 +8,40 @@ Run with coverage: pytest test_unit.py -v --cov=translations --cov=constants
 
 import pytest
 import os
+import shutil
+import subprocess
 import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import modules to test
 import translations
 import constants
+from video_info import VideoInfo, extract_video_id, extract_playlist_id
+from metadata_cache import MetadataCache, StreamUrlCache
+from metadata_prefetch import MetadataPrefetcher
+from filmstrip import Filmstrip
+from ffmpeg_tools import (
+    build_preview_frame_command, parse_keyframe_times, snap_to_keyframe, is_keyframe_aligned,
+    build_fast_cut_command, parse_video_stream, plan_smart_cut, build_segment_command,
+    build_concat_list, build_concat_parts_command, build_postprocessor_args, build_trim_input_args,
+    plan_parallel_segments, build_local_audio_command, build_local_video_command, SMART_CUT_ENCODERS,
+)
+from preview_cache import PreviewCache
+from benchmark import build_synthetic_input_command, build_benchmark_commands, BENCHMARK_MODES
+from ytdlp_engine import (
+    YtDlpEngine, YtDlpError, SubprocessRun, parse_output_line, progress_event_from_hook, format_speed, format_eta,
+    with_rate_limit, with_progress_template, PROGRESS_TEMPLATE,
+)
+from bandwidth import BandwidthAllocator, allocate_bandwidth
+from job_journal import JobJournal, phase_for_event, resume_command
+from download_archive import DownloadArchive, archive_key, key_from_command
+from playlist_engine import PlaylistRunner, parse_flat_playlist, select_new_entries
+from playlist_sync import PlaylistSyncStore, playlist_key
+from ui_events import UIEventBus
 
 
 class TestTranslationsModule:
@@ -29,6 +57,15 @@ class TestTranslationsModule:
         translations.CURRENT_LANGUAGE = 'en'
         assert translations.get_language() == 'en'
 
+    def test_tr_format_cache_follows_language(self):
+        """Cached formatted strings are kept per language"""
+        english = translations.tr('status_downloading_playlist', progress='42.0')
+        translations.set_language('de')
+        assert translations.tr('status_downloading_playlist', progress='42.0') != english
+        translations.set_language('en')
+        assert translations.tr('status_downloading_playlist', progress='42.0') == english
+        assert translations.tr('status_downloading_playlist', progress=['unhashable']).startswith('Downloading')
+
     def test_set_language_valid(self):
         """Setting valid language should work"""
         translations.set_language('de')
@@ -677,5 +714,1141 @@ class TestBytesConversion:
         assert constants.BYTES_PER_MB == 1048576
 
 
+class TestVideoInfo:
+    """Test suite for video_info.VideoInfo"""
+
+    FORMATS = [
+        {'format_id': 'sb0', 'vcodec': 'none', 'acodec': 'none', 'ext': 'mhtml'},
+        {'format_id': '139', 'vcodec': 'none', 'acodec': 'mp4a', 'filesize': 1000},
+        {'format_id': '140', 'vcodec': 'none', 'acodec': 'mp4a', 'filesize': 2000},
+        {'format_id': '18', 'vcodec': 'avc1', 'acodec': 'mp4a', 'height': 360,
+         'filesize': 9000, 'url': 'https://example.com/18'},
+        {'format_id': '134', 'vcodec': 'avc1', 'acodec': 'none', 'height': 360, 'filesize': 5000},
+        {'format_id': '135', 'vcodec': 'avc1', 'acodec': 'none', 'height': 480, 'filesize_approx': 8000},
+        {'format_id': '137', 'vcodec': 'avc1', 'acodec': 'none', 'height': 1080, 'tbr': 800},
+    ]
+
+    def make_info(self, **overrides):
+        info = {'id': 'abc123', 'title': 'Test Video', 'duration': 100.5, 'formats': self.FORMATS}
+        info.update(overrides)
+        return VideoInfo(info)
+
+    def test_basic_fields(self):
+        """Title, id and integer duration should be parsed"""
+        info = self.make_info()
+        assert info.video_id == 'abc123'
+        assert info.title == 'Test Video'
+        assert info.duration == 100
+
+    def test_from_json_uses_first_line(self):
+        """from_json should parse the first non-empty line of yt-dlp output"""
+        info = VideoInfo.from_json('\n{"id": "x", "title": "T", "duration": 5}\n')
+        assert info.video_id == 'x'
+        assert info.duration == 5
+
+    def test_missing_duration_raises(self):
+        """Missing duration should raise ValueError"""
+        with pytest.raises(ValueError):
+            VideoInfo({'id': 'x', 'title': 'Live'})
+
+    def test_select_bestvideo_plus_bestaudio(self):
+        """Video quality should pick best video-only under height plus best audio"""
+        selected = self.make_info().select_formats('480')
+        assert [f['format_id'] for f in selected] == ['135', '140']
+
+    def test_select_audio_only(self):
+        """Audio-only quality should pick best audio format"""
+        selected = self.make_info().select_formats('none (Audio only)')
+        assert [f['format_id'] for f in selected] == ['140']
+
+    def test_select_falls_back_to_combined(self):
+        """Without separate streams, best combined format under height is used"""
+        formats = [f for f in self.FORMATS if f['format_id'] in ('18', '134')]
+        selected = self.make_info(formats=formats).select_formats('720')
+        assert [f['format_id'] for f in selected] == ['18']
+
+    def test_estimate_filesize(self):
+        """Size should sum exact, approximate and bitrate-derived sizes"""
+        info = self.make_info()
+        assert info.estimate_filesize('480') == 10000
+        # 800 kbit/s * 100 s = 10,000,000 bytes
+        assert info.estimate_filesize('1080') == 10000000 + 2000
+
+    def test_estimate_filesize_unknown(self):
+        """Unknown quality or no matching formats should return None"""
+        assert self.make_info(formats=[]).estimate_filesize('480') is None
+
+    def test_size_table(self):
+        """Size table should cover every requested quality from one formats list"""
+        table = self.make_info().size_table(constants.VIDEO_QUALITIES + (constants.AUDIO_ONLY_QUALITY,))
+        assert set(table) == set(constants.VIDEO_QUALITIES) | {'none'}
+        assert table['1440'] == table['1080'] == 10002000
+        assert table['480'] == 10000
+        assert table['360'] == 7000
+        assert table['240'] is None
+        assert table['none'] == 2000
+
+    def test_preview_stream_url(self):
+        """Preview URL should come from the best combined format"""
+        assert self.make_info().preview_stream_url() == 'https://example.com/18'
+        assert self.make_info(formats=[]).preview_stream_url() is None
+
+
+class TestExtractVideoId:
+    """Test suite for video_info.extract_video_id"""
+
+    def test_supported_url_formats(self):
+        """All single-video URL formats should map to the same ID"""
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtube.com/watch?v=dQw4w9WgXcQ&list=PLtest&t=42",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ?t=10",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+            "https://www.youtube.com/live/dQw4w9WgXcQ",
+        ]
+        for url in urls:
+            assert extract_video_id(url) == "dQw4w9WgXcQ", url
+
+    def test_non_video_urls(self):
+        """Playlists, other sites and garbage should return None"""
+        assert extract_video_id("https://www.youtube.com/playlist?list=PLtest") is None
+        assert extract_video_id("https://vimeo.com/12345") is None
+        assert extract_video_id("not a url") is None
+        assert extract_video_id(None) is None
+
+    def test_extract_playlist_id(self):
+        """The list= parameter identifies a playlist"""
+        assert extract_playlist_id("https://www.youtube.com/playlist?list=PLtest") == "PLtest"
+        assert extract_playlist_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLtest&index=2") == "PLtest"
+        assert extract_playlist_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") is None
+        assert extract_playlist_id(None) is None
+
+
+class TestMetadataCache:
+    """Test suite for metadata_cache.MetadataCache"""
+
+    def test_put_and_get(self, tmp_path):
+        """Stored info should be returned without heavy keys"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db")
+        cache.put('vid1', {'id': 'vid1', 'duration': 10, 'subtitles': {'en': []}})
+        assert cache.get('vid1') == {'id': 'vid1', 'duration': 10}
+        assert cache.get('missing') is None
+        assert cache.get(None) is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Entries should survive reopening the database"""
+        MetadataCache(db_path=tmp_path / "cache.db").put('vid1', {'id': 'vid1'})
+        assert MetadataCache(db_path=tmp_path / "cache.db").get('vid1') == {'id': 'vid1'}
+
+    def test_ttl_expiry(self, tmp_path):
+        """Expired entries should not be returned"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db", ttl=-1)
+        cache.put('vid1', {'id': 'vid1'})
+        assert cache.get('vid1') is None
+
+    def test_lru_eviction_by_count(self, tmp_path):
+        """Least recently used entry should be evicted when over the entry limit"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db", max_entries=2)
+        cache.put('a', {'id': 'a'})
+        cache.put('b', {'id': 'b'})
+        cache.get('a')  # 'b' is now least recently used
+        cache.put('c', {'id': 'c'})
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+
+    def test_eviction_by_bytes(self, tmp_path):
+        """Cache should stay within its byte budget"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db", max_bytes=100)
+        cache.put('a', {'id': 'a', 'pad': 'x' * 60})
+        cache.put('b', {'id': 'b', 'pad': 'x' * 60})
+        assert cache.get('a') is None
+        assert cache.get('b') is not None
+
+
+class TestStreamUrlCache:
+    """Test suite for metadata_cache.StreamUrlCache"""
+
+    def make_url(self, expire):
+        return f"https://rr1.googlevideo.com/videoplayback?itag=18&expire={int(expire)}&sig=x"
+
+    def test_put_and_get_until_expire(self):
+        """Fresh URLs should be returned for the same video and format"""
+        cache = StreamUrlCache()
+        url = self.make_url(time.time() + 3600)
+        assert cache.put('vid', 'best', url) is True
+        assert cache.get('vid', 'best') == url
+        assert cache.get('vid', 'worst') is None
+
+    def test_expired_urls_not_cached(self):
+        """URLs past (or within the margin of) expire= should not be cached"""
+        cache = StreamUrlCache(margin=300)
+        assert cache.put('vid', 'best', self.make_url(time.time() + 60)) is False
+        assert cache.get('vid', 'best') is None
+
+    def test_manifest_expire_path_and_default_ttl(self):
+        """expire in path segments is honored; URLs without expire use the default TTL"""
+        cache = StreamUrlCache(default_ttl=100)
+        manifest = f"https://manifest.googlevideo.com/api/manifest/expire/{int(time.time()) - 10}/id/x"
+        assert cache.is_fresh(manifest) is False
+        assert cache.valid_until('https://example.com/video.mp4', now=1000) == 1100
+
+    def test_invalidate(self):
+        """Invalidated entries should be re-resolved"""
+        cache = StreamUrlCache()
+        url = self.make_url(time.time() + 3600)
+        cache.put('vid', 'best', url)
+        cache.put('vid', 'worst', url)
+        cache.invalidate('vid', 'best')
+        assert cache.get('vid', 'best') is None
+        assert cache.get('vid', 'worst') == url
+        cache.invalidate('vid')
+        assert cache.get('vid', 'worst') is None
+
+    def test_lru_limit(self):
+        """Oldest entries should be dropped beyond max_entries"""
+        cache = StreamUrlCache(max_entries=2)
+        url = self.make_url(time.time() + 3600)
+        for video_id in ('a', 'b', 'c'):
+            cache.put(video_id, 'best', url)
+        assert cache.get('a', 'best') is None
+        assert cache.get('c', 'best') == url
+
+
+class TestMetadataPrefetcher:
+    """Test suite for metadata_prefetch.MetadataPrefetcher"""
+
+    URL = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+
+    def test_prefetch_fills_cache_and_reports(self, tmp_path):
+        """Resolved info should be cached and delivered as VideoInfo"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db")
+        results = []
+        prefetcher = MetadataPrefetcher(
+            lambda url: {'id': 'dQw4w9WgXcQ', 'title': 'T', 'duration': 10},
+            cache, on_result=lambda url, info: results.append((url, info)))
+        assert prefetcher.submit(self.URL) is True
+        prefetcher.executor.shutdown(wait=True)
+        assert cache.get('dQw4w9WgXcQ')['title'] == 'T'
+        assert results[0][0] == self.URL
+        assert results[0][1].duration == 10
+
+    def test_cache_keyed_by_url_video_id(self, tmp_path):
+        """Entries are stored under the ID lookups use, whatever ID the extractor reports"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db")
+        prefetcher = MetadataPrefetcher(lambda url: {'id': 'extractor-id', 'duration': 10}, cache)
+        assert prefetcher.submit(self.URL) is True
+        prefetcher.executor.shutdown(wait=True)
+        assert cache.get('dQw4w9WgXcQ')['id'] == 'extractor-id'
+        assert cache.get('extractor-id') is None
+
+    def test_cached_url_skips_fetch(self, tmp_path):
+        """URLs already in the cache should not be fetched again"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db")
+        cache.put('dQw4w9WgXcQ', {'id': 'dQw4w9WgXcQ', 'duration': 5})
+        calls = []
+        prefetcher = MetadataPrefetcher(lambda url: calls.append(url), cache)
+        assert prefetcher.submit(self.URL) is True
+        prefetcher.shutdown()
+        assert calls == []
+
+    def test_skips_non_video_and_over_capacity(self, tmp_path):
+        """Playlist-only URLs and submissions beyond the pending cap are skipped"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db")
+        prefetcher = MetadataPrefetcher(lambda url: {}, cache, max_pending=0)
+        assert prefetcher.submit('https://www.youtube.com/playlist?list=PL123') is False
+        assert prefetcher.submit(self.URL) is False
+        prefetcher.shutdown()
+
+    def test_failed_fetch_reports_none(self, tmp_path):
+        """Extraction errors should be swallowed and reported as None"""
+        cache = MetadataCache(db_path=tmp_path / "cache.db")
+        results = []
+
+        def failing_fetch(url):
+            raise RuntimeError("network down")
+
+        prefetcher = MetadataPrefetcher(failing_fetch, cache, on_result=lambda url, info: results.append(info))
+        prefetcher.submit(self.URL)
+        prefetcher.executor.shutdown(wait=True)
+        assert results == [None]
+        assert prefetcher.pending == set()
+
+
+class TestFilmstrip:
+    """Test suite for filmstrip.Filmstrip"""
+
+    def test_layout_short_video(self):
+        """Short videos use the minimum interval and a single partial row"""
+        strip = Filmstrip(10, min_interval=2, columns=10)
+        assert strip.interval == 2
+        assert strip.tile_count == 5
+        assert (strip.columns, strip.rows) == (5, 1)
+
+    def test_layout_long_video_caps_tiles(self):
+        """Long videos should never exceed the tile budget"""
+        strip = Filmstrip(3600, max_tiles=200, columns=10)
+        assert strip.interval == 18
+        assert strip.tile_count == 200
+        assert strip.rows == 20
+
+    def test_tile_index_and_box(self):
+        """Timestamps map to the nearest tile, clamped to the sheet"""
+        strip = Filmstrip(100, max_tiles=10, columns=5, tile_width=160, tile_height=90)
+        assert strip.interval == 10
+        assert strip.tile_index(0) == 0
+        assert strip.tile_index(14) == 1
+        assert strip.tile_index(16) == 2
+        assert strip.tile_index(1000) == 9
+        assert strip.tile_box(70) == (320, 90, 480, 180)
+
+    def test_build_command(self):
+        """Command should be a single fps/scale/tile pass writing one image"""
+        strip = Filmstrip(100, max_tiles=10, columns=5)
+        cmd = strip.build_command('ffmpeg', 'https://example.com/v', '/tmp/sheet.jpg')
+        vf = cmd[cmd.index('-vf') + 1]
+        assert vf.startswith('fps=1/10,scale=')
+        assert vf.endswith('tile=5x2')
+        assert '-reconnect' in cmd
+        assert cmd[-1] == '/tmp/sheet.jpg'
+        assert '-reconnect' not in strip.build_command('ffmpeg', '/videos/a.mp4', '/tmp/s.jpg')
+
+    def test_invalid_duration(self):
+        """Zero duration should be rejected"""
+        with pytest.raises(ValueError):
+            Filmstrip(0)
+
+
+class TestFfmpegTools:
+    """Test suite for ffmpeg_tools command builders"""
+
+    def test_preview_frame_command_pipes_scaled_jpeg(self):
+        """Preview frames are scaled in ffmpeg and written as JPEG to stdout"""
+        cmd = build_preview_frame_command('ffmpeg', '/videos/a.mp4', 42, 240, 135)
+        assert cmd[cmd.index('-ss') + 1] == '42'
+        assert cmd.index('-ss') < cmd.index('-i')
+        assert cmd[cmd.index('-vf') + 1] == 'scale=240:135:force_original_aspect_ratio=decrease'
+        assert cmd[cmd.index('-f') + 1] == 'image2pipe'
+        assert cmd[-1] == 'pipe:1'
+        assert '-reconnect' not in cmd
+
+    def test_preview_frame_command_http_options(self):
+        """Remote streams get reconnect options before the input"""
+        cmd = build_preview_frame_command('ffmpeg', 'https://example.com/v', 0, 240, 135)
+        assert cmd.index('-reconnect') < cmd.index('-i')
+
+    def test_trim_input_args_seek_before_input(self):
+        """Trims seek on the input side and turn the end into a duration"""
+        assert build_trim_input_args('/v/a.mp4', 6300, 6360) == ['-ss', '6300', '-i', '/v/a.mp4', '-t', '60']
+        assert build_trim_input_args('/v/a.mp4') == ['-i', '/v/a.mp4']
+
+    def test_local_audio_command(self):
+        """Audio extraction seeks on the input side and applies the volume filter"""
+        cmd = build_local_audio_command('ffmpeg', '/v/a.mp4', '/o/a.mp3', start=10, end=20, volume=0.5)
+        assert cmd[1:7] == ['-ss', '10', '-i', '/v/a.mp4', '-t', '10']
+        assert cmd[cmd.index('-c:a') + 1] == 'libmp3lame'
+        assert cmd[cmd.index('-af') + 1] == 'volume=0.5'
+
+    def test_local_video_command_modes(self):
+        """Local video is rescaled with libx264, or copied when no rescale is needed"""
+        cmd = build_local_video_command('ffmpeg', '/v/a.mp4', '/o/a.mp4', '720', preset='veryfast')
+        assert cmd[cmd.index('-vf') + 1] == 'scale=-2:720'
+        assert cmd[cmd.index('-preset') + 1] == 'veryfast'
+        assert '-ss' not in cmd
+        copied = build_local_video_command('ffmpeg', '/v/a.mp4', '/o/a.mp4', '720', volume=1.5, copy_video=True)
+        assert copied[copied.index('-c:v') + 1] == 'copy'
+        assert '-vf' not in copied
+
+    def test_parse_keyframe_times(self):
+        """Only K-flagged packets with a timestamp are keyframes"""
+        output = "0.000000,K__\n0.033000,___\n2.002000,K__\nN/A,K__\n2.002000,K_\n\n4.004000,K__\n"
+        assert parse_keyframe_times(output) == [0.0, 2.002, 4.004]
+
+    def test_snap_to_keyframe(self):
+        """Cuts snap back to the last keyframe, with slack for whole-second slider values"""
+        keyframes = [0.0, 2.002, 4.004]
+        assert snap_to_keyframe(keyframes, 3) == 2.002
+        assert snap_to_keyframe(keyframes, 4) == 4.004
+        assert snap_to_keyframe(keyframes, 10) == 4.004
+        assert snap_to_keyframe([], 3) == 3
+        assert is_keyframe_aligned(keyframes, 2)
+        assert not is_keyframe_aligned(keyframes, 3)
+
+    def test_fast_cut_command_stream_copies(self):
+        """Fast cut seeks on the input side and copies all streams"""
+        cmd = build_fast_cut_command('ffmpeg', '/videos/a.mkv', 2.002, 10, '/out/a.mkv')
+        assert cmd.index('-ss') < cmd.index('-i')
+        assert cmd[cmd.index('-t') + 1] == '7.998'
+        assert cmd[cmd.index('-c') + 1] == 'copy'
+        assert '-vf' not in cmd and '-af' not in cmd
+        assert cmd[-1] == '/out/a.mkv'
+
+    def test_fast_cut_command_volume_reencodes_audio_only(self):
+        """A volume change keeps the video stream copied"""
+        cmd = build_fast_cut_command('ffmpeg', '/videos/a.mp4', 0, None, '/out/a.mp4', volume=1.5)
+        assert '-t' not in cmd
+        assert cmd[cmd.index('-c:v') + 1] == 'copy'
+        assert cmd[cmd.index('-af') + 1] == 'volume=1.5'
+        assert cmd[cmd.index('-c:a') + 1] == 'aac'
+
+    def test_fast_cut_command_webm_volume_uses_opus(self):
+        """WebM output can't hold AAC, so a volume change re-encodes the audio to Opus"""
+        cmd = build_fast_cut_command('ffmpeg', '/videos/a.webm', 4, 12, '/out/a.WEBM', volume=0.5)
+        assert cmd[cmd.index('-c:v') + 1] == 'copy'
+        assert cmd[cmd.index('-c:a') + 1] == 'libopus'
+        assert cmd[cmd.index('-af') + 1] == 'volume=0.5'
+
+    def test_parse_video_stream(self):
+        """The first video stream's codec is read from ffprobe JSON"""
+        output = '{"streams": [{"codec_name": "h264", "pix_fmt": "yuv420p"}]}'
+        assert parse_video_stream(output) == {'codec_name': 'h264', 'pix_fmt': 'yuv420p'}
+        assert parse_video_stream('{"streams": []}') == {}
+        assert parse_video_stream('not json') == {}
+
+    def test_smart_cut_only_for_in_band_header_codecs(self):
+        """Codecs whose copied packets need the encoder's extradata are not smart-cut"""
+        assert set(SMART_CUT_ENCODERS) == {'h264', 'vp9'}
+
+    @pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not installed")
+    def test_smart_cut_output_decodes(self, tmp_path):
+        """A real H.264 smart cut (encoded head and tail, copied middle) decodes without errors"""
+        source = str(tmp_path / "source.mp4")
+        if subprocess.run(build_synthetic_input_command('ffmpeg', source, 320, 180, 10),
+                          capture_output=True).returncode != 0:
+            pytest.skip("ffmpeg without libx264/lavfi")
+
+        keyframes = [0.0, 2.0, 4.0, 6.0, 8.0]  # Fixed 2 s GOP of the synthetic input
+        parts = plan_smart_cut(keyframes, 1.3, 7.1)
+        assert [mode for mode, _, _ in parts] == ['encode', 'copy', 'encode']
+        part_files = []
+        for index, (mode, start, end) in enumerate(parts):
+            part_file = str(tmp_path / f"part{index}.mkv")
+            cmd = build_segment_command('ffmpeg', source, start, end, part_file, pix_fmt='yuv420p',
+                                        encoder_args=SMART_CUT_ENCODERS['h264'] if mode == 'encode' else None)
+            assert subprocess.run(cmd, capture_output=True).returncode == 0
+            part_files.append(part_file)
+
+        list_path = tmp_path / "parts.txt"
+        list_path.write_text(build_concat_list(part_files))
+        output = str(tmp_path / "cut.mp4")
+        assert subprocess.run(build_concat_parts_command('ffmpeg', str(list_path), source, 1.3, 7.1, output),
+                              capture_output=True).returncode == 0
+
+        check = subprocess.run(['ffmpeg', '-v', 'error', '-i', output, '-f', 'null', '-'],
+                               capture_output=True, text=True)
+        assert check.returncode == 0
+        assert check.stderr.strip() == ""
+
+    def test_plan_smart_cut_encodes_only_boundaries(self):
+        """Only start-to-next-keyframe and last-keyframe-to-end are re-encoded"""
+        keyframes = [0.0, 2.0, 4.0, 6.0, 8.0]
+        assert plan_smart_cut(keyframes, 3, 7) == [('encode', 3, 4.0), ('copy', 4.0, 6.0), ('encode', 6.0, 7)]
+        assert plan_smart_cut(keyframes, 2, 7) == [('copy', 2.0, 6.0), ('encode', 6.0, 7)]
+        assert plan_smart_cut(keyframes, 2, 6) == [('copy', 2.0, 6)]
+
+    def test_plan_smart_cut_without_inner_keyframes(self):
+        """A cut with no copyable GOP inside is re-encoded as a whole"""
+        assert plan_smart_cut([0.0, 2.0, 4.0], 1, 3) == [('encode', 1, 3)]
+        assert plan_smart_cut([], 1, 3) == [('encode', 1, 3)]
+        with pytest.raises(ValueError):
+            plan_smart_cut([0.0], 3, 3)
+
+    def test_segment_command_modes(self):
+        """Parts are video-only, re-encoded with the given encoder or stream-copied"""
+        encoded = build_segment_command('ffmpeg', '/v/a.mp4', 3, 4, '/t/p0.mkv',
+                                        encoder_args=['-c:v', 'libx264'], pix_fmt='yuv420p')
+        assert encoded[encoded.index('-c:v') + 1] == 'libx264'
+        assert encoded[encoded.index('-pix_fmt') + 1] == 'yuv420p'
+        assert '-an' in encoded
+        copied = build_segment_command('ffmpeg', '/v/a.mp4', 4, 6, '/t/p1.mkv')
+        assert copied[copied.index('-c:v') + 1] == 'copy'
+        assert copied[copied.index('-t') + 1] == '2.000000'
+
+    def test_concat_list_escapes_quotes(self):
+        """Single quotes in part paths are escaped for the concat demuxer"""
+        assert build_concat_list(['/t/a.mkv', "/t/it's.mkv"]) == "file '/t/a.mkv'\nfile '/t/it'\\''s.mkv'\n"
+
+    def test_concat_parts_command(self):
+        """Video parts are copied, audio is cut from the source and re-encoded"""
+        cmd = build_concat_parts_command('ffmpeg', '/t/parts.txt', '/v/a.webm', 3, 7, '/o/a.webm', volume=0.5)
+        assert cmd[cmd.index('-f') + 1] == 'concat'
+        assert cmd[cmd.index('-c:v') + 1] == 'copy'
+        assert cmd[cmd.index('-c:a') + 1] == 'libopus'
+        assert cmd[cmd.index('-af') + 1] == 'volume=0.5'
+
+    def test_plan_parallel_segments_splits_at_keyframes(self):
+        """Segments are of similar length and every inner boundary is a keyframe"""
+        keyframes = [float(t) for t in range(0, 600, 4)]
+        segments = plan_parallel_segments(keyframes, 10, 490, 4, min_length=30)
+        assert len(segments) == 4
+        assert segments[0][0] == 10 and segments[-1][1] == 490
+        for (_, previous_end), (next_start, _) in zip(segments, segments[1:]):
+            assert previous_end == next_start
+            assert next_start in keyframes
+
+    def test_plan_parallel_segments_short_range(self):
+        """Ranges too short for several segments stay in one piece"""
+        assert plan_parallel_segments([0.0, 10.0, 20.0], 0, 40, 8, min_length=30) == [(0, 40)]
+        segments = plan_parallel_segments([0.0, 50.0], 0, 120, 4, min_length=30)
+        assert segments == [(0, 50.0), (50.0, 120)]
+
+    def test_postprocessor_args_volume_copies_video(self):
+        """A volume change alone keeps the video stream and re-encodes audio"""
+        args = build_postprocessor_args(1.5)
+        assert args[args.index('-c:v') + 1] == 'copy'
+        assert args[args.index('-af') + 1] == 'volume=1.5'
+        assert 'libx264' not in args
+
+    def test_postprocessor_args_reencode_and_noop(self):
+        """Cuts re-encode the video; unchanged downloads need no postprocessor args"""
+        assert build_postprocessor_args(1.0) == []
+        args = build_postprocessor_args(1.0, reencode_video=True)
+        assert args[args.index('-c:v') + 1] == 'libx264'
+        assert '-af' not in args
+
+
+class TestBenchmark:
+    """Test suite for the synthetic-media benchmark setup"""
+
+    def test_synthetic_input_uses_lavfi_sources(self):
+        """Inputs come from testsrc2 + sine with a fixed keyframe interval"""
+        cmd = build_synthetic_input_command('ffmpeg', '/t/in.mp4', 1280, 720, 60)
+        assert 'testsrc2=size=1280x720:rate=30:duration=60' in cmd
+        assert 'sine=frequency=440:sample_rate=48000:duration=60' in cmd
+        assert cmd[cmd.index('-g') + 1] == '60'
+
+    def test_benchmark_commands_cover_modes_and_presets(self):
+        """Re-encoding modes run once per preset, the others once"""
+        runs = build_benchmark_commands('ffmpeg', '/t/in.mp4', '/t', 720, 60, ['faster', 'veryfast'])
+        modes = [run['mode'] for run in runs]
+        assert set(modes) == set(BENCHMARK_MODES)
+        assert modes.count('trim') == 2 and modes.count('rescale') == 2
+        fast_cut = next(run for run in runs if run['mode'] == 'fast_cut')
+        start = float(fast_cut['cmd'][fast_cut['cmd'].index('-ss') + 1])
+        assert start % 2 == 0  # Starts on a keyframe of the synthetic input
+        rescale = next(run for run in runs if run['mode'] == 'rescale')
+        assert rescale['cmd'][rescale['cmd'].index('-vf') + 1] == 'scale=-2:360'
+
+
+class TestPreviewCache:
+    """Test suite for preview_cache.PreviewCache"""
+
+    def make_cache(self, tmp_path, **kwargs):
+        decoded = []
+
+        def decode(data):
+            decoded.append(data)
+            return data.decode()
+
+        cache = PreviewCache(decode=decode, image_bytes=len, db_path=tmp_path / "previews.db", **kwargs)
+        return cache, decoded
+
+    def test_put_and_get_from_memory(self, tmp_path):
+        """Stored frames are returned decoded from the memory tier"""
+        cache, decoded = self.make_cache(tmp_path)
+        assert cache.put('vid', 10, '240x135', b'frame10') == 'frame10'
+        assert cache.get('vid', 10, '240x135') == 'frame10'
+        assert cache.get('vid', 10, '120x68') is None
+        assert decoded == [b'frame10']
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Frames should come back from disk after reopening"""
+        cache, _ = self.make_cache(tmp_path)
+        cache.put('vid', 5, '240x135', b'frame5')
+        cache.close()
+
+        reopened, decoded = self.make_cache(tmp_path)
+        assert reopened.get('vid', 5, '240x135') == 'frame5'
+        assert decoded == [b'frame5']
+        # Second access is served from memory without decoding again
+        assert reopened.get('vid', 5, '240x135') == 'frame5'
+        assert decoded == [b'frame5']
+
+    def test_memory_byte_budget(self, tmp_path):
+        """Memory tier evicts least recently used images beyond its byte budget"""
+        cache, _ = self.make_cache(tmp_path, memory_bytes=10)
+        cache.put('vid', 1, 's', b'aaaaaa')
+        cache.put('vid', 2, 's', b'bbbbbb')
+        assert list(cache.memory) == [('vid', 2, 's')]
+        assert cache.memory_used == 6
+
+    def test_disk_lru_by_total_size(self, tmp_path):
+        """Disk tier drops least recently used frames beyond its byte budget"""
+        cache, _ = self.make_cache(tmp_path, disk_bytes=12)
+        cache.put('vid', 1, 's', b'aaaaaa')
+        cache.put('vid', 2, 's', b'bbbbbb')
+        cache.clear_memory()
+        cache.get('vid', 1, 's')  # frame 2 is now least recently used
+        cache.put('vid', 3, 's', b'cccccc')
+        cache.clear_memory()
+        assert cache.get('vid', 1, 's') == 'aaaaaa'
+        assert cache.get('vid', 2, 's') is None
+        assert cache.get('vid', 3, 's') == 'cccccc'
+
+
+class TestJobJournal:
+    """Test suite for job_journal.JobJournal"""
+
+    def test_unfinished_jobs_survive_restart(self, tmp_path):
+        """Jobs not finished before closing are returned on the next start"""
+        journal = JobJournal(db_path=tmp_path / "jobs.db", progress_interval=0)
+        job = journal.start('clipboard', 'https://youtu.be/abc', ['yt-dlp', '-f', 'best', 'https://youtu.be/abc'],
+                            '/dl/%(title)s.%(ext)s')
+        journal.record_event(job, {'status': 'preparing'})
+        journal.record_event(job, {'status': 'downloading', 'downloaded_bytes': 500, 'total_bytes': 1000})
+        journal.close()
+        journal.finish(job)  # Ignored after close, as during shutdown
+
+        reopened = JobJournal(db_path=tmp_path / "jobs.db")
+        [entry] = reopened.unfinished()
+        assert entry['id'] == job
+        assert entry['cmd'] == ['yt-dlp', '-f', 'best', 'https://youtu.be/abc']
+        assert (entry['phase'], entry['downloaded_bytes'], entry['total_bytes']) == ('downloading', 500, 1000)
+
+    def test_finished_jobs_are_removed(self, tmp_path):
+        """Completed, failed and stopped jobs are not resumed"""
+        journal = JobJournal(db_path=tmp_path / "jobs.db")
+        job = journal.start('trimmer', 'https://youtu.be/abc', ['yt-dlp', 'https://youtu.be/abc'])
+        journal.record_event(job, {'status': 'finished', 'filename': '/dl/a.mp4'})
+        assert journal.unfinished()[0]['output_path'] == '/dl/a.mp4'
+        journal.finish(job)
+        assert journal.unfinished() == []
+
+    def test_progress_writes_are_throttled(self, tmp_path):
+        """Bytes done are written at most once per interval"""
+        journal = JobJournal(db_path=tmp_path / "jobs.db", progress_interval=60)
+        job = journal.start('clipboard', 'u', ['yt-dlp', 'u'])
+        journal.record_event(job, {'status': 'downloading', 'downloaded_bytes': 1, 'total_bytes': 9})
+        journal.record_event(job, {'status': 'downloading', 'downloaded_bytes': 5, 'total_bytes': 9})
+        assert journal.unfinished()[0]['downloaded_bytes'] == 1
+
+    def test_phase_for_event(self):
+        """Engine events map to journal phases"""
+        assert phase_for_event({'status': 'preparing'}) == 'extracting'
+        assert phase_for_event({'status': 'downloading'}) == 'downloading'
+        assert phase_for_event({'status': 'postprocessing', 'postprocessor': 'Merger'}) == 'merging'
+        assert phase_for_event({'status': 'postprocessing', 'postprocessor': 'ExtractAudio'}) == 'postprocessing'
+        assert phase_for_event({'status': 'log', 'level': 'warning', 'message': ''}) is None
+
+    def test_resume_command(self):
+        """Resumed commands use the current executable and --continue"""
+        assert resume_command(['/old/yt-dlp', '--no-continue', '-f', 'best', 'url'], '/new/yt-dlp') == \
+            ['/new/yt-dlp', '--continue', '-f', 'best', 'url']
+
+
+class TestDownloadArchive:
+    """Test suite for download_archive.DownloadArchive"""
+
+    def test_keys_include_quality_and_trim(self):
+        """The same video at another quality or trim range is a different download"""
+        archive = DownloadArchive(db_path=':memory:')
+        archive.add(archive_key('abc', '1080'))
+        assert archive.contains(archive_key('abc', '1080'))
+        assert not archive.contains(archive_key('abc', '720'))
+        assert not archive.contains(archive_key('abc', '1080', 10, 20))
+        assert not archive.contains(archive_key(None, '1080'))
+
+    def test_survives_restart(self, tmp_path):
+        """Entries are loaded back into the in-memory index"""
+        output_file = tmp_path / "a.mp3"
+        output_file.write_bytes(b"mp3")
+        archive = DownloadArchive(db_path=tmp_path / "archive.db")
+        archive.add(archive_key('abc', 'none', 5, 12.5), str(output_file))
+        archive.close()
+        reopened = DownloadArchive(db_path=tmp_path / "archive.db")
+        assert reopened.contains(('abc', 'none', '5-12.5'))
+        reopened.forget(('abc', 'none', '5-12.5'))
+        assert len(reopened) == 0
+
+    def test_missing_output_file_is_forgotten(self, tmp_path):
+        """A deleted or moved download can be fetched again; entries without a file stay known"""
+        output_file = tmp_path / "video.mp4"
+        output_file.write_bytes(b"mp4")
+        archive = DownloadArchive(db_path=tmp_path / "archive.db")
+        archive.add(archive_key('abc', '720'), str(output_file))
+        archive.add(archive_key('imported', '720'))
+        assert archive.contains(archive_key('abc', '720'))
+
+        output_file.unlink()
+        assert not archive.contains(archive_key('abc', '720'))
+        assert archive.contains(archive_key('imported', '720'))
+        archive.close()
+        assert len(DownloadArchive(db_path=tmp_path / "archive.db")) == 1
+
+    def test_ytdlp_archive_round_trip(self, tmp_path):
+        """Untrimmed entries of a quality are exported, and yt-dlp's additions imported"""
+        archive = DownloadArchive(db_path=':memory:')
+        archive.add(archive_key('old', '720'))
+        archive.add(archive_key('cut', '720', 0, 10))
+        archive.add(archive_key('other', '1080'))
+        path = tmp_path / "archive.txt"
+        assert archive.write_ytdlp_archive(path, '720') == 1
+        assert path.read_text() == "youtube old\n"
+
+        with open(path, 'a') as f:
+            f.write("youtube new\n")
+        assert archive.import_ytdlp_archive(path, '720') == 1
+        assert archive.contains(archive_key('new', '720'))
+
+    def test_key_from_command(self):
+        """Resumed jobs get their key back from the journaled command"""
+        video_cmd = ['yt-dlp', '-f', 'bestvideo[height<=720]+bestaudio/best[height<=720]',
+                     '--download-sections', '*00:01:00-00:02:30', 'url']
+        assert key_from_command('abc', video_cmd) == ('abc', '720', '60-150')
+        assert key_from_command('abc', ['yt-dlp', '-f', 'bestaudio', '--extract-audio', 'url']) == \
+            ('abc', 'none', '')
+        assert key_from_command(None, video_cmd) is None
+
+
+class TestYtDlpEngine:
+    """Test suite for ytdlp_engine event parsing and backend selection"""
+
+    def test_parse_progress_line(self):
+        """Progress lines should become downloading events with speed and ETA"""
+        event = parse_output_line("[download]  45.2% of 10.00MiB at 1.50MiB/s ETA 00:05")
+        assert event['status'] == 'downloading'
+        assert event['percent'] == 45.2
+        assert event['speed_str'] == '1.50MiB/s'
+        assert event['eta_str'] == '00:05'
+
+    def test_parse_status_lines(self):
+        """Non-progress lines should map to typed events"""
+        assert parse_output_line("[download] Destination: a.mp4")['status'] == 'starting'
+        assert parse_output_line("[download] a.mp4 has already been downloaded")['status'] == 'already_downloaded'
+        assert parse_output_line("[Merger] Merging formats into a.mp4")['postprocessor'] == 'Merger'
+        assert parse_output_line("[ExtractAudio] Destination: a.mp3")['postprocessor'] == 'ExtractAudio'
+        assert parse_output_line("[info] abc: Downloading 1 format(s): 22")['status'] == 'preparing'
+        assert parse_output_line("ERROR: Video unavailable")['level'] == 'error'
+        assert parse_output_line("   ") is None
+
+    def test_parse_output_file(self):
+        """Destination, merge and already-downloaded lines name the file yt-dlp writes"""
+        assert parse_output_line("[download] Destination: /dl/a.f137.mp4")['filename'] == '/dl/a.f137.mp4'
+        assert parse_output_line('[Merger] Merging formats into "/dl/a b.mp4"')['filename'] == '/dl/a b.mp4'
+        assert parse_output_line("[ExtractAudio] Destination: /dl/a.mp3")['filename'] == '/dl/a.mp3'
+        assert parse_output_line("[download] /dl/a.mp4 has already been downloaded")['filename'] == '/dl/a.mp4'
+        assert parse_output_line("[ffmpeg] Fixing something")['filename'] is None
+
+    def test_parse_playlist_item(self):
+        """Playlist item lines should report index and count"""
+        event = parse_output_line("[download] Downloading item 3 of 12")
+        assert event == {'status': 'playlist_item', 'playlist_index': 3, 'playlist_count': 12}
+
+    def test_parse_progress_template_line(self):
+        """Progress template lines become typed downloading events with exact byte counts"""
+        event = parse_output_line("[ytdl-progress]1048576|4194304|NA|524288.0|6|3|12|2|5|avc1.64001F\n")
+        assert event['status'] == 'downloading'
+        assert event['percent'] == 25.0
+        assert (event['downloaded_bytes'], event['total_bytes'], event['eta']) == (1048576, 4194304, 6)
+        assert event['speed'] == 524288.0 and event['speed_str'] == '512.00KiB/s'
+        assert (event['fragment_index'], event['fragment_count']) == (3, 12)
+        assert (event['phase'], event['playlist_index'], event['playlist_count']) == ('video', 2, 5)
+
+        estimated = parse_output_line("[ytdl-progress]500|NA|1000.5|NA|NA|NA|NA|NA|NA|none")
+        assert estimated['percent'] == pytest.approx(49.975, rel=1e-3)
+        assert estimated['phase'] == 'audio' and estimated['speed'] is None
+        assert parse_output_line("[ytdl-progress]garbage") is None
+
+    def test_with_progress_template(self):
+        """The subprocess backend asks for template lines exactly once"""
+        args = with_progress_template(['-f', 'best', 'url'])
+        assert args == ['--progress-template', PROGRESS_TEMPLATE, '-f', 'best', 'url']
+        assert with_progress_template(args) == args
+        assert PROGRESS_TEMPLATE.startswith('download:')
+
+    def test_progress_event_from_hook(self):
+        """yt-dlp hook dicts should be normalized to downloading events"""
+        event = progress_event_from_hook({
+            'status': 'downloading', 'downloaded_bytes': 250, 'total_bytes': 1000,
+            'speed': 2 * 1024 * 1024, 'eta': 75,
+            'info_dict': {'vcodec': 'none', 'playlist_index': 2, 'n_entries': 5},
+        })
+        assert event['percent'] == 25.0
+        assert event['speed_str'] == '2.00MiB/s'
+        assert event['eta_str'] == '01:15'
+        assert event['phase'] == 'audio'
+        assert (event['playlist_index'], event['playlist_count']) == (2, 5)
+        assert progress_event_from_hook({'status': 'finished', 'filename': 'a.mp4'})['filename'] == 'a.mp4'
+        assert progress_event_from_hook({'status': 'error'}) is None
+
+    def test_format_helpers(self):
+        """Speed and ETA should be formatted like yt-dlp"""
+        assert format_speed(None) is None
+        assert format_speed(512) == '512.00B/s'
+        assert format_eta(3725) == '01:02:05'
+        assert format_eta(None) is None
+
+    def test_run_subprocess_reports_process(self):
+        """Subprocess runs should be reported to the hook so they can be killed"""
+        engine = YtDlpEngine(sys.executable, prefer_in_process=False)
+        calls = []
+        stdout = engine._run_subprocess(['-c', 'print("ok")'], timeout=30,
+                                        process_hook=lambda process, running: calls.append(running))
+        assert stdout.strip() == 'ok'
+        assert calls == [True, False]
+
+    def test_subprocess_backend_when_not_preferred(self):
+        """Engine should fall back to the executable when in-process is disabled"""
+        engine = YtDlpEngine('yt-dlp', prefer_in_process=False)
+        assert engine.in_process is False
+
+    def test_with_rate_limit(self):
+        """Existing limits should be replaced, or removed for None"""
+        assert with_rate_limit(['-f', 'best', '--limit-rate', '100', 'url'], 2048) == \
+            ['-f', 'best', 'url', '--limit-rate', '2048']
+        assert with_rate_limit(['-r', '100', '--limit-rate=5M', 'url'], None) == ['url']
+
+    def test_subprocess_rate_change_restarts(self):
+        """A new rate during the transfer should restart the executable with it"""
+        script = ("import sys, time\n"
+                  "rate = sys.argv[sys.argv.index('--limit-rate') + 1]\n"
+                  "print('[download]  10.0% of 1.00MiB', flush=True)\n"
+                  "if rate == '100':\n"
+                  "    time.sleep(30)\n")
+        run = SubprocessRun([sys.executable, '-c', script, '--limit-rate', '100'])
+        events = run.events()
+        assert next(events)['status'] == 'downloading'
+        run.set_rate_limit(1000)
+        assert [event['status'] for event in events] == ['downloading']
+        assert run.wait(timeout=30) == 0
+        assert run.cmd[-2:] == ['--limit-rate', '1000']
+
+    def test_subprocess_trim_keeps_rate(self):
+        """Section downloads can't resume, so they are not restarted"""
+        run = SubprocessRun([sys.executable, '-c', 'pass', '--download-sections', '*0-10'])
+        run._transferring = True
+        run.set_rate_limit(1000)
+        assert run._restart is False
+        assert run.wait(timeout=30) == 0
+
+    def test_iter_flat_playlist_follows_url_results(self, monkeypatch):
+        """Lazy in-process listings follow url results (watch?v=...&list=...) to the playlist"""
+        playlist_url = 'https://www.youtube.com/playlist?list=PL123'
+        results = {
+            'https://www.youtube.com/watch?v=abc&list=PL123': {
+                '_type': 'url', 'url': playlist_url, 'ie_key': 'YoutubeTab'},
+            playlist_url: {'_type': 'playlist', 'id': 'PL123', 'entries': iter([{'id': 'a'}, {'id': 'b'}])},
+            'https://www.youtube.com/watch?v=abc': {'id': 'abc', 'title': 'Single video'},
+        }
+        calls = []
+
+        class FakeYoutubeDL:
+            def __init__(self, opts):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def extract_info(self, url, download=True, process=True, ie_key=None):
+                calls.append((url, ie_key))
+                return results[url]
+
+        fake_module = types.SimpleNamespace(
+            YoutubeDL=FakeYoutubeDL, utils=types.SimpleNamespace(DownloadError=RuntimeError))
+        monkeypatch.setattr('ytdlp_engine.yt_dlp', fake_module, raising=False)
+        engine = YtDlpEngine('yt-dlp', prefer_in_process=False)
+        engine.in_process = True
+
+        entries = list(engine.iter_flat_playlist('https://www.youtube.com/watch?v=abc&list=PL123'))
+        assert [entry['id'] for entry in entries] == ['a', 'b']
+        assert calls[1] == (playlist_url, 'YoutubeTab')
+
+        # A URL that doesn't resolve to a playlist must fail, not list nothing
+        with pytest.raises(YtDlpError):
+            list(engine.iter_flat_playlist('https://www.youtube.com/watch?v=abc'))
+
+
+class TestBandwidth:
+    """Test suite for the global bandwidth budget"""
+
+    def test_unlimited_budget_keeps_own_caps(self):
+        """Without a budget every job runs at its own limit"""
+        assert allocate_bandwidth(None, {1: (4, None), 2: (1, 500)}) == {1: None, 2: 500}
+
+    def test_split_by_priority(self):
+        """The budget is split in proportion to the priority weights"""
+        assert allocate_bandwidth(1000000, {1: (4, None), 2: (1, None)}) == {1: 800000, 2: 200000}
+
+    def test_caps_give_back_unused_share(self):
+        """A capped job leaves its unused share to the others"""
+        rates = allocate_bandwidth(1000000, {1: (4, 100000), 2: (1, None), 3: (1, None)})
+        assert rates == {1: 100000, 2: 450000, 3: 450000}
+
+    def test_minimum_rate(self):
+        """No job is throttled below the minimum"""
+        assert allocate_bandwidth(10, {1: (1, None)}, min_rate=64) == {1: 64}
+
+    def test_rebalance_on_start_and_finish(self):
+        """Running jobs get new rates when others start or finish"""
+        allocator = BandwidthAllocator(total=9000000)
+        applied = []
+        background = allocator.register(1)
+        allocator.attach(background, applied.append)
+        assert applied == [9000000]
+
+        interactive = allocator.register(2)
+        assert allocator.rate(interactive) == 6000000
+        assert applied == [9000000, 3000000]
+
+        allocator.release(interactive)
+        assert applied == [9000000, 3000000, 9000000]
+
+        allocator.set_total(None)
+        assert applied[-1] is None
+
+
+class TestPlaylistEngine:
+    """Test suite for the two-stage playlist engine"""
+
+    ENTRIES = [{'id': f'vid{n}', 'url': f'https://www.youtube.com/watch?v=vid{n}', 'title': f'Video {n}',
+                'duration': 60, 'index': n} for n in range(1, 5)]
+
+    def test_parse_flat_playlist(self):
+        """Flat entries become watch URLs with their playlist position; placeholders are dropped"""
+        entries = parse_flat_playlist({'entries': [
+            {'id': 'abc', 'title': 'First', 'duration': 12},
+            None,
+            {'id': 'def', 'url': 'def', 'playlist_index': 7},
+        ]})
+        assert [entry['url'] for entry in entries] == ['https://www.youtube.com/watch?v=abc',
+                                                       'https://www.youtube.com/watch?v=def']
+        assert [entry['index'] for entry in entries] == [1, 7]
+        assert entries[1]['title'] == 'def'
+        assert parse_flat_playlist({}) == []
+
+    def test_failed_entry_does_not_stop_others(self):
+        """One failing entry is retried and reported while the rest complete"""
+        attempts = []
+
+        def download(entry, report):
+            attempts.append(entry['id'])
+            report(50)
+            return entry['id'] != 'vid2'
+
+        runner = PlaylistRunner(self.ENTRIES, download, workers=2, max_attempts=3, retry_delay=0)
+        assert runner.run() == {'completed': 3, 'failed': 1}
+        assert attempts.count('vid2') == 3
+        assert runner.overall_progress() == 100.0
+
+    def test_retry_recovers(self):
+        """An entry that fails once and then succeeds counts as completed; exceptions are failures"""
+        failures = {'vid1'}
+
+        def download(entry, report):
+            if entry['id'] in failures:
+                failures.discard(entry['id'])
+                raise OSError("connection reset")
+            return True
+
+        runner = PlaylistRunner(self.ENTRIES, download, workers=4, retry_delay=0)
+        assert runner.run() == {'completed': 4}
+
+    def test_skipped_entries_are_not_downloaded(self):
+        """Entries marked as already downloaded count as done without a download"""
+        downloaded = []
+        runner = PlaylistRunner(self.ENTRIES, lambda entry, report: downloaded.append(entry['id']) or True,
+                                workers=1)
+        runner.skip(self.ENTRIES[0])
+        assert runner.run() == {'skipped': 1, 'completed': 3}
+        assert downloaded == ['vid2', 'vid3', 'vid4']
+
+    def test_stop(self):
+        """No new attempts start once stopped"""
+        runner = PlaylistRunner(self.ENTRIES, lambda entry, report: True, workers=2, should_stop=lambda: True)
+        assert runner.run() == {'pending': 4}
+        assert runner.overall_progress() == 0.0
+
+    def test_select_new_entries(self):
+        """Only unknown entries are picked; stop_early stops consuming the listing at the first known one"""
+        listing = [{'id': 'new1'}, {'id': 'old1'}, {'id': 'new2'}, {'id': 'old2'}]
+        known = {'old1', 'old2'}
+        assert [entry['id'] for entry in select_new_entries(listing, known)] == ['new1', 'new2']
+        assert [entry['index'] for entry in select_new_entries(listing, known)] == [1, 3]
+
+        consumed = []
+        lazy = (consumed.append(entry['id']) or entry for entry in listing)
+        assert [entry['id'] for entry in select_new_entries(lazy, known, stop_early=True)] == ['new1']
+        assert consumed == ['new1', 'old1']
+
+    def test_sync_store(self, tmp_path):
+        """Seen entries are kept per playlist across restarts"""
+        store = PlaylistSyncStore(db_path=tmp_path / "sync.db")
+        store.mark_seen('PLa', ['v1', 'v2'])
+        store.mark_seen('PLb', ['v3'])
+        store.close()
+
+        reopened = PlaylistSyncStore(db_path=tmp_path / "sync.db")
+        assert reopened.known_ids('PLa') == {'v1', 'v2'}
+        assert reopened.known_ids('PLc') == set()
+        assert playlist_key("https://www.youtube.com/playlist?list=PLa") == 'PLa'
+        assert playlist_key(" https://www.youtube.com/@channel/videos ") == "https://www.youtube.com/@channel/videos"
+
+
+class TestUIEventBus:
+    """Test suite for ui_events.UIEventBus"""
+
+    def test_latest_update_per_key(self):
+        """Bursts of updates for one key are applied once, with the latest value"""
+        bus = UIEventBus()
+        applied = []
+        for percent in range(100):
+            bus.publish(('progress', 'job1'), applied.append, percent)
+        bus.publish(('progress', 'job2'), applied.append, 'other')
+        assert len(bus) == 2
+        assert bus.drain() == 2
+        assert applied == [99, 'other']
+        assert bus.drain() == 0
+
+    def test_failing_update_does_not_block_others(self):
+        """An exception in one update is logged and the rest are still applied"""
+        bus = UIEventBus()
+        applied = []
+        bus.publish('broken', lambda: 1 / 0)
+        bus.publish('status', applied.append, 'done')
+        bus.drain()
+        assert applied == ['done']
+
+
+def bare_downloader():
+    """Return a YouTubeDownloader without running __init__ (no Tk window).
+
+    Skips the test when the GUI dependencies of downloader.py are not installed.
+    """
+    pytest.importorskip('PIL')
+    pytest.importorskip('catboxpy')
+    from downloader import YouTubeDownloader
+    return YouTubeDownloader.__new__(YouTubeDownloader)
+
+
+class _Var:
+    """Stand-in for a Tk variable"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class TestPreviewPool:
+    """Test suite for the concurrent start/end preview extraction"""
+
+    def test_frames_extracted_concurrently_and_shown_independently(self):
+        """A slow start frame must not hold back the end frame"""
+        app = bare_downloader()
+        app.preview_pool = ThreadPoolExecutor(max_workers=2)
+        app.preview_lock = threading.Lock()
+        app.preview_processes = {}
+        app.preview_generation = 0
+        app.current_video_url = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+        app.video_duration = 100
+        app.start_time_var = _Var(10)
+        app.end_time_var = _Var(50)
+        app._show_filmstrip_previews = lambda start, end: True
+
+        release_start = threading.Event()
+        delivered = []
+        start_blocked_at_end_delivery = []
+
+        def extract_frame(timestamp, generation=None):
+            if timestamp == 10:
+                release_start.wait(timeout=5)
+            return f"frame@{timestamp}"
+
+        def update_preview_image(image, position, generation=None):
+            if position == 'end':
+                start_blocked_at_end_delivery.append(not release_start.is_set())
+                release_start.set()
+            delivered.append((position, image))
+
+        app.extract_frame = extract_frame
+        app._update_preview_image = update_preview_image
+
+        app.update_previews()
+        app.preview_pool.shutdown(wait=True)
+
+        assert delivered == [('end', 'frame@50'), ('start', 'frame@10')]
+        assert start_blocked_at_end_delivery == [True]
+
+
+
+class TestClipboardSlots:
+    """Test suite for the parallel-download slots shared by batch and auto-download"""
+
+    @staticmethod
+    def make_app(workers):
+        app = bare_downloader()
+        app.clipboard_slot_condition = threading.Condition()
+        app.clipboard_active_downloads = 0
+        app._get_clipboard_workers = lambda: workers
+        return app
+
+    def test_batch_and_auto_download_stay_within_limit(self):
+        """Competing batch (waiting) and auto-download (non-blocking) takers never exceed the setting"""
+        app = self.make_app(workers=2)
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def hold_slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            app._release_clipboard_slot()
+
+        def batch():
+            for _ in range(10):
+                assert app._acquire_clipboard_slot(should_stop=lambda: False)
+                hold_slot()
+
+        def auto():
+            taken = 0
+            while taken < 10:
+                if app._acquire_clipboard_slot():
+                    taken += 1
+                    hold_slot()
+                else:
+                    time.sleep(0.001)
+
+        threads = [threading.Thread(target=target) for target in (batch, batch, auto, auto)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert peak[0] <= 2
+        assert app.clipboard_active_downloads == 0
+
+    def test_no_wait_without_should_stop(self):
+        """Auto-download gets False at once when every slot is busy"""
+        app = self.make_app(workers=1)
+        assert app._acquire_clipboard_slot() is True
+        started = time.monotonic()
+        assert app._acquire_clipboard_slot() is False
+        assert time.monotonic() - started < constants.CLIPBOARD_SLOT_POLL_INTERVAL
+        assert app.clipboard_active_downloads == 1
+
+    def test_wait_ends_when_stopped(self):
+        """A waiting batch queue gives up as soon as should_stop() returns True"""
+        app = self.make_app(workers=1)
+        assert app._acquire_clipboard_slot() is True
+        stop = threading.Event()
+        threading.Timer(0.1, stop.set).start()
+        started = time.monotonic()
+        assert app._acquire_clipboard_slot(should_stop=stop.is_set) is False
+        assert time.monotonic() - started < 0.1 + 2 * constants.CLIPBOARD_SLOT_POLL_INTERVAL
+        assert app.clipboard_active_downloads == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
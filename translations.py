@@ -5,10 +5,14 @@ Contains all internationalization (i18n) strings for supported languages:
 - German (de)
 - Polish (pl)
 """
+from functools import lru_cache
 
 # Current language setting
 CURRENT_LANGUAGE = 'en'
 
+# Formatted strings kept by tr(); progress messages repeat the same few values many times
+FORMAT_CACHE_SIZE = 2048
+
 TRANSLATIONS = {
     'en': {
         # Window & Language
@@ -44,6 +48,12 @@ TRANSLATIONS = {
         'label_volume': 'Volume:',
         'btn_reset_volume': 'Reset to 100%',
         'checkbox_enable_trimming': 'Enable video trimming',
+        'checkbox_fast_cut': 'Fast cut (lossless, local files)',
+        'label_fast_cut_indexing': 'Indexing keyframes...',
+        'label_fast_cut_aligned': 'Start is on a keyframe - exact lossless cut',
+        'label_fast_cut_snapped': 'Cut will start at keyframe {time}',
+        'label_fast_cut_reencode': 'Start is between keyframes and {codec} can\'t be cut losslessly: the clip will be re-encoded',
+        'label_fast_cut_smart': 'Exact cut - only {seconds}s at the cut points is re-encoded',
         'btn_fetch_duration': 'Fetch Video Duration',
         'label_start_time': 'Start Time:',
         'label_end_time': 'End Time:',
@@ -70,10 +80,15 @@ TRANSLATIONS = {
         'label_quality': 'Quality:',
         'label_detected_urls': 'Detected URLs',
         'label_url_count': '({count} URL{s})',
+        'label_url_count_size': '({count} URL{s}, ~{size} MB)',
         'btn_download_all': 'Download All',
         'label_current_download': 'Current Download:',
         'label_completed_total': 'Completed: {done}/{total} videos',
+        'label_parallel_downloads': 'Parallel downloads:',
+        'label_already_downloaded': 'already downloaded',
         'label_full_playlist': 'Full Playlist Download (download all videos when given a playlist link)',
+        'label_playlist_sync': 'Sync playlists (only download entries that are new since the last run)',
+        'label_playlist_sync_stop_early': 'Stop listing at the first known entry (newest-first playlists)',
 
         # Uploader tab
         'header_upload_file': 'Upload Local File',
@@ -96,6 +111,7 @@ TRANSLATIONS = {
         'status_upload_failed': 'Upload failed',
         'status_url_copied': 'URL copied to clipboard!',
         'status_all_downloads_complete': 'All downloads complete! ({count} videos)',
+        'status_resuming_downloads': 'Resuming {count} interrupted download(s)...',
         'status_completed_failed': 'Completed: {completed} | Failed: {failed}',
         'status_downloads_stopped': 'Downloads stopped by user',
         'status_all_uploads_complete': 'All uploads complete! ({count} files)',
@@ -157,6 +173,8 @@ TRANSLATIONS = {
         # Warning messages
         'warning_clear_history_title': 'Clear History',
         'warning_clear_history': 'Are you sure you want to clear all upload history?',
+        'confirm_redownload_title': 'Already Downloaded',
+        'confirm_redownload': 'This video was already downloaded with the same quality and trim range. Download it again?',
         'warning_cannot_clear_title': 'Cannot Clear',
         'warning_cannot_clear_downloading': 'Cannot clear URLs while downloads are in progress.',
         'warning_cannot_clear_uploading': 'Cannot clear queue while uploads are in progress.',
@@ -191,6 +209,10 @@ TRANSLATIONS = {
         'status_playlist_downloading': 'Downloading playlist...',
         'status_playlist_complete': 'Playlist download complete!',
         'status_playlist_failed': 'Playlist download failed',
+        'status_playlist_up_to_date': 'Playlist is up to date, no new entries',
+        'status_playlist_listing': 'Listing playlist entries...',
+        'status_playlist_progress': 'Downloading playlist [{done}/{total}]... {progress}%',
+        'status_playlist_partial': 'Playlist finished: {completed} downloaded, {failed} failed',
         'error_ffmpeg_not_found': 'ffmpeg not found. Please ensure it is installed.',
         'error_ytdlp_not_found': 'yt-dlp not found. Please ensure it is installed.',
         'error_failed_clear_history': 'Failed to clear history: {error}',
@@ -220,6 +242,7 @@ TRANSLATIONS = {
 
         # Update feature
         'update_check_btn': 'Check for Updates',
+        'label_total_bandwidth': 'Total bandwidth:',
         'update_auto_check': 'Check for updates on startup',
         'update_checking': 'Checking for updates...',
         'update_available_title': 'Update Available',
@@ -272,6 +295,12 @@ TRANSLATIONS = {
         'label_volume': 'Lautstärke:',
         'btn_reset_volume': 'Auf 100% zurücksetzen',
         'checkbox_enable_trimming': 'Videozuschnitt aktivieren',
+        'checkbox_fast_cut': 'Schnellschnitt (verlustfrei, lokale Dateien)',
+        'label_fast_cut_indexing': 'Keyframes werden indiziert...',
+        'label_fast_cut_aligned': 'Start liegt auf einem Keyframe - exakter verlustfreier Schnitt',
+        'label_fast_cut_snapped': 'Schnitt beginnt am Keyframe {time}',
+        'label_fast_cut_reencode': 'Start liegt zwischen Keyframes und {codec} ist nicht verlustfrei schneidbar: der Clip wird neu kodiert',
+        'label_fast_cut_smart': 'Exakter Schnitt - nur {seconds}s an den Schnittpunkten wird neu kodiert',
         'btn_fetch_duration': 'Videodauer abrufen',
         'label_start_time': 'Startzeit:',
         'label_end_time': 'Endzeit:',
@@ -298,10 +327,15 @@ TRANSLATIONS = {
         'label_quality': 'Qualität:',
         'label_detected_urls': 'Erkannte URLs',
         'label_url_count': '({count} URL{s})',
+        'label_url_count_size': '({count} URL{s}, ~{size} MB)',
         'btn_download_all': 'Alle herunterladen',
         'label_current_download': 'Aktueller Download:',
         'label_completed_total': 'Abgeschlossen: {done}/{total} Videos',
+        'label_parallel_downloads': 'Parallele Downloads:',
+        'label_already_downloaded': 'bereits heruntergeladen',
         'label_full_playlist': 'Vollständige Playlist herunterladen (alle Videos bei Playlist-Link)',
+        'label_playlist_sync': 'Playlists synchronisieren (nur seit dem letzten Lauf neue Einträge laden)',
+        'label_playlist_sync_stop_early': 'Auflistung beim ersten bekannten Eintrag beenden (neueste zuerst)',
 
         # Uploader tab
         'header_upload_file': 'Lokale Datei hochladen',
@@ -324,6 +358,7 @@ TRANSLATIONS = {
         'status_upload_failed': 'Upload fehlgeschlagen',
         'status_url_copied': 'URL in Zwischenablage kopiert!',
         'status_all_downloads_complete': 'Alle Downloads abgeschlossen! ({count} Videos)',
+        'status_resuming_downloads': '{count} unterbrochene(r) Download(s) wird fortgesetzt...',
         'status_completed_failed': 'Abgeschlossen: {completed} | Fehlgeschlagen: {failed}',
         'status_downloads_stopped': 'Downloads vom Benutzer gestoppt',
         'status_all_uploads_complete': 'Alle Uploads abgeschlossen! ({count} Dateien)',
@@ -385,6 +420,8 @@ TRANSLATIONS = {
         # Warning messages
         'warning_clear_history_title': 'Verlauf löschen',
         'warning_clear_history': 'Möchten Sie wirklich den gesamten Upload-Verlauf löschen?',
+        'confirm_redownload_title': 'Bereits heruntergeladen',
+        'confirm_redownload': 'Dieses Video wurde bereits mit derselben Qualität und demselben Schnittbereich heruntergeladen. Erneut herunterladen?',
         'warning_cannot_clear_title': 'Kann nicht löschen',
         'warning_cannot_clear_downloading': 'URLs können während laufender Downloads nicht gelöscht werden.',
         'warning_cannot_clear_uploading': 'Warteschlange kann während laufender Uploads nicht gelöscht werden.',
@@ -419,6 +456,10 @@ TRANSLATIONS = {
         'status_playlist_downloading': 'Playlist wird heruntergeladen...',
         'status_playlist_complete': 'Playlist-Download abgeschlossen!',
         'status_playlist_failed': 'Playlist-Download fehlgeschlagen',
+        'status_playlist_up_to_date': 'Playlist ist aktuell, keine neuen Einträge',
+        'status_playlist_listing': 'Playlist-Einträge werden aufgelistet...',
+        'status_playlist_progress': 'Playlist wird heruntergeladen [{done}/{total}]... {progress}%',
+        'status_playlist_partial': 'Playlist fertig: {completed} heruntergeladen, {failed} fehlgeschlagen',
         'error_ffmpeg_not_found': 'ffmpeg nicht gefunden. Bitte stellen Sie sicher, dass es installiert ist.',
         'error_ytdlp_not_found': 'yt-dlp nicht gefunden. Bitte stellen Sie sicher, dass es installiert ist.',
         'error_failed_clear_history': 'Verlauf konnte nicht gelöscht werden: {error}',
@@ -448,6 +489,7 @@ TRANSLATIONS = {
 
         # Update feature
         'update_check_btn': 'Nach Updates suchen',
+        'label_total_bandwidth': 'Gesamtbandbreite:',
         'update_auto_check': 'Beim Start nach Updates suchen',
         'update_checking': 'Suche nach Updates...',
         'update_available_title': 'Update verfügbar',
@@ -500,6 +542,12 @@ TRANSLATIONS = {
         'label_volume': 'Głośność:',
         'btn_reset_volume': 'Resetuj do 100%',
         'checkbox_enable_trimming': 'Włącz przycinanie wideo',
+        'checkbox_fast_cut': 'Szybkie cięcie (bezstratne, pliki lokalne)',
+        'label_fast_cut_indexing': 'Indeksowanie klatek kluczowych...',
+        'label_fast_cut_aligned': 'Początek na klatce kluczowej - dokładne bezstratne cięcie',
+        'label_fast_cut_snapped': 'Cięcie zacznie się od klatki kluczowej {time}',
+        'label_fast_cut_reencode': 'Początek jest między klatkami kluczowymi, a {codec} nie da się przyciąć bezstratnie: klip zostanie przekodowany',
+        'label_fast_cut_smart': 'Dokładne cięcie - tylko {seconds}s w punktach cięcia jest kodowane ponownie',
         'btn_fetch_duration': 'Pobierz czas trwania wideo',
         'label_start_time': 'Czas rozpoczęcia:',
         'label_end_time': 'Czas zakończenia:',
@@ -526,10 +574,15 @@ TRANSLATIONS = {
         'label_quality': 'Jakość:',
         'label_detected_urls': 'Wykryte URL',
         'label_url_count': '({count} URL{s})',
+        'label_url_count_size': '({count} URL{s}, ~{size} MB)',
         'btn_download_all': 'Pobierz wszystkie',
         'label_current_download': 'Bieżące pobieranie:',
         'label_completed_total': 'Ukończono: {done}/{total} filmów',
+        'label_parallel_downloads': 'Równoległe pobierania:',
+        'label_already_downloaded': 'już pobrano',
         'label_full_playlist': 'Pełne pobieranie playlisty (pobierz wszystkie filmy z linku playlisty)',
+        'label_playlist_sync': 'Synchronizuj playlisty (pobieraj tylko pozycje nowe od ostatniego uruchomienia)',
+        'label_playlist_sync_stop_early': 'Zakończ listowanie na pierwszej znanej pozycji (najnowsze najpierw)',
 
         # Uploader tab
         'header_upload_file': 'Prześlij plik lokalny',
@@ -552,6 +605,7 @@ TRANSLATIONS = {
         'status_upload_failed': 'Przesyłanie nie powiodło się',
         'status_url_copied': 'URL skopiowany do schowka!',
         'status_all_downloads_complete': 'Wszystkie pobierania zakończone! ({count} filmów)',
+        'status_resuming_downloads': 'Wznawianie przerwanych pobierań: {count}...',
         'status_completed_failed': 'Ukończono: {completed} | Niepowodzenie: {failed}',
         'status_downloads_stopped': 'Pobierania zatrzymane przez użytkownika',
         'status_all_uploads_complete': 'Wszystkie przesyłania zakończone! ({count} plików)',
@@ -613,6 +667,8 @@ TRANSLATIONS = {
         # Warning messages
         'warning_clear_history_title': 'Wyczyść historię',
         'warning_clear_history': 'Czy na pewno chcesz wyczyścić całą historię przesyłania?',
+        'confirm_redownload_title': 'Już pobrano',
+        'confirm_redownload': 'Ten film został już pobrany w tej samej jakości i z tym samym zakresem przycięcia. Pobrać ponownie?',
         'warning_cannot_clear_title': 'Nie można wyczyścić',
         'warning_cannot_clear_downloading': 'Nie można wyczyścić URL podczas trwających pobierań.',
         'warning_cannot_clear_uploading': 'Nie można wyczyścić kolejki podczas trwających przesyłań.',
@@ -647,6 +703,10 @@ TRANSLATIONS = {
         'status_playlist_downloading': 'Pobieranie playlisty...',
         'status_playlist_complete': 'Pobieranie playlisty zakończone!',
         'status_playlist_failed': 'Pobieranie playlisty nie powiodło się',
+        'status_playlist_up_to_date': 'Playlista jest aktualna, brak nowych pozycji',
+        'status_playlist_listing': 'Pobieranie listy pozycji playlisty...',
+        'status_playlist_progress': 'Pobieranie playlisty [{done}/{total}]... {progress}%',
+        'status_playlist_partial': 'Playlista zakończona: pobrano {completed}, nieudane {failed}',
         'error_ffmpeg_not_found': 'ffmpeg nie został znaleziony. Upewnij się, że jest zainstalowany.',
         'error_ytdlp_not_found': 'yt-dlp nie został znaleziony. Upewnij się, że jest zainstalowany.',
         'error_failed_clear_history': 'Nie udało się wyczyścić historii: {error}',
@@ -676,6 +736,7 @@ TRANSLATIONS = {
 
         # Update feature
         'update_check_btn': 'Sprawdź aktualizacje',
+        'label_total_bandwidth': 'Łączna przepustowość:',
         'update_auto_check': 'Sprawdzaj aktualizacje przy uruchomieniu',
         'update_checking': 'Sprawdzanie aktualizacji...',
         'update_available_title': 'Dostępna aktualizacja',
@@ -706,13 +767,26 @@ def tr(key, **kwargs):
     Returns:
         Translated and formatted string
     """
-    text = TRANSLATIONS.get(CURRENT_LANGUAGE, {}).get(key, key)
     if kwargs:
         try:
-            return text.format(**kwargs)
-        except (KeyError, ValueError):
-            return text
-    return text
+            return _format_cached(CURRENT_LANGUAGE, key, tuple(sorted(kwargs.items())))
+        except TypeError:
+            pass  # Unhashable argument, format without the cache
+        return _format(CURRENT_LANGUAGE, key, kwargs)
+    return TRANSLATIONS.get(CURRENT_LANGUAGE, {}).get(key, key)
+
+
+def _format(language, key, kwargs):
+    text = TRANSLATIONS.get(language, {}).get(key, key)
+    try:
+        return text.format(**kwargs)
+    except (KeyError, ValueError):
+        return text
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_cached(language, key, items):
+    return _format(language, key, dict(items))
 
 
 def set_language(lang_code):
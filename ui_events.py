@@ -0,0 +1,50 @@
+"""YoutubeDownloader UI Events Module
+
+Thread-safe, coalescing bus between download workers and the Tk main loop.
+Workers publish widget updates under a key (e.g. the progress bar of one
+job) instead of touching Tk or scheduling a callback per output line; the
+main thread drains the bus on a fixed tick and applies only the latest
+update of each key, so a burst of progress lines costs one widget update.
+"""
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class UIEventBus:
+    """Latest-update-per-key store, drained on the Tk main thread.
+
+    Typical use:
+        bus.publish(('progress', job), apply_progress, percent)  # any thread
+        bus.drain()  # main thread, every UI_EVENT_INTERVAL_MS
+    """
+
+    def __init__(self):
+        self.pending = {}  # {key: (callback, args)}, in order of the latest publish
+        self.lock = threading.Lock()
+
+    def publish(self, key, callback, *args):
+        """Queue callback(*args) for the next drain, replacing any pending update with the same key."""
+        with self.lock:
+            self.pending.pop(key, None)
+            self.pending[key] = (callback, args)
+
+    def drain(self):
+        """Apply the pending updates (main thread only).
+
+        Returns:
+            int: Number of updates applied
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for key, (callback, args) in pending.items():
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.warning(f"UI update {key} failed: {e}")
+        return len(pending)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.pending)
@@ -0,0 +1,205 @@
+"""YoutubeDownloader Video Info Module
+
+Parses the info JSON produced by a single `yt-dlp --dump-json` call and
+exposes everything the Trimmer tab needs from it: duration, title, the
+formats table, estimated file sizes and the preview stream URL.
+"""
+import json
+import re
+from urllib.parse import urlparse, parse_qs
+
+VIDEO_ID_REGEX = re.compile(r'^[A-Za-z0-9_-]{6,20}$')
+
+# Combined format used for preview frame extraction (matches 'best[height<=480]/best')
+PREVIEW_MAX_HEIGHT = 480
+
+
+def _has_video(fmt):
+    return fmt.get('vcodec') != 'none'
+
+
+def _has_audio(fmt):
+    return fmt.get('acodec') != 'none'
+
+
+def _height_ok(fmt, max_height):
+    height = fmt.get('height')
+    return height is not None and height <= max_height
+
+
+class VideoInfo:
+    """Video metadata built from one yt-dlp info dict.
+
+    yt-dlp returns `formats` sorted from worst to best using its default
+    format sort, so "best" within any filtered subset is simply the last
+    matching entry.
+    """
+
+    def __init__(self, info):
+        if not isinstance(info, dict):
+            raise ValueError("Invalid video info: expected dict")
+
+        self.info = info
+        self.video_id = info.get('id')
+        self.title = info.get('title') or ''
+        self.formats = [f for f in (info.get('formats') or []) if isinstance(f, dict)]
+
+        duration = info.get('duration')
+        if duration is None:
+            raise ValueError("Video info has no duration (live stream?)")
+        try:
+            self.duration = int(float(duration))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Invalid duration value: {duration}")
+
+    @classmethod
+    def from_json(cls, text):
+        """Build VideoInfo from yt-dlp --dump-json output.
+
+        Args:
+            text: stdout of yt-dlp (first non-empty line is used)
+
+        Returns:
+            VideoInfo: Parsed video info
+        """
+        for line in text.splitlines():
+            line = line.strip()
+            if line:
+                return cls(json.loads(line))
+        raise ValueError("Empty yt-dlp JSON output")
+
+    @staticmethod
+    def format_filesize(fmt, duration=None):
+        """Return exact or approximate size of a single format in bytes, or None."""
+        size = fmt.get('filesize') or fmt.get('filesize_approx')
+        if size:
+            return int(size)
+        # Fall back to bitrate (kbit/s) * duration, same as yt-dlp's approximation
+        tbr = fmt.get('tbr')
+        if tbr and duration:
+            return int(tbr * 1000 / 8 * duration)
+        return None
+
+    def select_formats(self, quality):
+        """Select formats yt-dlp would pick for the given quality.
+
+        Mirrors 'bestvideo[height<=N]+bestaudio/best[height<=N]' for video
+        qualities and 'bestaudio' for audio-only.
+
+        Args:
+            quality: Video height as string/int, or a value starting with "none" for audio only
+
+        Returns:
+            list: Selected format dicts (empty if nothing matches)
+        """
+        audio_only = [f for f in self.formats if _has_audio(f) and not _has_video(f)]
+
+        if str(quality).startswith("none"):
+            return audio_only[-1:]
+
+        try:
+            max_height = int(quality)
+        except (TypeError, ValueError):
+            return []
+
+        video_only = [f for f in self.formats
+                      if _has_video(f) and not _has_audio(f) and _height_ok(f, max_height)]
+        if video_only and audio_only:
+            return [video_only[-1], audio_only[-1]]
+
+        combined = [f for f in self.formats
+                    if _has_video(f) and _has_audio(f) and _height_ok(f, max_height)]
+        return combined[-1:]
+
+    def estimate_filesize(self, quality):
+        """Estimate download size in bytes for the given quality, or None if unknown."""
+        selected = self.select_formats(quality)
+        if not selected:
+            return None
+
+        total = 0
+        for fmt in selected:
+            size = self.format_filesize(fmt, self.duration)
+            if not size:
+                return None
+            total += size
+        return total
+
+    def size_table(self, qualities):
+        """Estimate download sizes for several qualities from the one formats list.
+
+        Args:
+            qualities: Iterable of quality values (heights, or "none" for audio only)
+
+        Returns:
+            dict: {quality: size in bytes or None}
+        """
+        return {quality: self.estimate_filesize(quality) for quality in qualities}
+
+    def preview_stream_url(self, max_height=PREVIEW_MAX_HEIGHT):
+        """Return a direct combined (video+audio) stream URL for frame extraction.
+
+        Mirrors 'best[height<=480]/best'; combined formats avoid segmented streams.
+        """
+        combined = [f for f in self.formats if _has_video(f) and _has_audio(f) and f.get('url')]
+        preferred = [f for f in combined if _height_ok(f, max_height)]
+        chosen = (preferred or combined)[-1:]
+        if not chosen:
+            return None
+        url = chosen[0]['url']
+        if not (url.startswith('http://') or url.startswith('https://')):
+            return None
+        return url
+
+
+def extract_video_id(url):
+    """Extract the canonical YouTube video ID from a URL.
+
+    Supports watch?v=, youtu.be/, /shorts/, /embed/, /v/ and /live/ links.
+
+    Args:
+        url: YouTube URL
+
+    Returns:
+        str: Video ID, or None if the URL does not point at a single video
+    """
+    try:
+        parsed = urlparse(url.strip())
+    except (AttributeError, ValueError):
+        return None
+
+    netloc = parsed.netloc.lower()
+    path_parts = [part for part in parsed.path.split('/') if part]
+
+    if netloc in ('youtu.be', 'www.youtu.be'):
+        video_id = path_parts[0] if path_parts else None
+    elif netloc.endswith('youtube.com'):
+        if parsed.path.startswith('/watch'):
+            video_id = parse_qs(parsed.query).get('v', [None])[0]
+        elif len(path_parts) >= 2 and path_parts[0] in ('shorts', 'embed', 'v', 'live'):
+            video_id = path_parts[1]
+        else:
+            video_id = None
+    else:
+        video_id = None
+
+    if video_id and VIDEO_ID_REGEX.match(video_id):
+        return video_id
+    return None
+
+
+def extract_playlist_id(url):
+    """Extract the YouTube playlist ID (the list= parameter) from a URL.
+
+    Args:
+        url: YouTube URL
+
+    Returns:
+        str: Playlist ID, or None if the URL has none
+    """
+    try:
+        parsed = urlparse(url.strip())
+    except (AttributeError, ValueError):
+        return None
+    playlist_id = parse_qs(parsed.query).get('list', [None])[0]
+    return playlist_id or None
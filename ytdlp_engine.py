@@ -0,0 +1,750 @@
+"""YoutubeDownloader yt-dlp Engine Module
+
+Runs yt-dlp either in-process through the `yt_dlp.YoutubeDL` Python API or,
+as a fallback (frozen PyInstaller build, module not installed), through the
+yt-dlp executable in a subprocess.
+
+Both backends report progress as structured event dicts:
+- {'status': 'downloading', 'percent', 'downloaded_bytes', 'total_bytes',
+   'speed', 'eta', 'speed_str', 'eta_str', 'fragment_index', 'fragment_count',
+   'phase', 'playlist_index', 'playlist_count'}
+- {'status': 'playlist_item', 'playlist_index', 'playlist_count'}
+- {'status': 'preparing'}  (extracting info / selecting formats)
+- {'status': 'starting', 'filename'}  (destination chosen, transfer begins)
+- {'status': 'already_downloaded', 'filename'}
+- {'status': 'postprocessing', 'postprocessor', 'filename'}  (filename of the
+   file the postprocessor writes, e.g. the merged MP4, or None)
+- {'status': 'phase', 'phase'}  ('video' or 'audio')
+- {'status': 'finished', 'filename'}
+- {'status': 'log', 'level', 'message'}  (errors and warnings only)
+
+The in-process backend gets them from progress hooks; the subprocess backend
+asks yt-dlp for one machine-readable line per progress update
+(--progress-template) with the same fields, so byte counts are exact and
+progress lines skip all console scraping.
+
+Both run handles also take a new download rate while running
+(set_rate_limit), for the global bandwidth budget.
+"""
+import json
+import logging
+import math
+import os
+import queue
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+
+from constants import (
+    METADATA_FETCH_TIMEOUT, STREAM_FETCH_TIMEOUT, PLAYLIST_FETCH_TIMEOUT, PLAYLIST_MAX_REDIRECTS,
+    BANDWIDTH_RESTART_MIN_CHANGE,
+)
+
+# Try to import yt-dlp as a module for the in-process backend
+try:
+    import yt_dlp
+    YTDLP_MODULE_AVAILABLE = True
+except ImportError:
+    YTDLP_MODULE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Machine-readable progress lines of the subprocess backend: prefix, then '|'-separated
+# progress fields and info fields ('NA' when yt-dlp doesn't know a value)
+PROGRESS_TEMPLATE_PREFIX = '[ytdl-progress]'
+PROGRESS_TEMPLATE_FIELDS = ('downloaded_bytes', 'total_bytes', 'total_bytes_estimate', 'speed', 'eta',
+                            'fragment_index', 'fragment_count')
+PROGRESS_TEMPLATE_INFO_FIELDS = ('playlist_index', 'n_entries', 'vcodec')
+PROGRESS_TEMPLATE = 'download:' + PROGRESS_TEMPLATE_PREFIX + '|'.join(
+    [f'%(progress.{field})s' for field in PROGRESS_TEMPLATE_FIELDS] +
+    [f'%(info.{field})s' for field in PROGRESS_TEMPLATE_INFO_FIELDS])
+
+# Compiled regex patterns for scraping yt-dlp console output (subprocess backend, lines
+# not covered by the progress template)
+PROGRESS_REGEX = re.compile(r'(\d+\.?\d*)%')
+SPEED_REGEX = re.compile(r'(\d+\.?\d*\s*[KMG]iB/s)')
+ETA_REGEX = re.compile(r'ETA\s+(\d{2}:\d{2}(?::\d{2})?)')
+PLAYLIST_ITEM_REGEX = re.compile(r'downloading (?:item|video) (\d+) of (\d+)')
+# Files named in console lines: "Destination: <path>", 'Merging formats into "<path>"',
+# "[download] <path> has already been downloaded"
+OUTPUT_FILE_REGEX = re.compile(r'(?:Destination: (.+)|into "(.+)")$')
+ALREADY_DOWNLOADED_REGEX = re.compile(r'^\[download\] (.+) has already been downloaded')
+
+# Console prefixes of yt-dlp postprocessors mapped to their names
+POSTPROCESSOR_PREFIXES = {
+    '[Merger]': 'Merger',
+    '[ExtractAudio]': 'ExtractAudio',
+    '[ffmpeg]': 'FFmpeg',
+    '[VideoConvertor]': 'VideoConvertor',
+    '[FixupM3u8]': 'FixupM3u8',
+}
+
+# Events telling whether a subprocess run is transferring (safe to restart) or past it
+TRANSFER_STATUSES = {
+    'starting': True,
+    'downloading': True,
+    'postprocessing': False,
+    'finished': False,
+    'already_downloaded': False,
+}
+
+
+class YtDlpError(subprocess.CalledProcessError):
+    """yt-dlp failed (raised by both backends so retry logic treats them alike)."""
+
+    def __str__(self):
+        return f"yt-dlp failed: {self.stderr or self.returncode}"
+
+
+def format_speed(speed):
+    """Format bytes/second like yt-dlp (e.g. '1.23MiB/s'), or None."""
+    if not speed:
+        return None
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if speed < 1024 or unit == 'GiB':
+            return f"{speed:.2f}{unit}/s"
+        speed /= 1024
+
+
+def format_eta(eta):
+    """Format seconds as MM:SS or HH:MM:SS, or None."""
+    if eta is None:
+        return None
+    eta = int(eta)
+    hours, rest = divmod(eta, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def _template_number(value):
+    """Parse a numeric progress template field ('NA'/'None' when unknown)."""
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def parse_progress_template_line(line):
+    """Turn one PROGRESS_TEMPLATE line into a 'downloading' event, or None if it isn't one."""
+    if not line.startswith(PROGRESS_TEMPLATE_PREFIX):
+        return None
+    values = line[len(PROGRESS_TEMPLATE_PREFIX):].rstrip('\r\n').split(
+        '|', len(PROGRESS_TEMPLATE_FIELDS) + len(PROGRESS_TEMPLATE_INFO_FIELDS) - 1)
+    if len(values) != len(PROGRESS_TEMPLATE_FIELDS) + len(PROGRESS_TEMPLATE_INFO_FIELDS):
+        return None
+
+    hook = {'status': 'downloading', 'info_dict': {}}
+    for field, value in zip(PROGRESS_TEMPLATE_FIELDS, values):
+        number = _template_number(value)
+        hook[field] = number if field == 'speed' or number is None else int(number)
+    playlist_index, n_entries, vcodec = values[len(PROGRESS_TEMPLATE_FIELDS):]
+    for field, value in (('playlist_index', playlist_index), ('n_entries', n_entries)):
+        number = _template_number(value)
+        hook['info_dict'][field] = None if number is None else int(number)
+    if vcodec not in ('NA', 'None'):
+        hook['info_dict']['vcodec'] = vcodec
+    return progress_event_from_hook(hook)
+
+
+def _output_file(line):
+    """Return the file a yt-dlp console line says it writes, or None."""
+    match = OUTPUT_FILE_REGEX.search(line)
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def parse_output_line(line):
+    """Turn one line of yt-dlp console output into an event dict, or None.
+
+    Progress template lines are checked first, so the bulk of the output
+    costs one prefix test and a split.
+
+    Args:
+        line: Raw output line from yt-dlp (--newline mode)
+
+    Returns:
+        dict: Event dict (see module docstring), or None for irrelevant lines
+    """
+    if line.startswith(PROGRESS_TEMPLATE_PREFIX):
+        return parse_progress_template_line(line)
+
+    stripped = line.strip()
+    if not stripped:
+        return None
+
+    if 'ERROR' in stripped:
+        return {'status': 'log', 'level': 'error', 'message': stripped}
+    if stripped.startswith('WARNING'):
+        return {'status': 'log', 'level': 'warning', 'message': stripped}
+
+    lower = stripped.lower()
+
+    item_match = PLAYLIST_ITEM_REGEX.search(lower)
+    if item_match:
+        return {'status': 'playlist_item',
+                'playlist_index': int(item_match.group(1)),
+                'playlist_count': int(item_match.group(2))}
+
+    if '[download]' in stripped:
+        if 'has already been downloaded' in stripped:
+            file_match = ALREADY_DOWNLOADED_REGEX.match(stripped)
+            return {'status': 'already_downloaded', 'filename': file_match.group(1) if file_match else None}
+        if 'Destination' in stripped:
+            return {'status': 'starting', 'filename': _output_file(stripped)}
+        progress_match = PROGRESS_REGEX.search(stripped)
+        if progress_match:
+            speed_match = SPEED_REGEX.search(stripped)
+            eta_match = ETA_REGEX.search(stripped)
+            return {
+                'status': 'downloading',
+                'percent': float(progress_match.group(1)),
+                'downloaded_bytes': None,
+                'total_bytes': None,
+                'speed': None,
+                'eta': None,
+                'speed_str': speed_match.group(1) if speed_match else None,
+                'eta_str': eta_match.group(1) if eta_match else None,
+                'fragment_index': None,
+                'fragment_count': None,
+                'phase': None,
+                'playlist_index': None,
+                'playlist_count': None,
+            }
+        return None
+
+    for prefix, name in POSTPROCESSOR_PREFIXES.items():
+        if stripped.startswith(prefix):
+            return {'status': 'postprocessing', 'postprocessor': name, 'filename': _output_file(stripped)}
+    if 'Post-processing' in stripped or 'Postprocessing' in stripped:
+        return {'status': 'postprocessing', 'postprocessor': None, 'filename': None}
+
+    if stripped.startswith('[info]') and 'Downloading' in stripped:
+        return {'status': 'preparing'}
+
+    if 'downloading video' in lower:
+        return {'status': 'phase', 'phase': 'video'}
+    if 'downloading audio' in lower:
+        return {'status': 'phase', 'phase': 'audio'}
+
+    return None
+
+
+def progress_event_from_hook(hook):
+    """Convert a yt-dlp progress hook dict into a 'downloading'/'finished' event."""
+    status = hook.get('status')
+    info = hook.get('info_dict') or {}
+
+    if status == 'finished':
+        return {'status': 'finished', 'filename': hook.get('filename')}
+    if status != 'downloading':
+        return None
+
+    downloaded = hook.get('downloaded_bytes')
+    total = hook.get('total_bytes') or hook.get('total_bytes_estimate')
+    percent = None
+    if downloaded is not None and total:
+        percent = min(100.0, downloaded * 100.0 / total)
+    elif hook.get('fragment_index') and hook.get('fragment_count'):
+        percent = min(100.0, hook['fragment_index'] * 100.0 / hook['fragment_count'])
+
+    vcodec = info.get('vcodec')
+    phase = None
+    if vcodec == 'none':
+        phase = 'audio'
+    elif vcodec:
+        phase = 'video'
+
+    return {
+        'status': 'downloading',
+        'percent': percent,
+        'downloaded_bytes': downloaded,
+        'total_bytes': total,
+        'speed': hook.get('speed'),
+        'eta': hook.get('eta'),
+        'speed_str': format_speed(hook.get('speed')),
+        'eta_str': format_eta(hook.get('eta')),
+        'fragment_index': hook.get('fragment_index'),
+        'fragment_count': hook.get('fragment_count'),
+        'phase': phase,
+        'playlist_index': info.get('playlist_index'),
+        'playlist_count': info.get('n_entries') or info.get('playlist_count'),
+    }
+
+
+def with_rate_limit(args, rate):
+    """Return yt-dlp arguments with any --limit-rate replaced by rate (bytes/s, None removes it)."""
+    result = []
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in ('--limit-rate', '-r'):
+            skip = True
+        elif not arg.startswith('--limit-rate='):
+            result.append(arg)
+    if rate:
+        result.extend(['--limit-rate', str(int(rate))])
+    return result
+
+
+def with_progress_template(args):
+    """Return yt-dlp arguments that print PROGRESS_TEMPLATE lines (subprocess backend)."""
+    if '--progress-template' in args:
+        return list(args)
+    return ['--progress-template', PROGRESS_TEMPLATE] + list(args)
+
+
+def _remove_temp_file(path):
+    """Delete a temporary file, ignoring errors."""
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class SubprocessRun:
+    """Popen-compatible handle for a yt-dlp executable run.
+
+    The executable can't change its rate while running, so set_rate_limit()
+    restarts it with the new --limit-rate; yt-dlp resumes from its .part
+    files. Runs that can't resume (--download-sections) and runs already past
+    the transfer keep their rate.
+    """
+
+    def __init__(self, cmd, temp_file=None):
+        self.cmd = list(cmd)
+        self.temp_file = temp_file
+        self.stderr = None
+        self.stdin = None
+        self.resumable = '--download-sections' not in self.cmd
+        self._lock = threading.Lock()
+        self._restart = False
+        self._stopped = False
+        self._transferring = False
+        self._start()
+
+    def _start(self):
+        self.process = subprocess.Popen(self.cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                        universal_newlines=True, bufsize=1)
+        self.pid = self.process.pid
+        self.stdout = self.process.stdout
+
+    @property
+    def returncode(self):
+        return self.process.returncode
+
+    def events(self):
+        """Yield event dicts parsed from yt-dlp output until it exits (across rate restarts)."""
+        try:
+            while True:
+                for line in self.process.stdout:
+                    event = parse_output_line(line)
+                    if event:
+                        if event['status'] in TRANSFER_STATUSES:
+                            with self._lock:
+                                self._transferring = TRANSFER_STATUSES[event['status']]
+                        yield event
+                self.process.wait()
+                with self._lock:
+                    restart = self._restart and not self._stopped
+                    self._restart = False
+                    if restart:
+                        self._start()
+                if not restart:
+                    return
+        finally:
+            if self.process.poll() is not None:
+                _remove_temp_file(self.temp_file)
+
+    def set_rate_limit(self, rate):
+        """Restart yt-dlp with a new rate (bytes/s, None for unlimited) if it is worth it."""
+        with self._lock:
+            current = None
+            if '--limit-rate' in self.cmd:
+                current = int(self.cmd[self.cmd.index('--limit-rate') + 1])
+            if rate == current:
+                return
+            self.cmd = with_rate_limit(self.cmd, rate)
+            if not (self.resumable and self._transferring) or self._stopped or self._restart:
+                return  # New rate applies if the run restarts anyway
+            if current and rate and abs(rate - current) < current * BANDWIDTH_RESTART_MIN_CHANGE:
+                return
+            self._restart = True
+            self.process.terminate()
+        logger.info(f"Restarting yt-dlp at {rate or 'unlimited'} B/s")
+
+    def poll(self):
+        return self.process.poll()
+
+    def wait(self, timeout=None):
+        returncode = self.process.wait(timeout=timeout)
+        _remove_temp_file(self.temp_file)
+        return returncode
+
+    def terminate(self):
+        with self._lock:
+            self._stopped = True
+        self.process.terminate()
+
+    def kill(self):
+        with self._lock:
+            self._stopped = True
+        self.process.kill()
+
+
+class _EventLogger:
+    """yt-dlp logger that forwards console messages as events."""
+
+    def __init__(self, emit):
+        self.emit = emit
+
+    def debug(self, msg):
+        event = parse_output_line(msg)
+        # Progress comes from hooks; only keep phase/postprocessor/log events from text
+        if event and event['status'] != 'downloading':
+            self.emit(event)
+
+    def info(self, msg):
+        self.debug(msg)
+
+    def warning(self, msg):
+        self.emit({'status': 'log', 'level': 'warning', 'message': msg})
+
+    def error(self, msg):
+        self.emit({'status': 'log', 'level': 'error', 'message': msg})
+
+
+class InProcessRun:
+    """Popen-compatible handle for a yt-dlp run on a background thread.
+
+    Cancellation is cooperative: terminate()/kill() make the next progress
+    hook raise DownloadCancelled. set_rate_limit() updates the 'ratelimit'
+    option of the running YoutubeDL, which its downloaders read while
+    transferring.
+    """
+
+    def __init__(self, args, temp_file=None):
+        self.args = list(args)
+        self.temp_file = temp_file
+        self._ydl = None
+        self._rate_limit = None
+        self._rate_limit_set = False
+        self.pid = os.getpid()
+        self.stdout = None
+        self.stderr = None
+        self.stdin = None
+        self.returncode = None
+        self._events = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ytdlp_inprocess", daemon=True)
+        self._thread.start()
+
+    def _emit(self, event):
+        self._events.put(event)
+
+    def _progress_hook(self, hook):
+        if self._cancelled.is_set():
+            raise yt_dlp.utils.DownloadCancelled("Download cancelled by user")
+        event = progress_event_from_hook(hook)
+        if event:
+            self._emit(event)
+
+    def _postprocessor_hook(self, hook):
+        if hook.get('status') == 'started':
+            self._emit({'status': 'postprocessing', 'postprocessor': hook.get('postprocessor'), 'filename': None})
+
+    def _run(self):
+        returncode = 1
+        try:
+            parsed = yt_dlp.parse_options(self.args)
+            opts = dict(parsed.ydl_opts)
+            opts.update({
+                'logger': _EventLogger(self._emit),
+                'noprogress': True,
+                'progress_hooks': [self._progress_hook],
+                'postprocessor_hooks': [self._postprocessor_hook],
+            })
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                self._ydl = ydl
+                if self._rate_limit_set:
+                    ydl.params['ratelimit'] = self._rate_limit
+                load_info = parsed.options.load_info_filename
+                if load_info:
+                    returncode = ydl.download_with_info_file(load_info)
+                else:
+                    returncode = ydl.download(parsed.urls)
+        except yt_dlp.utils.DownloadCancelled:
+            logger.info("In-process yt-dlp run cancelled")
+        except SystemExit as e:
+            # parse_options exits on invalid arguments
+            self._emit({'status': 'log', 'level': 'error', 'message': f"ERROR: invalid yt-dlp options ({e})"})
+        except Exception as e:
+            self._emit({'status': 'log', 'level': 'error', 'message': f"ERROR: {e}"})
+        finally:
+            _remove_temp_file(self.temp_file)
+            if self.returncode is None:
+                self.returncode = returncode
+            self._events.put(None)
+
+    def events(self):
+        """Yield event dicts from hooks until the run finishes."""
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            yield event
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if self._cancelled.is_set() and timeout is None:
+            # Killed: a running postprocessor can't be interrupted, don't block on it
+            self._thread.join(0)
+        else:
+            self._thread.join(timeout)
+        if self._thread.is_alive():
+            if self._cancelled.is_set() and timeout is None:
+                if self.returncode is None:
+                    self.returncode = -9
+                return self.returncode
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def set_rate_limit(self, rate):
+        """Change the download rate (bytes/s, None for unlimited) of the running download."""
+        self.args = with_rate_limit(self.args, rate)
+        self._rate_limit = rate
+        self._rate_limit_set = True
+        ydl = self._ydl
+        if ydl is not None:
+            ydl.params['ratelimit'] = rate
+
+    def terminate(self):
+        self._cancelled.set()
+
+    def kill(self):
+        self._cancelled.set()
+
+
+class YtDlpEngine:
+    """Entry point for all yt-dlp work: metadata, stream URLs and downloads."""
+
+    def __init__(self, ytdlp_path, prefer_in_process=True):
+        self.ytdlp_path = ytdlp_path
+        frozen = getattr(sys, 'frozen', False)
+        self.in_process = prefer_in_process and YTDLP_MODULE_AVAILABLE and not frozen
+        logger.info(f"yt-dlp backend: {'in-process' if self.in_process else 'subprocess'}")
+
+    def _extract_in_process(self, url, opts):
+        base_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+            'logger': _EventLogger(lambda event: None),
+        }
+        base_opts.update(opts)
+        try:
+            with yt_dlp.YoutubeDL(base_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+                return ydl.sanitize_info(info)
+        except yt_dlp.utils.DownloadError as e:
+            raise YtDlpError(1, ['yt_dlp', url], stderr=str(e))
+
+    def _run_subprocess(self, args, timeout, process_hook=None):
+        """Run the yt-dlp executable and return its stdout.
+
+        Args:
+            args: yt-dlp arguments
+            timeout: Seconds before the process is killed
+            process_hook: Optional callable(process, running) told when the process starts and ends,
+                so callers can kill it early
+        """
+        cmd = [self.ytdlp_path] + args
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if process_hook:
+            process_hook(process, True)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        finally:
+            if process_hook:
+                process_hook(process, False)
+        if process.returncode != 0:
+            raise YtDlpError(process.returncode, cmd, output=stdout, stderr=stderr)
+        return stdout
+
+    def extract_info(self, url, no_playlist=True, timeout=METADATA_FETCH_TIMEOUT):
+        """Return the yt-dlp info dict for a URL.
+
+        Raises:
+            YtDlpError: If extraction fails
+            subprocess.TimeoutExpired: If the subprocess backend times out
+        """
+        if self.in_process:
+            return self._extract_in_process(url, {'noplaylist': no_playlist, 'socket_timeout': timeout})
+
+        args = ['--dump-json']
+        if no_playlist:
+            args.append('--no-playlist')
+        stdout = self._run_subprocess(args + [url], timeout)
+        try:
+            return json.loads(stdout.strip().splitlines()[0])
+        except (IndexError, json.JSONDecodeError) as e:
+            raise YtDlpError(1, [self.ytdlp_path, url], stderr=f"Invalid yt-dlp JSON output: {e}")
+
+    def extract_flat_playlist(self, url, timeout=PLAYLIST_FETCH_TIMEOUT):
+        """Return the flat yt-dlp info dict of a playlist (like `--flat-playlist -J`).
+
+        Entries are only listed (id, title, duration), not resolved, so even
+        long playlists take a single request per page.
+
+        Raises:
+            YtDlpError: If extraction fails
+            subprocess.TimeoutExpired: If the subprocess backend times out
+        """
+        if self.in_process:
+            return self._extract_in_process(url, {'extract_flat': 'in_playlist', 'noplaylist': False,
+                                                  'socket_timeout': timeout})
+
+        stdout = self._run_subprocess(['--flat-playlist', '--dump-single-json', '--yes-playlist', url], timeout)
+        try:
+            return json.loads(stdout)
+        except json.JSONDecodeError as e:
+            raise YtDlpError(1, [self.ytdlp_path, url], stderr=f"Invalid yt-dlp JSON output: {e}")
+
+    def iter_flat_playlist(self, url, timeout=PLAYLIST_FETCH_TIMEOUT):
+        """Yield the flat entries of a playlist while it is being listed.
+
+        The listing is lazy: closing the generator early stops it, so only
+        the pages up to the last consumed entry are fetched.
+
+        Raises:
+            YtDlpError: If listing fails (or times out, for the subprocess backend)
+        """
+        if self.in_process:
+            opts = {
+                'quiet': True,
+                'no_warnings': True,
+                'skip_download': True,
+                'logger': _EventLogger(lambda event: None),
+                'extract_flat': 'in_playlist',
+                'lazy_playlist': True,
+                'noplaylist': False,
+                'socket_timeout': timeout,
+            }
+            try:
+                with yt_dlp.YoutubeDL(opts) as ydl:
+                    info = ydl.extract_info(url, download=False, process=False)
+                    # Unprocessed results are not resolved: a watch URL with a list= parameter
+                    # comes back as a url result pointing at the playlist, so follow those
+                    for _ in range(PLAYLIST_MAX_REDIRECTS):
+                        if info.get('_type') not in ('url', 'url_transparent'):
+                            break
+                        info = ydl.extract_info(info['url'], download=False, process=False,
+                                                ie_key=info.get('ie_key'))
+                    if info.get('_type') != 'playlist':
+                        raise YtDlpError(1, ['yt_dlp', url], stderr=f"Not a playlist: {url}")
+                    yield from info.get('entries') or []
+            except yt_dlp.utils.DownloadError as e:
+                raise YtDlpError(1, ['yt_dlp', url], stderr=str(e))
+            return
+
+        cmd = [self.ytdlp_path, '--flat-playlist', '--lazy-playlist', '--yes-playlist', '--dump-json', url]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        stderr_lines = []
+        stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        stderr_reader.start()
+        watchdog = threading.Timer(timeout, process.kill)
+        watchdog.start()
+        try:
+            for line in process.stdout:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.debug(f"Skipping non-JSON playlist line: {line[:100]}")
+            process.wait()
+            stderr_reader.join(timeout=1)
+            if process.returncode != 0:
+                raise YtDlpError(process.returncode, cmd, stderr=''.join(stderr_lines))
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+    def get_stream_url(self, url, format_selector, timeout=STREAM_FETCH_TIMEOUT, process_hook=None):
+        """Resolve the direct media URL for a format selector (like `yt-dlp -g`).
+
+        process_hook is passed the yt-dlp process of the subprocess backend
+        (see _run_subprocess); in-process extraction can't be killed.
+        """
+        if self.in_process:
+            info = self._extract_in_process(url, {'format': format_selector, 'noplaylist': True,
+                                                  'socket_timeout': timeout})
+            requested = info.get('requested_formats') or [info]
+            stream_url = requested[0].get('url', '')
+        else:
+            stdout = self._run_subprocess(['-f', format_selector, '--no-playlist', '-g', url], timeout,
+                                          process_hook=process_hook)
+            stream_url = stdout.strip().split('\n')[0]
+
+        if not (stream_url.startswith('http://') or stream_url.startswith('https://')):
+            raise YtDlpError(1, [self.ytdlp_path, url], stderr=f"Invalid stream URL: {stream_url[:100]}")
+        return stream_url
+
+    def start(self, cmd, url=None, info=None, rate_limit=None):
+        """Start a download described by a yt-dlp command line.
+
+        When an already extracted info dict is given (e.g. from the metadata
+        cache), it is written to a temporary file and `url` in the command is
+        replaced by `--load-info-json`, so yt-dlp skips extraction. yt-dlp
+        re-extracts from the info's webpage_url by itself if the cached stream
+        URLs turn out to be unusable.
+
+        Args:
+            cmd: Full yt-dlp command (cmd[0] is the executable, ignored in-process)
+            url: URL argument in cmd to replace when info is given
+            info: Optional yt-dlp info dict for url
+            rate_limit: Optional download rate in bytes/s, replacing any --limit-rate in cmd
+
+        Returns:
+            InProcessRun or SubprocessRun: Popen-compatible handle with events()
+        """
+        args = list(cmd[1:])
+        if rate_limit is not None:
+            args = with_rate_limit(args, rate_limit)
+        temp_file = None
+        if info is not None and url in args:
+            temp_file = self._write_info_json(info)
+            if temp_file:
+                index = len(args) - 1 - args[::-1].index(url)
+                args[index:index + 1] = ['--load-info-json', temp_file]
+
+        if self.in_process:
+            return InProcessRun(args, temp_file=temp_file)
+        return SubprocessRun([self.ytdlp_path] + with_progress_template(args), temp_file=temp_file)
+
+    @staticmethod
+    def _write_info_json(info):
+        """Write info dict to a temporary .info.json file, returning its path or None."""
+        path = None
+        try:
+            fd, path = tempfile.mkstemp(prefix='ytdl_', suffix='.info.json')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(info, f)
+            return path
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write info JSON, falling back to extraction: {e}")
+            _remove_temp_file(path)
+            return None